@@ -1,10 +1,19 @@
 """Reddit adapters package for earthworm application."""
 
 from .base import RedditAdapterProtocol
-from .reddit_community import RedditCommunity
-from .reddit_official import RedditOfficial
+from .base_async import RedditAsyncAdapterProtocol
 from .config import RedditConfig
 from .factory import RedditAdapterFactory
+from .caching import CachingRedditAdapter
+from .models import (
+    RedditPost,
+    RedditComment,
+    SubredditInfo,
+    decode_posts,
+    posts_from_listing,
+    comments_from_list,
+    subreddit_info_from_dict
+)
 from .exceptions import (
     RedditAdapterError,
     AuthenticationError,
@@ -14,12 +23,37 @@ from .exceptions import (
 
 __version__ = "1.0.0"
 
+# Concrete adapters pull in praw/requests/aiohttp, so they are imported on first access (PEP 562)
+_LAZY_ADAPTERS = {
+    "RedditCommunity": ".reddit_community",
+    "RedditOfficial": ".reddit_official",
+    "RedditAsync": ".reddit_async",
+}
+
+def __getattr__(name):
+    if name in _LAZY_ADAPTERS:
+        from importlib import import_module
+        value = getattr(import_module(_LAZY_ADAPTERS[name], __name__), name)
+        globals()[name] = value  # Cache so later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     "RedditAdapterProtocol",
+    "RedditAsyncAdapterProtocol",
     "RedditCommunity", 
     "RedditOfficial",
+    "RedditAsync",
     "RedditConfig",
     "RedditAdapterFactory",
+    "CachingRedditAdapter",
+    "RedditPost",
+    "RedditComment",
+    "SubredditInfo",
+    "decode_posts",
+    "posts_from_listing",
+    "comments_from_list",
+    "subreddit_info_from_dict",
     "RedditAdapterError",
     "AuthenticationError",
     "APIError",
@@ -0,0 +1,69 @@
+from typing import Dict, Any, Optional, List, Iterable, AsyncIterator, Protocol, runtime_checkable
+
+@runtime_checkable
+class RedditAsyncAdapterProtocol(Protocol):
+    """Protocol/Interface for asyncio-based Reddit adapters."""
+
+    async def authenticate(self) -> bool:
+        """Authenticate with the Reddit API."""
+        ...
+
+    async def get_user_info(self, username: str) -> Optional[Dict[str, Any]]:
+        """Get user information."""
+        ...
+
+    async def get_user_infos(self, usernames: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get information for many users at once, keyed by username."""
+        ...
+
+    async def get_subreddit_posts(self, subreddit: str, sort: str = "hot", limit: int = 25) -> Optional[Dict[str, Any]]:
+        """Get posts from a subreddit."""
+        ...
+
+    async def get_subreddit_info(self, subreddit: str) -> Optional[Dict[str, Any]]:
+        """Get subreddit information and metadata."""
+        ...
+
+    async def get_post_details(self, post_id: str) -> Optional[Dict[str, Any]]:
+        """Get detailed information about a specific post."""
+        ...
+
+    async def get_comments(self, post_id: str, limit: int = 100) -> Optional[List[Dict[str, Any]]]:
+        """Get comments for a specific post."""
+        ...
+
+    async def search_posts(self, query: str, subreddit: Optional[str] = None,
+                          sort: str = "relevance", time_filter: str = "all",
+                          limit: int = 25) -> Optional[Dict[str, Any]]:
+        """Search for posts across Reddit or within a specific subreddit."""
+        ...
+
+    async def get_user_posts(self, username: str, sort: str = "new",
+                            limit: int = 25) -> Optional[Dict[str, Any]]:
+        """Get posts submitted by a specific user."""
+        ...
+
+    async def get_user_comments(self, username: str, sort: str = "new",
+                               limit: int = 25) -> Optional[Dict[str, Any]]:
+        """Get comments made by a specific user."""
+        ...
+
+    def iter_subreddit_posts(self, subreddit: str, sort: str = "hot",
+                             limit: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Lazily iterate over a subreddit's posts across pages."""
+        ...
+
+    def iter_search_posts(self, query: str, subreddit: Optional[str] = None,
+                          sort: str = "relevance", time_filter: str = "all",
+                          limit: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Lazily iterate over search results across pages."""
+        ...
+
+    def iter_user_posts(self, username: str, sort: str = "new",
+                        limit: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Lazily iterate over a user's submissions across pages."""
+        ...
+
+    async def close(self) -> None:
+        """Release any network resources held by the adapter."""
+        ...
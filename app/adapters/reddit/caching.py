@@ -0,0 +1,278 @@
+# Reddit Caching Adapter
+# This module wraps any Reddit adapter with a TTL cache so repeated reads of the same user,
+# subreddit or post are served from memory (or a shared Redis) instead of another round-trip to Reddit.
+
+import hashlib
+import heapq
+import threading
+import time
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple, Callable, Iterable, Iterator, Protocol
+from .base import RedditAdapterProtocol
+from .singleflight import SingleFlight
+from .jsonutil import loads as _loads, dumps as _dumps, dumps_sorted as _dumps_sorted
+
+logger = logging.getLogger(__name__)
+
+class CacheBackend(Protocol):
+    """Storage interface for cached responses (values are serialized bytes)."""
+
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    def setex(self, key: str, ttl: float, value: bytes) -> None:
+        ...
+
+    def delete(self, key: str) -> None:
+        ...
+
+    def delete_prefix(self, prefix: str) -> None:
+        ...
+
+class InMemoryBackend:
+    """Per-process LRU backend with per-entry TTLs; expired entries are purged via a heap."""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize: int = maxsize
+        self._data: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def _purge_expired(self, now: float) -> None:
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._data.get(key)
+            # Only drop the entry if it wasn't refreshed after this heap record was pushed
+            if entry is not None and entry[0] == expires_at:
+                del self._data[key]
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.monotonic()
+        with self._lock:
+            self._purge_expired(now)
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def setex(self, key: str, ttl: float, value: bytes) -> None:
+        expires_at = time.monotonic() + ttl
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+            # Keep the heap from growing unbounded with stale records
+            if len(self._expiry_heap) > 2 * self.maxsize:
+                self._expiry_heap = [(exp, k) for k, (exp, _) in self._data.items()]
+                heapq.heapify(self._expiry_heap)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [k for k in self._data if k.startswith(prefix)]:
+                del self._data[key]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+class RedisBackend:
+    """Redis backend so multiple worker processes share one cache."""
+
+    def __init__(self, url: str = "redis://localhost:6379/0", max_connections: int = 16):
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError("RedisBackend requires the 'redis' package (pip install redis)") from e
+
+        pool = redis.BlockingConnectionPool.from_url(url, max_connections=max_connections)
+        self._redis: Any = redis.Redis(connection_pool=pool)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._redis.get(key)
+
+    def setex(self, key: str, ttl: float, value: bytes) -> None:
+        self._redis.set(key, value, px=max(1, int(ttl * 1000)))
+
+    def delete(self, key: str) -> None:
+        self._redis.delete(key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        keys = list(self._redis.scan_iter(match=f"{prefix}*", count=500))
+        if keys:
+            self._redis.delete(*keys)
+
+class CachingRedditAdapter:
+    """Adapter decorator that caches idempotent lookups of the wrapped adapter."""
+
+    KEY_PREFIX: str = "reddit"
+
+    # "new" listings this small are usually polled for freshness, so they are never cached
+    FRESH_LISTING_LIMIT: int = 25
+
+    def __init__(self, inner: RedditAdapterProtocol, ttl_user: float = 900,
+                 ttl_subreddit: float = 3600, ttl_post: float = 300,
+                 ttl_listing: float = 60, ttl_negative: float = 5, maxsize: int = 4096,
+                 backend: Optional[CacheBackend] = None):
+        self._inner: RedditAdapterProtocol = inner
+        self.ttl_user: float = ttl_user
+        self.ttl_subreddit: float = ttl_subreddit
+        self.ttl_post: float = ttl_post
+        self.ttl_listing: float = ttl_listing
+        self.ttl_negative: float = ttl_negative  # Short TTL for None (e.g. 404) results
+        self._backend: CacheBackend = backend if backend is not None else InMemoryBackend(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()  # Concurrent misses on one key share a single fetch
+        self.hits: int = 0
+        self.misses: int = 0
+
+    # Attributes of the wrapper itself; assigning any other name configures the wrapped adapter
+    _OWN_ATTRS = frozenset({'_inner', 'ttl_user', 'ttl_subreddit', 'ttl_post', 'ttl_listing',
+                            'ttl_negative', '_backend', '_lock', '_flight', 'hits', 'misses'})
+
+    def __getattr__(self, name: str) -> Any:
+        # Forward adapter-specific helpers (stealth mode, stats, ...) to the wrapped adapter
+        if name == '_inner':
+            raise AttributeError(name)
+        return getattr(self._inner, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # e.g. ``adapter.request_delay = 2.0`` must reach the adapter doing the requests
+        if name in self._OWN_ATTRS:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._inner, name, value)
+
+    @classmethod
+    def _make_key(cls, method: str, kwargs: Dict[str, Any]) -> str:
+        params = _dumps_sorted(kwargs)
+        return f"{cls.KEY_PREFIX}:{method}:{hashlib.blake2b(params, digest_size=16).hexdigest()}"
+
+    def _cached(self, method: str, ttl: float, fetch: Callable[[], Any],
+                bypass_cache: bool = False, **kwargs: Any) -> Any:
+        """Return a cached result for ``method(**kwargs)`` or fetch and store it.
+
+        ``bypass_cache`` skips the lookup but still stores the fresh result.
+        """
+        key = self._make_key(method, kwargs)
+        raw = None if bypass_cache else self._backend.get(key)
+        if raw is not None:
+            with self._lock:
+                self.hits += 1
+            return _loads(raw)
+
+        with self._lock:
+            self.misses += 1
+
+        def load() -> Any:
+            value = fetch()
+            self._backend.setex(key, ttl if value is not None else self.ttl_negative, _dumps(value))
+            return value
+
+        return self._flight.do(key, load)
+
+    def invalidate(self, method: Optional[str] = None, **kwargs: Any) -> None:
+        """Drop cached entries for one call, every call of a method, or everything."""
+        if method is None:
+            self._backend.delete_prefix(f"{self.KEY_PREFIX}:")
+        elif kwargs:
+            self._backend.delete(self._make_key(method, kwargs))
+        else:
+            self._backend.delete_prefix(f"{self.KEY_PREFIX}:{method}:")
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss counters for monitoring."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'inflight': len(self._flight),
+            'backend': type(self._backend).__name__,
+        }
+
+    def authenticate(self) -> bool:
+        return self._inner.authenticate()
+
+    def close(self) -> None:
+        self._inner.close()
+
+    def get_user_info(self, username: str, bypass_cache: bool = False) -> Optional[Dict[str, Any]]:
+        return self._cached('get_user_info', self.ttl_user,
+                            lambda: self._inner.get_user_info(username),
+                            bypass_cache, username=username)
+
+    def get_user_infos(self, usernames: Iterable[str],
+                       max_workers: int = 32) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get many users at once: cached users are answered directly, misses fan out to a thread pool."""
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        misses: List[str] = []
+        for username in dict.fromkeys(usernames):
+            raw = self._backend.get(self._make_key('get_user_info', {'username': username}))
+            if raw is not None:
+                results[username] = _loads(raw)
+            else:
+                misses.append(username)
+
+        with self._lock:
+            self.hits += len(results)
+
+        if misses:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(misses))) as executor:
+                results.update(zip(misses, executor.map(self.get_user_info, misses)))
+        return results
+
+    def get_subreddit_info(self, subreddit: str, bypass_cache: bool = False) -> Optional[Dict[str, Any]]:
+        return self._cached('get_subreddit_info', self.ttl_subreddit,
+                            lambda: self._inner.get_subreddit_info(subreddit),
+                            bypass_cache, subreddit=subreddit)
+
+    def get_post_details(self, post_id: str, bypass_cache: bool = False) -> Optional[Dict[str, Any]]:
+        return self._cached('get_post_details', self.ttl_post,
+                            lambda: self._inner.get_post_details(post_id),
+                            bypass_cache, post_id=post_id)
+
+    def get_subreddit_posts(self, subreddit: str, sort: str = "hot", limit: Optional[int] = 25,
+                            bypass_cache: bool = False) -> Optional[Dict[str, Any]]:
+        fetch = lambda: self._inner.get_subreddit_posts(subreddit, sort=sort, limit=limit)
+        if sort == "new" and limit is not None and limit <= self.FRESH_LISTING_LIMIT:
+            return fetch()
+        return self._cached('get_subreddit_posts', self.ttl_listing, fetch,
+                            bypass_cache, subreddit=subreddit, sort=sort, limit=limit)
+
+    def get_comments(self, post_id: str, limit: int = 100) -> Optional[List[Dict[str, Any]]]:
+        return self._inner.get_comments(post_id, limit=limit)
+
+    def search_posts(self, query: str, subreddit: Optional[str] = None,
+                    sort: str = "relevance", time_filter: str = "all",
+                    limit: int = 25) -> Optional[Dict[str, Any]]:
+        return self._inner.search_posts(query, subreddit=subreddit, sort=sort,
+                                        time_filter=time_filter, limit=limit)
+
+    def get_user_posts(self, username: str, sort: str = "new",
+                      limit: int = 25) -> Optional[Dict[str, Any]]:
+        return self._inner.get_user_posts(username, sort=sort, limit=limit)
+
+    def get_user_comments(self, username: str, sort: str = "new",
+                         limit: int = 25) -> Optional[Dict[str, Any]]:
+        return self._inner.get_user_comments(username, sort=sort, limit=limit)
+
+    def iter_subreddit_posts(self, subreddit: str, sort: str = "hot",
+                             limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        return self._inner.iter_subreddit_posts(subreddit, sort=sort, limit=limit)
+
+    def iter_search_posts(self, query: str, subreddit: Optional[str] = None,
+                          sort: str = "relevance", time_filter: str = "all",
+                          limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        return self._inner.iter_search_posts(query, subreddit=subreddit, sort=sort,
+                                             time_filter=time_filter, limit=limit)
+
+    def iter_user_posts(self, username: str, sort: str = "new",
+                        limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        return self._inner.iter_user_posts(username, sort=sort, limit=limit)
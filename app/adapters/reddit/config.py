@@ -1,7 +1,8 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Optional, Mapping
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RedditConfig:
     """Configuration for Reddit adapters."""
     client_id: str
@@ -10,3 +11,13 @@ class RedditConfig:
     timeout: int = 30
     max_retries: int = 3
     rate_limit_delay: float = 1.0
+    cache_backend: Optional[str] = None  # "memory" (default) or "redis"
+    cache_url: Optional[str] = None  # e.g. redis://localhost:6379/0
+    http2: bool = False  # Multiplex scraper requests over HTTP/2 (requires httpx[http2])
+    http_cache: Optional[str] = None  # SQLite file caching official API GETs (requires requests-cache)
+    http_cache_ttl: float = 300.0  # Seconds a cached response is served before it is refetched
+    # Derived once so adapters don't rebuild the default headers per request
+    base_headers: Mapping[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'base_headers', MappingProxyType({'User-Agent': self.user_agent}))
@@ -10,6 +10,6 @@ class APIError(RedditAdapterError):
     """Raised when API requests fail."""
     pass
 
-class RateLimitError(RedditAdapterError):
-    """Raised when rate limit is exceeded."""
+class RateLimitError(APIError):
+    """Raised when rate limit is exceeded; getters let it through so callers can reschedule."""
     pass
@@ -1,33 +1,208 @@
-from typing import Union, Literal
+from typing import Union, Literal, Callable, Dict, List, Any, Optional
+import requests
+from threading import Lock
+from requests.adapters import HTTPAdapter
 from .base import RedditAdapterProtocol
-from .reddit_community import RedditCommunity
-from .reddit_official import RedditOfficial
+from .base_async import RedditAsyncAdapterProtocol
+from .caching import CachingRedditAdapter, CacheBackend, InMemoryBackend, RedisBackend
 from .config import RedditConfig
 from .exceptions import RedditAdapterError
 
-AdapterType = Literal["community", "official"]
+AdapterType = Union[Literal["community", "official"], str]
+AdapterConstructor = Callable[[RedditConfig], RedditAdapterProtocol]
+AsyncAdapterConstructor = Callable[[RedditConfig], RedditAsyncAdapterProtocol]
+
+# Hosts that adapters talk to; each gets a pooled keep-alive adapter mounted
+REDDIT_HOSTS = ("https://oauth.reddit.com", "https://www.reddit.com")
+# Keep-alive connections per host, sized for the adapters' concurrent fan-out helpers
+SESSION_POOL_SIZE = 32
 
 class RedditAdapterFactory:
-    """Factory for creating Reddit adapters."""
-    
+    """Factory for creating Reddit adapters from a name -> constructor registry."""
+
+    _REGISTRY: Dict[str, AdapterConstructor] = {}
+    _ASYNC_REGISTRY: Dict[str, AsyncAdapterConstructor] = {}
+    # Official adapters built from equal configs share a session, and so their PRAW client
+    _OFFICIAL_SESSIONS: Dict[RedditConfig, requests.Session] = {}
+    _OFFICIAL_SESSIONS_LOCK = Lock()
+
+    @staticmethod
+    def build_session(config: RedditConfig, session: Optional[requests.Session] = None) -> requests.Session:
+        """Build a shared HTTP session with connection pooling.
+
+        The session makes a single attempt per request: prawcore and the adapters already retry
+        transport errors and 5xx responses with their own backoff, and 429s need the adapters'
+        capped, fail-fast handling, so urllib3 retries would only multiply the attempts.
+        Pass ``session`` (e.g. a requests-cache session) to set up that one instead of a plain one.
+        """
+        if session is None:
+            session = requests.Session()
+        http_adapter = HTTPAdapter(
+            pool_connections=len(REDDIT_HOSTS),
+            pool_maxsize=SESSION_POOL_SIZE,
+            max_retries=0,
+        )
+        for host in REDDIT_HOSTS:
+            session.mount(host, http_adapter)
+        session.headers.update(config.base_headers)
+        return session
+
+    @classmethod
+    def official_session(cls, config: RedditConfig) -> requests.Session:
+        """The session shared by official adapters built from ``config``, created on first use.
+
+        RedditOfficial reuses an authenticated PRAW client across adapters on the same session
+        and credentials, so sharing the session is what lets factory-built adapters skip client
+        construction. Closing it from one adapter is harmless; connections reopen on next use.
+        """
+        with cls._OFFICIAL_SESSIONS_LOCK:
+            session = cls._OFFICIAL_SESSIONS.get(config)
+            if session is None:
+                from .reddit_official import RedditOfficial
+                # The on-disk HTTP cache is the session itself, so it is built before pooling is set up on it
+                cached = (RedditOfficial._build_http_cache(config.http_cache, config.http_cache_ttl)
+                          if config.http_cache else None)
+                session = cls._OFFICIAL_SESSIONS[config] = cls.build_session(config, cached)
+            return session
+
     @staticmethod
+    def build_http2_client(config: RedditConfig) -> Any:
+        """Build an HTTP/2 httpx client; concurrent requests are multiplexed over one connection."""
+        try:
+            import httpx
+        except ImportError:
+            raise RedditAdapterError("HTTP/2 transport requires httpx: pip install 'httpx[http2]'") from None
+        return httpx.Client(
+            http2=True,
+            timeout=config.timeout,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            headers=dict(config.base_headers),
+        )
+
+    @staticmethod
+    def install_uvloop() -> bool:
+        """Install uvloop as the asyncio event loop policy if available.
+
+        Call once at process startup, before any event loop is created for
+        ``create_async_adapter``. Returns whether uvloop was installed.
+        """
+        try:
+            import uvloop
+        except ImportError:
+            return False
+        uvloop.install()
+        return True
+
+    @staticmethod
+    def build_cache_backend(config: RedditConfig) -> CacheBackend:
+        """Select the response cache backend described by the config."""
+        backend = (config.cache_backend or "memory").lower()
+        if backend == "memory":
+            return InMemoryBackend()
+        elif backend == "redis":
+            return RedisBackend(config.cache_url or "redis://localhost:6379/0")
+        else:
+            raise RedditAdapterError(f"Unknown cache backend: {config.cache_backend}")
+
+    @classmethod
+    def register(cls, name: str, ctor: AdapterConstructor) -> None:
+        """Register a synchronous adapter constructor under ``name``."""
+        cls._REGISTRY[name] = ctor
+
+    @classmethod
+    def register_async(cls, name: str, ctor: AsyncAdapterConstructor) -> None:
+        """Register an asyncio adapter constructor under ``name``."""
+        cls._ASYNC_REGISTRY[name] = ctor
+
+    @classmethod
+    def available_adapters(cls) -> List[str]:
+        """List the registered synchronous adapter names."""
+        return list(cls._REGISTRY)
+
+    @classmethod
     def create_adapter(
+        cls,
         adapter_type: AdapterType,
-        config: RedditConfig
+        config: RedditConfig,
+        cache: bool = False
     ) -> RedditAdapterProtocol:
-        """Create a Reddit adapter instance."""
-        
-        if adapter_type == "community":
-            return RedditCommunity(
-                client_id=config.client_id,
-                client_secret=config.client_secret,
-                user_agent=config.user_agent
-            )
-        elif adapter_type == "official":
-            return RedditOfficial(
-                client_id=config.client_id,
-                client_secret=config.client_secret,
-                user_agent=config.user_agent
-            )
-        else:
-            raise RedditAdapterError(f"Unknown adapter type: {adapter_type}")
+        """Create a Reddit adapter instance.
+
+        With ``cache=True`` the adapter is wrapped in a TTL cache, unless it already caches its
+        own lookups (``caches_responses``); stacking a second cache would only compound TTLs.
+        """
+        try:
+            ctor = cls._REGISTRY[adapter_type]
+        except KeyError:
+            raise RedditAdapterError(f"Unknown adapter type: {adapter_type}") from None
+
+        adapter = ctor(config)
+        if not cache or getattr(adapter, 'caches_responses', False):
+            return adapter
+        return CachingRedditAdapter(adapter, backend=cls.build_cache_backend(config))
+
+    @classmethod
+    def create_async_adapter(
+        cls,
+        adapter_type: AdapterType,
+        config: RedditConfig
+    ) -> RedditAsyncAdapterProtocol:
+        """Create an asyncio Reddit adapter instance."""
+        try:
+            ctor = cls._ASYNC_REGISTRY[adapter_type]
+        except KeyError:
+            raise RedditAdapterError(f"Unknown adapter type: {adapter_type}") from None
+        return ctor(config)
+
+# Constructors import their adapter lazily so only the selected backend's dependencies load
+
+def _create_community(config: RedditConfig) -> RedditAdapterProtocol:
+    from .reddit_community import RedditCommunity
+    if config.http2:
+        session = RedditAdapterFactory.build_http2_client(config)
+    else:
+        session = RedditAdapterFactory.build_session(config)
+    return RedditCommunity(
+        client_id=config.client_id,
+        client_secret=config.client_secret,
+        user_agent=config.user_agent,
+        session=session,
+        timeout=config.timeout,
+        cache=RedditAdapterFactory.build_cache_backend(config)
+    )
+
+def _create_official(config: RedditConfig) -> RedditAdapterProtocol:
+    from .reddit_official import RedditOfficial
+    return RedditOfficial(
+        client_id=config.client_id,
+        client_secret=config.client_secret,
+        user_agent=config.user_agent,
+        session=RedditAdapterFactory.official_session(config),
+        timeout=config.timeout
+    )
+
+def _create_async_community(config: RedditConfig) -> RedditAsyncAdapterProtocol:
+    from .reddit_async import RedditAsync
+    # Public JSON endpoints only; credentials are deliberately not forwarded
+    return RedditAsync(
+        user_agent=config.user_agent,
+        base_headers=config.base_headers,
+        timeout=config.timeout,
+        max_retries=config.max_retries
+    )
+
+def _create_async_official(config: RedditConfig) -> RedditAsyncAdapterProtocol:
+    from .reddit_async import RedditAsync
+    return RedditAsync(
+        client_id=config.client_id,
+        client_secret=config.client_secret,
+        user_agent=config.user_agent,
+        base_headers=config.base_headers,
+        timeout=config.timeout,
+        max_retries=config.max_retries
+    )
+
+RedditAdapterFactory.register("community", _create_community)
+RedditAdapterFactory.register("official", _create_official)
+RedditAdapterFactory.register_async("community", _create_async_community)
+RedditAdapterFactory.register_async("official", _create_async_official)
@@ -0,0 +1,46 @@
+# JSON helpers shared by the adapters and the response cache.
+# Uses orjson when it is installed and falls back to the stdlib json module otherwise.
+
+import json
+from typing import Any, Union
+
+JSONDecodeError = json.JSONDecodeError  # orjson.JSONDecodeError subclasses this
+
+try:
+    import orjson
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Decode JSON from bytes or str."""
+        return orjson.loads(data)
+
+    def dumps(value: Any) -> bytes:
+        """Encode a value as JSON bytes."""
+        # Non-str keys are stringified, as the stdlib json module does
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    def dumps_sorted(value: Any) -> bytes:
+        """Encode a value as JSON bytes with sorted keys, for stable hashing."""
+        return orjson.dumps(value, default=str, option=orjson.OPT_SORT_KEYS)
+
+    # datetimes go through default=str so output matches the stdlib fallback
+    _PRETTY = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps_pretty(value: Any) -> bytes:
+        """Encode a value as indented, non-ASCII-escaped JSON bytes, for files meant to be read."""
+        return orjson.dumps(value, default=str, option=_PRETTY)
+except ImportError:
+    def loads(data: Union[bytes, str]) -> Any:
+        """Decode JSON from bytes or str."""
+        return json.loads(data)
+
+    def dumps(value: Any) -> bytes:
+        """Encode a value as JSON bytes."""
+        return json.dumps(value, default=str).encode('utf-8')
+
+    def dumps_sorted(value: Any) -> bytes:
+        """Encode a value as JSON bytes with sorted keys, for stable hashing."""
+        return json.dumps(value, default=str, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+    def dumps_pretty(value: Any) -> bytes:
+        """Encode a value as indented, non-ASCII-escaped JSON bytes, for files meant to be read."""
+        return json.dumps(value, indent=2, ensure_ascii=False, default=str).encode('utf-8')
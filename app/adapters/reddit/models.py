@@ -0,0 +1,154 @@
+# Typed Reddit Models
+# This module provides compact, typed views of Reddit posts, comments and subreddits for callers that
+# don't want to key into nested listing dicts. Uses msgspec when it is installed (JSON is decoded
+# straight into structs) and falls back to slotted dataclasses otherwise; both expose the same API.
+
+from dataclasses import dataclass, asdict, fields
+from typing import Dict, Any, List, Mapping, Optional, Type, TypeVar, Union
+from .jsonutil import loads as json_loads
+
+_T = TypeVar("_T")
+
+try:
+    import msgspec
+
+    # gc=False: these structs never hold reference cycles, so skip GC tracking
+    class RedditPost(msgspec.Struct, frozen=True, gc=False):
+        """A Reddit post (submission)."""
+        id: str
+        title: str
+        author: str = "[deleted]"
+        score: int = 0
+        num_comments: int = 0
+        url: str = ""
+        created_utc: float = 0.0
+
+        def to_dict(self) -> Dict[str, Any]:
+            """Plain-dict view for callers that expect the adapters' dict results."""
+            return msgspec.structs.asdict(self)
+
+    class RedditComment(msgspec.Struct, frozen=True, gc=False):
+        """A Reddit comment."""
+        id: str
+        body: str
+        author: str = "[deleted]"
+        score: int = 0
+        created_utc: float = 0.0
+        parent_id: Optional[str] = None
+        link_id: Optional[str] = None
+        subreddit: Optional[str] = None
+        depth: int = 0
+
+        def to_dict(self) -> Dict[str, Any]:
+            """Plain-dict view for callers that expect the adapters' dict results."""
+            return msgspec.structs.asdict(self)
+
+    class SubredditInfo(msgspec.Struct, frozen=True, gc=False):
+        """Subreddit metadata."""
+        display_name: str
+        title: str = ""
+        public_description: str = ""
+        subscribers: int = 0
+        active_user_count: Optional[int] = None
+        created_utc: float = 0.0
+        over18: bool = False
+        subreddit_type: str = "public"
+
+        def to_dict(self) -> Dict[str, Any]:
+            """Plain-dict view for callers that expect the adapters' dict results."""
+            return msgspec.structs.asdict(self)
+
+    class _ListingChild(msgspec.Struct):
+        data: RedditPost
+
+    class _ListingData(msgspec.Struct):
+        children: List[_ListingChild] = []
+
+    class _Listing(msgspec.Struct):
+        data: _ListingData
+
+    _listing_decoder = msgspec.json.Decoder(_Listing)
+
+    def _from_dict(cls: Type[_T], data: Mapping[str, Any]) -> _T:
+        # Validates and converts in C; keys the model doesn't declare are ignored
+        return msgspec.convert(data, cls)
+
+    def decode_posts(raw: Union[bytes, str]) -> List[RedditPost]:
+        """Decode a raw Reddit listing response body into posts."""
+        return [child.data for child in _listing_decoder.decode(raw).data.children]
+except ImportError:
+    @dataclass(frozen=True, slots=True)
+    class RedditPost:
+        """A Reddit post (submission)."""
+        id: str
+        title: str
+        author: str = "[deleted]"
+        score: int = 0
+        num_comments: int = 0
+        url: str = ""
+        created_utc: float = 0.0
+
+        def to_dict(self) -> Dict[str, Any]:
+            """Plain-dict view for callers that expect the adapters' dict results."""
+            return asdict(self)
+
+    @dataclass(frozen=True, slots=True)
+    class RedditComment:
+        """A Reddit comment."""
+        id: str
+        body: str
+        author: str = "[deleted]"
+        score: int = 0
+        created_utc: float = 0.0
+        parent_id: Optional[str] = None
+        link_id: Optional[str] = None
+        subreddit: Optional[str] = None
+        depth: int = 0
+
+        def to_dict(self) -> Dict[str, Any]:
+            """Plain-dict view for callers that expect the adapters' dict results."""
+            return asdict(self)
+
+    @dataclass(frozen=True, slots=True)
+    class SubredditInfo:
+        """Subreddit metadata."""
+        display_name: str
+        title: str = ""
+        public_description: str = ""
+        subscribers: int = 0
+        active_user_count: Optional[int] = None
+        created_utc: float = 0.0
+        over18: bool = False
+        subreddit_type: str = "public"
+
+        def to_dict(self) -> Dict[str, Any]:
+            """Plain-dict view for callers that expect the adapters' dict results."""
+            return asdict(self)
+
+    _FIELD_NAMES = {cls: tuple(f.name for f in fields(cls)) for cls in (RedditPost, RedditComment, SubredditInfo)}
+
+    def _from_dict(cls: Type[_T], data: Mapping[str, Any]) -> _T:
+        return cls(**{name: data[name] for name in _FIELD_NAMES[cls] if name in data})
+
+    def decode_posts(raw: Union[bytes, str]) -> List[RedditPost]:
+        """Decode a raw Reddit listing response body into posts."""
+        return posts_from_listing(json_loads(raw))
+
+def posts_from_listing(listing: Mapping[str, Any]) -> List[RedditPost]:
+    """Build posts from an adapter result.
+
+    Accepts both a raw Reddit listing (``{'data': {'children': [...]}}``, as returned by the
+    community and async adapters) and the official adapter's ``{'posts': [...]}`` shape.
+    """
+    if 'posts' in listing:
+        return [_from_dict(RedditPost, post) for post in listing['posts']]
+    children = listing.get('data', {}).get('children', [])
+    return [_from_dict(RedditPost, child['data']) for child in children if child.get('kind', 't3') == 't3']
+
+def comments_from_list(comments: List[Mapping[str, Any]]) -> List[RedditComment]:
+    """Build comments from a ``get_comments`` result."""
+    return [_from_dict(RedditComment, comment) for comment in comments]
+
+def subreddit_info_from_dict(info: Mapping[str, Any]) -> SubredditInfo:
+    """Build subreddit metadata from a ``get_subreddit_info`` result."""
+    return _from_dict(SubredditInfo, info)
@@ -0,0 +1,168 @@
+# Reddit Rate Budget
+# This module tracks the request budget Reddit reports in its X-Ratelimit-* response headers so
+# adapters can pace themselves to the real ceiling instead of guessing with fixed delays.
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from typing import Dict, Any, Optional, Mapping
+
+logger = logging.getLogger(__name__)
+
+class RateBudget:
+    """Request budget learned from X-Ratelimit-Remaining / X-Ratelimit-Reset headers."""
+
+    def __init__(self, min_remaining: float = 1.0, max_backoff: float = 60.0):
+        self.min_remaining: float = min_remaining  # Stop sending once the budget drops to this
+        self.max_backoff: float = max_backoff
+        self.remaining: Optional[float] = None  # Unknown until the first response
+        self.reset_at: float = 0.0  # time.monotonic() at which the window resets
+        self._lock = threading.Lock()
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Record the budget reported by a Reddit response."""
+        remaining = headers.get('X-Ratelimit-Remaining')
+        reset = headers.get('X-Ratelimit-Reset')
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining_value = float(remaining)
+            reset_at = time.monotonic() + float(reset)
+        except ValueError:
+            return
+        with self._lock:
+            self.remaining = remaining_value
+            self.reset_at = reset_at
+
+    def _reserve(self) -> float:
+        """Claim one request from the budget, or return how long to wait before retrying."""
+        with self._lock:
+            now = time.monotonic()
+            if self.remaining is None or now >= self.reset_at:
+                return 0.0
+            if self.remaining > self.min_remaining:
+                self.remaining -= 1  # Optimistic so concurrent callers don't overspend
+                return 0.0
+            return self.reset_at - now
+
+    def wait(self) -> None:
+        """Block until the budget allows another request."""
+        while (delay := self._reserve()) > 0:
+            logger.info(f"Rate budget exhausted, waiting {delay:.1f}s for window reset")
+            time.sleep(delay)
+
+    async def wait_async(self) -> None:
+        """Await until the budget allows another request."""
+        while (delay := self._reserve()) > 0:
+            logger.info(f"Rate budget exhausted, waiting {delay:.1f}s for window reset")
+            await asyncio.sleep(delay)
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Delay before retrying a 429: exponential, but never past the known window reset."""
+        delay = float(2 ** attempt)
+        with self._lock:
+            until_reset = self.reset_at - time.monotonic()
+        if until_reset > 0:
+            delay = min(delay, until_reset)
+        elif retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                pass
+        return min(delay, self.max_backoff)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get the last observed budget for monitoring."""
+        with self._lock:
+            return {
+                'remaining': self.remaining,
+                'reset_in': max(0.0, self.reset_at - time.monotonic()),
+            }
+
+class TokenBucket:
+    """Token-bucket limiter: requests only wait once the burst capacity is used up."""
+
+    def __init__(self, capacity: float = 5, refill_rate: float = 1.0):
+        self.capacity: float = capacity
+        self.base_rate: float = refill_rate  # Configured rate; penalties decay back towards it
+        self.refill_rate: float = refill_rate  # Tokens per second; math.inf disables limiting
+        self.tokens: float = capacity
+        self.last_refill: float = time.monotonic()
+        self._lock = threading.Lock()
+
+    def set_rate(self, refill_rate: float) -> None:
+        """Change the configured rate, dropping any active penalty."""
+        with self._lock:
+            self.base_rate = self.refill_rate = refill_rate
+
+    def penalize(self, factor: float = 0.5, floor: float = 0.125) -> None:
+        """Cut the rate after a 429 (multiplicative decrease), never below ``floor`` x the base rate."""
+        if math.isinf(self.base_rate):
+            return
+        with self._lock:
+            self.refill_rate = max(self.base_rate * floor, self.refill_rate * factor)
+
+    def recover(self, step: float = 0.05) -> None:
+        """Step the rate back towards the base rate after a successful response (additive increase)."""
+        if self.refill_rate >= self.base_rate:
+            return
+        with self._lock:
+            self.refill_rate = min(self.base_rate, self.refill_rate + self.base_rate * step)
+
+    def consume(self) -> float:
+        """Take a token (possibly on credit) and return how long the caller must wait for it."""
+        if math.isinf(self.refill_rate):
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self.last_refill
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+            self.last_refill = now
+            self.tokens -= 1
+            # A negative balance is a reservation; callers queue up behind each other
+            return -self.tokens / self.refill_rate if self.tokens < 0 else 0.0
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        delay = self.consume()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Await until a token is available."""
+        delay = self.consume()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+class RedisWindowLimiter:
+    """Fixed-window request counter in Redis, so every worker process draws from one budget."""
+
+    # Count the request and start the window on the first hit; returns {count, ms until window reset}
+    _WINDOW_SCRIPT = """
+local n = redis.call('INCR', KEYS[1])
+if n == 1 then redis.call('PEXPIRE', KEYS[1], ARGV[1]) end
+return {n, redis.call('PTTL', KEYS[1])}
+"""
+
+    def __init__(self, url: str, key: str, window: float = 60.0):
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError("RedisWindowLimiter requires the 'redis' package (pip install redis)") from e
+
+        self.key: str = key
+        self.window_ms: int = int(window * 1000)
+        self._redis: Any = redis.Redis.from_url(url)
+        self._script: Any = self._redis.register_script(self._WINDOW_SCRIPT)
+
+    def acquire(self, limit: int) -> None:
+        """Block until this window has room for another request (at most ``limit`` per window)."""
+        while True:
+            count, ttl_ms = self._script(keys=[self.key], args=[self.window_ms])
+            if count <= limit:
+                return
+            delay = max(ttl_ms, 1) / 1000.0
+            logger.info(f"Shared rate limit reached ({count - 1}/{limit}), waiting {delay:.1f}s")
+            time.sleep(delay)
@@ -0,0 +1,469 @@
+# Reddit Async Adapter
+# This module implements an asyncio Reddit adapter built on aiohttp for high fan-out workloads.
+# It uses the OAuth API when app credentials are available and falls back to the public JSON endpoints otherwise.
+
+import asyncio
+import aiohttp
+import logging
+import random
+import time
+from collections import OrderedDict
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Iterable, Mapping, Tuple, AsyncIterator
+from .exceptions import AuthenticationError, APIError, RateLimitError
+from .singleflight import AsyncSingleFlight
+from .rate import RateBudget
+from .jsonutil import loads as json_loads
+from urllib.parse import quote
+
+logger = logging.getLogger(__name__)
+
+def _segment(value: str) -> str:
+    """Percent-encode a caller-supplied URL path segment ('+' is kept for multireddits like a+b)."""
+    return quote(value, safe='+')
+
+# Comment bodies that carry no content and are skipped
+_DEAD_BODIES = frozenset({'[deleted]', '[removed]', '', None})
+
+class RedditAsync:
+    """Asyncio Reddit adapter using a pooled aiohttp session for concurrent requests."""
+
+    PUBLIC_URL = "https://www.reddit.com"
+    OAUTH_URL = "https://oauth.reddit.com"
+    TOKEN_URL = "https://www.reddit.com/api/v1/access_token"
+    # raw_json=1 asks Reddit not to HTML-escape text fields
+    _DEFAULT_PARAMS = MappingProxyType({'raw_json': 1})
+    # Post details only need the post listing, so the comment listing is pruned to one stub
+    _POST_DETAIL_PARAMS = MappingProxyType({'depth': 1, 'limit': 1})
+    # Tokens are refreshed in the background once this fraction of their lifetime has passed
+    TOKEN_REFRESH_RATIO = 0.8
+    # A token closer than this to expiry is never handed to a request
+    TOKEN_EXPIRY_MARGIN = 60
+    # Tokens shared across adapter instances, keyed by client id/secret (bounded LRU)
+    _TOKEN_CACHE: "OrderedDict[Tuple[str, str], Tuple[str, float]]" = OrderedDict()
+    _TOKEN_CACHE_SIZE = 32
+    # Fixed attribute layout; no per-instance __dict__ when many adapters coexist
+    __slots__ = (
+        "client_id", "client_secret", "user_agent", "_base_headers", "timeout",
+        "max_retries", "backoff_factor", "base_url", "_token", "_token_expires_at",
+        "_auth_lock", "_refresh_task", "_auth_headers", "_limit", "_limit_per_host",
+        "_session", "_flight", "_semaphore", "rate_budget",
+    )
+
+    def __init__(self, client_id: str = "", client_secret: str = "", user_agent: str = "",
+                 base_headers: Optional[Mapping[str, str]] = None, timeout: int = 30,
+                 max_retries: int = 3, concurrency: int = 64,
+                 limit: int = 256, limit_per_host: int = 64):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.user_agent = user_agent or "Earthworm Reddit Adapter 1.0"
+        self._base_headers: Mapping[str, str] = base_headers or {'User-Agent': self.user_agent}
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = 2.0
+        self.base_url = self.PUBLIC_URL
+        self._token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._auth_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        # Merged headers are rebuilt only when the token rotates, not per request
+        self._auth_headers: Optional[Dict[str, str]] = None
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Identical concurrent GETs share one request
+        self._flight = AsyncSingleFlight()
+        # Gate for bulk helpers so a large fan-out doesn't exhaust the connector
+        self._semaphore = asyncio.Semaphore(concurrency)
+        # Budget learned from X-Ratelimit-* headers; paces requests to Reddit's real ceiling
+        self.rate_budget = RateBudget()
+
+    async def __aenter__(self) -> "RedditAsync":
+        await self.authenticate()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Create the aiohttp session lazily so it binds to the running event loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._limit,
+                limit_per_host=self._limit_per_host,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers=dict(self._base_headers),
+            )
+        return self._session
+
+    def _set_token(self, token: Optional[str], expires_at: float = 0.0) -> None:
+        """Store a new OAuth token and rebuild the merged request headers once."""
+        self._token = token
+        self._token_expires_at = expires_at
+        if token:
+            self._auth_headers = {**self._base_headers, 'Authorization': f"bearer {token}"}
+        else:
+            self._auth_headers = None
+
+    def _url(self, path: str) -> str:
+        """Build an endpoint URL for the active host (OAuth paths don't take .json)."""
+        if self._token:
+            return f"{self.base_url}{path}"
+        return f"{self.base_url}{path}.json"
+
+    async def close(self) -> None:
+        """Close the underlying aiohttp session and release pooled connections."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def _token_valid(self) -> bool:
+        return self._token is not None and time.monotonic() < self._token_expires_at - self.TOKEN_EXPIRY_MARGIN
+
+    async def authenticate(self) -> bool:
+        """Obtain an application-only OAuth token, or use public endpoints without credentials."""
+        if not self.client_id or not self.client_secret:
+            logger.info("No credentials provided, using public Reddit JSON endpoints")
+            return True
+
+        if self._token_valid():
+            return True
+
+        async with self._auth_lock:
+            if self._token_valid():
+                return True
+
+            cached = self._TOKEN_CACHE.get((self.client_id, self.client_secret))
+            if cached and time.monotonic() < cached[1] - self.TOKEN_EXPIRY_MARGIN:
+                self._TOKEN_CACHE.move_to_end((self.client_id, self.client_secret))
+                self._activate_token(*cached)
+                return True
+
+            await self._refresh_token()
+        return True
+
+    def _invalidate_token(self) -> None:
+        """Force the next authenticate() to fetch a fresh token."""
+        self._token_expires_at = 0.0
+        self._TOKEN_CACHE.pop((self.client_id, self.client_secret), None)
+
+    async def _refresh_token(self) -> None:
+        """Request a new app-only token from Reddit and schedule its proactive refresh."""
+        session = self._get_session()
+        auth = aiohttp.BasicAuth(self.client_id, self.client_secret)
+        try:
+            async with session.post(self.TOKEN_URL, auth=auth,
+                                    data={'grant_type': 'client_credentials'}) as response:
+                if response.status != 200:
+                    raise AuthenticationError(f"Token request failed with status {response.status}")
+                payload = json_loads(await response.read())
+        except aiohttp.ClientError as e:
+            raise AuthenticationError(f"Failed to authenticate: {e}")
+
+        token = payload.get('access_token')
+        if not token:
+            raise AuthenticationError("Token response did not contain an access token")
+        expires_at = time.monotonic() + float(payload.get('expires_in', 3600))
+
+        key = (self.client_id, self.client_secret)
+        self._TOKEN_CACHE[key] = (token, expires_at)
+        self._TOKEN_CACHE.move_to_end(key)
+        while len(self._TOKEN_CACHE) > self._TOKEN_CACHE_SIZE:
+            self._TOKEN_CACHE.popitem(last=False)
+
+        self._activate_token(token, expires_at)
+        logger.info("✅ Obtained application-only OAuth token")
+
+    def _activate_token(self, token: str, expires_at: float) -> None:
+        """Switch to the OAuth host with ``token`` and schedule a refresh before it expires."""
+        self._set_token(token, expires_at)
+        self.base_url = self.OAUTH_URL
+
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+        delay = max(0.0, (expires_at - time.monotonic()) * self.TOKEN_REFRESH_RATIO)
+        self._refresh_task = asyncio.get_running_loop().create_task(self._refresh_later(delay))
+
+    async def _refresh_later(self, delay: float) -> None:
+        """Background task that renews the token so no request waits on the token endpoint."""
+        await asyncio.sleep(delay)
+        async with self._auth_lock:
+            try:
+                self._refresh_task = None  # _refresh_token schedules the next one
+                await self._refresh_token()
+            except AuthenticationError as e:
+                logger.warning(f"Proactive token refresh failed, will retry on next authenticate(): {e}")
+
+    async def _make_request(self, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """Make a request, coalescing it with any identical request already in flight."""
+        key = (path, tuple(sorted(params.items())) if params else ())
+        return await self._flight.do(key, lambda: self._request(path, params))
+
+    async def _request(self, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """Make a request with retry logic and rate limit handling."""
+        if self._token is not None and not self._token_valid():
+            await self.authenticate()
+        session = self._get_session()
+        url = self._url(path)
+        params = {**self._DEFAULT_PARAMS, **params} if params else self._DEFAULT_PARAMS
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self.rate_budget.wait_async()
+                async with session.get(url, params=params, headers=self._auth_headers) as response:
+                    self.rate_budget.update(response.headers)
+                    if response.status == 429:
+                        if attempt == self.max_retries:
+                            raise RateLimitError(f"Rate limited on {url}")
+                        wait_time = self.rate_budget.backoff_delay(attempt, response.headers.get('Retry-After'))
+                        logger.warning(f"Rate limited. Waiting {wait_time:.1f} seconds...")
+                        await asyncio.sleep(wait_time)
+                        continue
+
+                    if response.status == 401 and self._token and attempt < self.max_retries:
+                        logger.info("OAuth token rejected, refreshing before retry")
+                        self._invalidate_token()
+                        await self.authenticate()
+                        continue
+
+                    if response.status == 404:
+                        logger.warning(f"Resource not found: {url}")
+                        return None
+
+                    if response.status >= 500 and attempt < self.max_retries:
+                        wait_time = self.backoff_factor ** attempt + random.uniform(0, 1)
+                        logger.warning(f"Server error {response.status} for {url}, retrying in {wait_time:.2f}s")
+                        await asyncio.sleep(wait_time)
+                        continue
+
+                    if response.status >= 400:
+                        raise APIError(f"Request to {url} failed with status {response.status}")
+
+                    return json_loads(await response.read())
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"Request attempt {attempt + 1} failed for {url}: {e}")
+                if attempt < self.max_retries:
+                    await asyncio.sleep(self.backoff_factor ** attempt + random.uniform(0, 1))
+                else:
+                    raise APIError(f"Request failed after {self.max_retries + 1} attempts: {e}")
+
+        return None
+
+    async def get_user_info(self, username: str) -> Optional[Dict[str, Any]]:
+        """Retrieve user information."""
+        try:
+            data = await self._make_request(f"/user/{_segment(username)}/about")
+            if data and 'data' in data:
+                return data['data']
+            return None
+        except RateLimitError:
+            raise
+        except APIError as e:
+            logger.error(f"Failed to get user info for {username}: {e}")
+            return None
+
+    async def get_user_infos(self, usernames: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Fetch many users concurrently (deduplicated), bounded by the adapter's concurrency gate."""
+        async def fetch(username: str) -> Optional[Dict[str, Any]]:
+            async with self._semaphore:
+                return await self.get_user_info(username)
+
+        unique = list(dict.fromkeys(usernames))
+        results = await asyncio.gather(*(fetch(u) for u in unique))
+        return dict(zip(unique, results))
+
+    async def get_subreddit_posts(self, subreddit: str, sort: str = "hot", limit: int = 25) -> Optional[Dict[str, Any]]:
+        """Get posts from a subreddit."""
+        try:
+            return await self._make_request(f"/r/{_segment(subreddit)}/{_segment(sort)}", {'limit': min(limit, 100)})
+        except RateLimitError:
+            raise
+        except APIError as e:
+            logger.error(f"Failed to get posts from r/{subreddit}: {e}")
+            return None
+
+    async def collect_from_multiple_subreddits(self, subreddits: List[str], sort: str = "hot",
+                                               limit_per_sub: int = 25) -> Dict[str, Any]:
+        """Collect posts from many subreddits concurrently; same result shape as RedditOfficial's."""
+        async def collect(subreddit: str) -> Dict[str, Any]:
+            async with self._semaphore:
+                try:
+                    posts_data = await self.get_subreddit_posts(subreddit, sort=sort, limit=limit_per_sub)
+                except RateLimitError as e:
+                    return {'posts': [], 'count': 0, 'error': str(e)}
+            posts = (posts_data or {}).get('data', {}).get('children', [])
+            if not posts:
+                return {'posts': [], 'count': 0, 'error': 'No posts found'}
+            return {'posts': posts, 'count': len(posts), 'collected_at': datetime.now().isoformat()}
+
+        logger.info(f"Collecting from {len(subreddits)} subreddits: {subreddits}")
+        results = await asyncio.gather(*(collect(s) for s in subreddits))
+        all_results = dict(zip(subreddits, results))
+        total_posts = sum(r['count'] for r in results)
+        logger.info(f"Multi-subreddit collection complete: {total_posts} total posts from {len(subreddits)} subreddits")
+
+        return {
+            'results': all_results,
+            'summary': {
+                'total_subreddits': len(subreddits),
+                'successful_collections': sum(1 for r in results if r['count'] > 0),
+                'total_posts': total_posts,
+                'collection_date': datetime.now().isoformat()
+            }
+        }
+
+    async def get_subreddit_info(self, subreddit: str) -> Optional[Dict[str, Any]]:
+        """Get subreddit information and metadata."""
+        try:
+            data = await self._make_request(f"/r/{_segment(subreddit)}/about")
+            if data and 'data' in data:
+                return data['data']
+            return None
+        except RateLimitError:
+            raise
+        except APIError as e:
+            logger.error(f"Failed to get subreddit info for r/{subreddit}: {e}")
+            return None
+
+    async def get_post_details(self, post_id: str) -> Optional[Dict[str, Any]]:
+        """Get detailed information about a specific post."""
+        try:
+            data = await self._make_request(f"/comments/{_segment(post_id)}", dict(self._POST_DETAIL_PARAMS))
+            if data and isinstance(data, list) and len(data) > 0:
+                return data[0]
+            return None
+        except RateLimitError:
+            raise
+        except APIError as e:
+            logger.error(f"Failed to get post details for {post_id}: {e}")
+            return None
+
+    async def get_comments(self, post_id: str, limit: int = 100) -> Optional[List[Dict[str, Any]]]:
+        """Get top-level comments for a specific post."""
+        try:
+            data = await self._make_request(f"/comments/{_segment(post_id)}", {'limit': limit})
+            if data and isinstance(data, list) and len(data) > 1:
+                children = data[1].get('data', {}).get('children', [])
+                return [
+                    child['data'] for child in children
+                    if child.get('kind') == 't1'
+                    and child.get('data', {}).get('body') not in _DEAD_BODIES
+                ]
+            return []
+        except RateLimitError:
+            raise
+        except APIError as e:
+            logger.error(f"Failed to get comments for post {post_id}: {e}")
+            return None
+
+    async def search_posts(self, query: str, subreddit: Optional[str] = None,
+                          sort: str = "relevance", time_filter: str = "all",
+                          limit: int = 25) -> Optional[Dict[str, Any]]:
+        """Search for posts across Reddit or within a specific subreddit."""
+        params = {'q': query, 'sort': sort, 't': time_filter, 'limit': limit}
+        if subreddit:
+            path = f"/r/{_segment(subreddit)}/search"
+            params['restrict_sr'] = 'on'
+        else:
+            path = "/search"
+        try:
+            return await self._make_request(path, params)
+        except RateLimitError:
+            raise
+        except APIError as e:
+            logger.error(f"Failed to search for '{query}': {e}")
+            return None
+
+    async def get_user_posts(self, username: str, sort: str = "new",
+                            limit: int = 25) -> Optional[Dict[str, Any]]:
+        """Get posts submitted by a specific user."""
+        try:
+            return await self._make_request(f"/user/{_segment(username)}/submitted", {'sort': sort, 'limit': limit})
+        except RateLimitError:
+            raise
+        except APIError as e:
+            logger.error(f"Failed to get posts for user {username}: {e}")
+            return None
+
+    async def get_user_comments(self, username: str, sort: str = "new",
+                               limit: int = 25) -> Optional[Dict[str, Any]]:
+        """Get comments made by a specific user."""
+        try:
+            return await self._make_request(f"/user/{_segment(username)}/comments", {'sort': sort, 'limit': limit})
+        except RateLimitError:
+            raise
+        except APIError as e:
+            logger.error(f"Failed to get comments for user {username}: {e}")
+            return None
+
+    # ===============================
+    # PAGINATED ITERATORS
+    # ===============================
+
+    async def _iter_listing(self, path: str, params: Dict[str, Any],
+                            limit: Optional[int]) -> AsyncIterator[Dict[str, Any]]:
+        """Yield listing children, prefetching the next page while the caller consumes the current one."""
+        def page_params(after: Optional[str], remaining: Optional[int]) -> Dict[str, Any]:
+            page = {**params, 'limit': 100 if remaining is None else min(remaining, 100)}
+            if after:
+                page['after'] = after
+            return page
+
+        remaining = limit
+        next_page: Optional[asyncio.Task] = asyncio.ensure_future(self._make_request(path, page_params(None, remaining)))
+        try:
+            while next_page is not None:
+                try:
+                    page = await next_page
+                except RateLimitError:
+                    raise
+                except APIError as e:
+                    logger.error(f"Failed to fetch listing page from {path}: {e}")
+                    return
+                next_page = None
+
+                if not page or 'data' not in page:
+                    return
+                children = page['data'].get('children', [])
+                if remaining is not None:
+                    children = children[:remaining]
+                    remaining -= len(children)
+
+                # The cursor for page N+1 is known now, so start fetching it before yielding page N
+                after = page['data'].get('after')
+                if after and children and (remaining is None or remaining > 0):
+                    next_page = asyncio.ensure_future(self._make_request(path, page_params(after, remaining)))
+
+                for child in children:
+                    yield child
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    def iter_subreddit_posts(self, subreddit: str, sort: str = "hot",
+                             limit: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Lazily yield posts from a subreddit, fetching further pages ahead of the caller."""
+        return self._iter_listing(f"/r/{_segment(subreddit)}/{_segment(sort)}", {}, limit)
+
+    def iter_search_posts(self, query: str, subreddit: Optional[str] = None,
+                          sort: str = "relevance", time_filter: str = "all",
+                          limit: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Lazily yield search results, fetching further pages ahead of the caller."""
+        params = {'q': query, 'sort': sort, 't': time_filter}
+        if subreddit:
+            params['restrict_sr'] = 'on'
+            return self._iter_listing(f"/r/{_segment(subreddit)}/search", params, limit)
+        return self._iter_listing("/search", params, limit)
+
+    def iter_user_posts(self, username: str, sort: str = "new",
+                        limit: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Lazily yield a user's submissions, fetching further pages ahead of the caller."""
+        return self._iter_listing(f"/user/{_segment(username)}/submitted", {'sort': sort}, limit)
@@ -3,15 +3,35 @@
 # It scrapes public Reddit pages and JSON endpoints that don't require authentication.
 # This file is part of the Earthworm application, which provides various adapters for different services.
 
+import asyncio
+import aiohttp
 import requests
-from typing import Dict, Any, Optional, List, Callable
+from requests.adapters import HTTPAdapter
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Callable, Iterator, Tuple, Union
 import logging
 import time
-import json
 import random
+import hashlib
+import math
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue, Full
+from threading import Event, Thread
+from operator import itemgetter
 from urllib.parse import urlencode, quote
-from .base import RedditAdapterProtocol
 from .exceptions import AuthenticationError, APIError, RateLimitError
+from .jsonutil import loads as json_loads, dumps as json_dumps, JSONDecodeError
+from .caching import CacheBackend, InMemoryBackend
+from .rate import RateBudget, TokenBucket
+from .singleflight import SingleFlight, AsyncSingleFlight
+
+# httpx is optional; when installed an HTTP/2 httpx.Client can stand in for the requests session
+try:
+    import httpx
+    _TRANSPORT_ERRORS = (requests.RequestException, httpx.HTTPError)
+except ImportError:
+    _TRANSPORT_ERRORS = (requests.RequestException,)
 
 # Try to import user agents, fallback if not available
 try:
@@ -33,28 +53,118 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-class RedditCommunity(RedditAdapterProtocol):
+def _segment(value: str) -> str:
+    """Percent-encode a caller-supplied URL path segment ('+' is kept for multireddits like a+b)."""
+    return quote(value, safe='+')
+
+# Comment bodies that carry no content and are skipped before extraction
+_DEAD_BODIES = frozenset({'[deleted]', '[removed]', '', None})
+
+# Returned by _fetch when a conditional request comes back 304 Not Modified
+_NOT_MODIFIED = object()
+
+class RedditCommunity:
     """Reddit Community web scraper for non-API Reddit data collection."""
     
     BASE_URL = "https://www.reddit.com"
+    # Endpoint prefixes are built once; call sites only interpolate the variable parts
+    _SUBREDDIT_URL = BASE_URL + "/r/"
+    _USER_URL = BASE_URL + "/user/"
+    _COMMENTS_URL = BASE_URL + "/comments/"
+    _SEARCH_URL = BASE_URL + "/search.json"
+    _INFO_URL = BASE_URL + "/api/info.json"
+    INFO_BATCH_SIZE = 100  # Max fullnames /api/info accepts per request
+    # raw_json=1 asks Reddit not to HTML-escape text fields
+    _DEFAULT_PARAMS = MappingProxyType({'raw_json': 1})
+    # Comment pages only need top-level comments; depth=1 stops Reddit sending whole reply trees
+    _COMMENT_PARAMS = MappingProxyType({'depth': 1})
+    # Post details only need the post listing, so the comment listing is pruned to one stub
+    _POST_DETAIL_PARAMS = MappingProxyType({'depth': 1, 'limit': 1})
+    # Responses are cached in _make_request, so the factory doesn't wrap this adapter in another cache
+    caches_responses = True
+    # Response cache TTLs (seconds) by URL fragment; URLs matching none of these are never cached
+    _CACHE_POLICY = (
+        ('/about.json', 600),
+        ('/comments/', 120),
+        ('/search.json', 300),
+        ('/api/info.json', 60),
+        ('/hot.json', 60),
+        ('/new.json', 60),
+        ('/top.json', 60),
+        ('/rising.json', 60),
+    )
+    # "new" listings this small are usually polled for freshness, so they are never cached
+    FRESH_LISTING_LIMIT = 25
+    # Expired entries are kept this much longer and served if Reddit keeps failing (stale-if-error)
+    STALE_IF_ERROR = 3600
+    AGENT_POOL_SIZE = 16  # User agents drawn per adapter for rotation
+    # Fixed attribute layout; no per-instance __dict__ when many adapters coexist
+    __slots__ = (
+        "client_id", "client_secret", "user_agent", "_agent_pool", "_agent_idx",
+        "session", "timeout", "_request_delay", "limiter", "max_retries",
+        "backoff_factor", "max_backoff", "request_count", "_ua_rotation_interval",
+        "_requests_since_rotation", "start_time", "_start_monotonic", "rate_budget", "cache",
+        "cache_hits", "cache_misses", "_flight", "_aflight",
+    )
     
-    def __init__(self, client_id: str = "", client_secret: str = "", user_agent: str = ""):
+    def __init__(self, client_id: str = "", client_secret: str = "", user_agent: str = "",
+                 session: Optional[Union[requests.Session, "httpx.Client"]] = None, timeout: int = 10,
+                 cache: Optional[CacheBackend] = None):
         # These params are not needed for web scraping but kept for interface compatibility
         self.client_id = client_id
         self.client_secret = client_secret
-        self.user_agent = user_agent or get_agent()
-        self.session = requests.Session()
+        # Agents are drawn once up front; rotation just steps through the pool
+        self._agent_pool = tuple(get_agent() for _ in range(self.AGENT_POOL_SIZE))
+        self._agent_idx = 0
+        self.user_agent = user_agent or self._agent_pool[0]
+        # Reuse an injected session so keep-alive connections survive across calls
+        self.session = session or self._build_session()
+        self.timeout = timeout
         self._setup_session()
-        self.request_delay = 1.0  # Delay between requests to be respectful
+        # Bursts of up to 5 requests go out immediately, then one per request_delay on average
+        self.limiter = TokenBucket(capacity=5, refill_rate=1.0)
+        self.request_delay = 1.0  # Average delay between requests to be respectful
         self.max_retries = 3  # Maximum number of retries for failed requests
         self.backoff_factor = 2.0  # Exponential backoff factor
+        self.max_backoff = 30.0  # Longest 429 wait; a longer Retry-After fails fast with RateLimitError
         self.request_count = 0  # Track number of requests made
-        self.start_time = time.time()  # Track session start time
+        self._ua_rotation_interval = 25  # Requests between user agent rotations
+        self._requests_since_rotation = 0
+        self.start_time = time.time()  # Track session start time (wall clock, for display)
+        self._start_monotonic = time.monotonic()  # Session duration; immune to clock adjustments
+        # Budget learned from X-Ratelimit-* headers; paces requests to Reddit's real ceiling
+        self.rate_budget = RateBudget()
+        # Response cache for idempotent GETs, shared with other workers when a Redis backend is passed
+        self.cache: CacheBackend = cache if cache is not None else InMemoryBackend()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Identical concurrent GETs share one network fetch: threads here, coroutines in _aflight
+        self._flight = SingleFlight()
+        self._aflight = AsyncSingleFlight()
+
+    @property
+    def request_delay(self) -> float:
+        return self._request_delay
+
+    @request_delay.setter
+    def request_delay(self, delay: float) -> None:
+        self._request_delay = delay
+        self.limiter.set_rate(1.0 / delay if delay > 0 else math.inf)
+
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """Build a keep-alive session whose pool holds enough connections for concurrent callers."""
+        session = requests.Session()
+        # Retries are handled in _make_request, so the adapter itself never retries
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32, pool_block=False, max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
 
     def _setup_session(self) -> None:
         """Setup the session with headers to mimic a real browser."""
         headers = {
-            'User-Agent': get_agent(),  # Rotate user agent for each session
+            'User-Agent': self._agent_pool[0],  # Browser user agent for this session
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate',
@@ -73,31 +183,164 @@ class RedditCommunity(RedditAdapterProtocol):
             'reddit_session': f'session_{int(time.time())}',
         })
 
+    def _next_agent(self) -> str:
+        """Advance to the next user agent in the pool."""
+        self._agent_idx = (self._agent_idx + 1) % len(self._agent_pool)
+        return self._agent_pool[self._agent_idx]
+
     def _rotate_user_agent(self) -> None:
         """Rotate user agent to avoid detection."""
-        self.session.headers.update({'User-Agent': get_agent()})
+        self.session.headers['User-Agent'] = self._next_agent()
+
+    def _cache_ttl(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        """Look up the response cache TTL for a request, or None if it shouldn't be cached."""
+        if url.endswith('/new.json') and (params or {}).get('limit', 25) <= self.FRESH_LISTING_LIMIT:
+            return None
+        for fragment, ttl in self._CACHE_POLICY:
+            if fragment in url:
+                return ttl
+        return None
+
+    @staticmethod
+    def _cache_key(url: str, params: Optional[Dict[str, Any]]) -> str:
+        query = urlencode(sorted(params.items())) if params else ''
+        return f"reddit:url:{hashlib.sha1((url + '?' + query).encode('utf-8')).hexdigest()}"
+
+    def _cache_read(self, key: str) -> Tuple[Any, Any, Optional[str]]:
+        """Look up a cached response as ``(fresh, stale, etag)``; ``fresh`` is None unless it can be served."""
+        raw = self.cache.get(key)
+        if raw is not None:
+            # Entries written before ETags were stored have no third element
+            fresh_until, data, *validators = json_loads(raw)
+            etag = validators[0] if validators else None
+            if time.time() < fresh_until:
+                self.cache_hits += 1
+                return data, None, etag
+            self.cache_misses += 1
+            return None, data, etag
+        self.cache_misses += 1
+        return None, None, None
+
+    def _cache_store(self, url: str, key: str, ttl: int, data: Any, stale: Any,
+                     validators: Dict[str, Any]) -> Any:
+        """Store a fetched response (a 304 renews the stale copy) and return what the caller gets."""
+        if data is _NOT_MODIFIED:
+            logger.debug(f"Not modified, reusing cached response for {url}")
+            data = stale
+        if data is not None:
+            entry = [time.time() + ttl, data, validators.get('etag')]
+            self.cache.setex(key, ttl + self.STALE_IF_ERROR, json_dumps(entry))
+        return data
 
     def _make_request(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
-        """Make a request with error handling, retry logic, and rate limiting."""
+        """Make a request, answering from the response cache while the entry is fresh."""
+        ttl = self._cache_ttl(url, params)
+        if ttl is None:
+            return self._coalesced_fetch(url, params)
+
+        key = self._cache_key(url, params)
+        fresh, stale, etag = self._cache_read(key)
+        if fresh is not None:
+            return fresh
+
+        def load() -> Optional[Dict[str, Any]]:
+            # Revalidate the stale copy with its ETag; a 304 costs no body and renews the entry
+            validators = {'etag': etag} if etag else {}
+            return self._cache_store(url, key, ttl, self._fetch(url, params, validators), stale, validators)
+
+        try:
+            return self._flight.do(self._flight_key(url, params), load)
+        except APIError:
+            if stale is None:
+                raise
+            logger.warning(f"Serving stale cached response for {url} after request failure")
+            return stale
+
+    async def _amake_cached_request(self, session: aiohttp.ClientSession, url: str,
+                                    params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """Async sibling of _make_request: same response cache, ETag revalidation and coalescing."""
+        ttl = self._cache_ttl(url, params)
+        flight_key = self._flight_key(url, params)
+        if ttl is None:
+            return await self._aflight.do(flight_key, lambda: self._amake_request(session, url, params))
+
+        key = self._cache_key(url, params)
+        fresh, stale, etag = self._cache_read(key)
+        if fresh is not None:
+            return fresh
+
+        async def load() -> Optional[Any]:
+            validators = {'etag': etag} if etag else {}
+            data = await self._amake_request(session, url, params, validators)
+            return self._cache_store(url, key, ttl, data, stale, validators)
+
+        try:
+            return await self._aflight.do(flight_key, load)
+        except APIError:
+            if stale is None:
+                raise
+            logger.warning(f"Serving stale cached response for {url} after request failure")
+            return stale
+
+    def _rate_limit_wait(self, url: str, attempt: int, retry_after: Optional[str]) -> float:
+        """Handle a 429: slow the limiter and return a capped, jittered wait, or raise if it's not worth waiting."""
+        self.limiter.penalize()
+        if attempt == self.max_retries:
+            raise RateLimitError(f"Rate limited on {url}")
+        try:
+            requested = float(retry_after) if retry_after else 0.0
+        except ValueError:
+            requested = 0.0
+        if requested > self.max_backoff:
+            # Let the caller reschedule other work rather than stall the whole scraper
+            raise RateLimitError(f"Retry-After {requested:.0f}s exceeds budget of {self.max_backoff:.0f}s for {url}")
+        wait_time = min(self.max_backoff, self.rate_budget.backoff_delay(attempt, retry_after)) + random.uniform(0, 0.5)
+        logger.warning(f"Rate limited. Waiting {wait_time:.1f} seconds...")
+        return wait_time
+
+    @staticmethod
+    def _flight_key(url: str, params: Optional[Dict[str, Any]]) -> tuple:
+        return (url, tuple(sorted(params.items())) if params else ())
+
+    def _coalesced_fetch(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Fetch, sharing the result with any identical request already in flight."""
+        return self._flight.do(self._flight_key(url, params), lambda: self._fetch(url, params))
+
+    def _fetch(self, url: str, params: Optional[Dict[str, Any]] = None,
+               validators: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Make a request with error handling, retry logic, and rate limiting.
+
+        With ``validators``, a stored ``etag`` is sent as If-None-Match (a 304 returns
+        ``_NOT_MODIFIED``) and the response's ETag is written back into the dict.
+        """
+        headers = {'If-None-Match': validators['etag']} if validators and validators.get('etag') else None
+        params = {**self._DEFAULT_PARAMS, **params} if params else dict(self._DEFAULT_PARAMS)
         for attempt in range(self.max_retries + 1):
             try:
-                # Rotate user agent for each request
-                self._rotate_user_agent()
+                # Rotate user agent every few requests; per-request rotation looks bot-like and draws 403s
+                self._requests_since_rotation += 1
+                if self._requests_since_rotation >= self._ua_rotation_interval:
+                    self._rotate_user_agent()
+                    self._requests_since_rotation = 0
                 
-                # Add delay to be respectful
-                time.sleep(self.request_delay)
+                # Pace requests to be respectful; only waits once the burst allowance is spent
+                self.limiter.acquire()
                 
                 # Track request count
                 self.request_count += 1
                 
-                response = self.session.get(url, params=params, timeout=10)
+                self.rate_budget.wait()
+                response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+                self.rate_budget.update(response.headers)
                 
                 # Handle rate limiting
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get('Retry-After', 60))
-                    logger.warning(f"Rate limited. Waiting {retry_after} seconds...")
-                    time.sleep(retry_after)
+                    time.sleep(self._rate_limit_wait(url, attempt, response.headers.get('Retry-After')))
                     continue  # Retry the request
+                self.limiter.recover()
+                
+                if response.status_code == 304:
+                    return _NOT_MODIFIED
                 
                 # Handle other HTTP errors
                 if response.status_code == 404:
@@ -123,18 +366,20 @@ class RedditCommunity(RedditAdapterProtocol):
                 
                 # Try to parse as JSON first (for .json endpoints)
                 try:
-                    data = response.json()
+                    data = json_loads(response.content)
                     # Validate basic Reddit data structure
                     if self._validate_reddit_response(data):
+                        if validators is not None:
+                            validators['etag'] = response.headers.get('ETag')
                         return data
                     else:
                         logger.warning(f"Invalid Reddit response structure from {url}")
                         return None
-                except json.JSONDecodeError:
+                except JSONDecodeError:
                     # Return the text content for HTML parsing if needed
                     return {'html_content': response.text, 'status_code': response.status_code}
                     
-            except requests.RequestException as e:
+            except _TRANSPORT_ERRORS as e:
                 logger.warning(f"Request attempt {attempt + 1} failed for {url}: {e}")
                 if attempt < self.max_retries:
                     wait_time = self.backoff_factor ** attempt + random.uniform(0, 1)
@@ -146,12 +391,70 @@ class RedditCommunity(RedditAdapterProtocol):
         
         return None
 
+    async def _amake_request(self, session: aiohttp.ClientSession, url: str,
+                             params: Optional[Dict[str, Any]] = None,
+                             validators: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """Async sibling of _fetch with the same retry, backoff, rate limit and ETag handling."""
+        headers = {'If-None-Match': validators['etag']} if validators and validators.get('etag') else None
+        params = {**self._DEFAULT_PARAMS, **params} if params else dict(self._DEFAULT_PARAMS)
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self.limiter.acquire_async()
+                self.request_count += 1
+
+                await self.rate_budget.wait_async()
+                async with session.get(url, params=params, headers=headers) as response:
+                    self.rate_budget.update(response.headers)
+
+                    if response.status == 429:
+                        await asyncio.sleep(self._rate_limit_wait(url, attempt, response.headers.get('Retry-After')))
+                        continue
+                    self.limiter.recover()
+
+                    if response.status == 304:
+                        return _NOT_MODIFIED
+                    if response.status == 404:
+                        logger.warning(f"Resource not found: {url}")
+                        return None
+                    elif response.status == 403:
+                        logger.warning(f"Access forbidden: {url} - Reddit may be blocking requests")
+                        return None
+                    elif response.status >= 500 and attempt < self.max_retries:
+                        wait_time = self.backoff_factor ** attempt + random.uniform(0, 1)
+                        logger.warning(f"Server error {response.status} for {url}, retrying in {wait_time:.2f}s")
+                        await asyncio.sleep(wait_time)
+                        continue
+
+                    response.raise_for_status()
+                    content = await response.read()
+
+                try:
+                    data = json_loads(content)
+                except JSONDecodeError:
+                    return {'html_content': content.decode('utf-8', 'replace'), 'status_code': response.status}
+                if self._validate_reddit_response(data):
+                    if validators is not None:
+                        validators['etag'] = response.headers.get('ETag')
+                    return data
+                logger.warning(f"Invalid Reddit response structure from {url}")
+                return None
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"Request attempt {attempt + 1} failed for {url}: {e}")
+                if attempt < self.max_retries:
+                    await asyncio.sleep(self.backoff_factor ** attempt + random.uniform(0, 1))
+                else:
+                    logger.error(f"All retry attempts failed for {url}")
+                    raise APIError(f"Request failed after {self.max_retries + 1} attempts: {e}")
+
+        return None
+
     def _try_alternate_request(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """Try alternate request method when getting 403 errors."""
         try:
             # Try with a different user agent and additional headers
             alt_headers = {
-                'User-Agent': get_agent(),
+                'User-Agent': self._next_agent(),
                 'Accept': 'application/json, text/plain, */*',
                 'Accept-Language': 'en-US,en;q=0.9',
                 'Referer': 'https://www.reddit.com/',
@@ -159,24 +462,16 @@ class RedditCommunity(RedditAdapterProtocol):
                 'X-Requested-With': 'XMLHttpRequest',
             }
             
-            # Update session headers temporarily
-            original_headers = self.session.headers.copy()
-            self.session.headers.update(alt_headers)
-            
-            # Add a longer delay for alternate requests
-            time.sleep(self.request_delay * 2)
+            self.limiter.acquire()
             
-            response = self.session.get(url, params=params, timeout=15)
-            
-            # Restore original headers
-            self.session.headers.clear()
-            self.session.headers.update(original_headers)
+            # Per-call headers are merged over the session's, leaving the shared session untouched
+            response = self.session.get(url, params=params, headers=alt_headers, timeout=self.timeout * 1.5)
             
             if response.status_code == 200:
                 logger.info(f"Alternate request successful for {url}")
                 try:
-                    return response.json()
-                except json.JSONDecodeError:
+                    return json_loads(response.content)
+                except JSONDecodeError:
                     return {'html_content': response.text, 'status_code': response.status_code}
             else:
                 logger.debug(f"Alternate request also failed with status {response.status_code}")
@@ -206,11 +501,14 @@ class RedditCommunity(RedditAdapterProtocol):
 
     def _clean_text_content(self, text: str) -> str:
         """Clean and normalize text content for research use."""
-        if not text or text in ['[deleted]', '[removed]', None]:
+        if not text or text in _DEAD_BODIES:
             return ""
         
         # Basic text cleaning
         text = text.strip()
+        # raw_json=1 responses rarely carry entities, so skip the replace passes when there's no '&'
+        if '&' not in text:
+            return text
         # Remove Reddit markdown formatting that might interfere with analysis
         text = text.replace('&amp;', '&')
         text = text.replace('&lt;', '<')
@@ -263,8 +561,7 @@ class RedditCommunity(RedditAdapterProtocol):
 
     def get_session_stats(self) -> Dict[str, Any]:
         """Get statistics about the current scraping session."""
-        current_time = time.time()
-        session_duration = current_time - self.start_time
+        session_duration = time.monotonic() - self._start_monotonic
         
         return {
             'session_duration_seconds': session_duration,
@@ -273,8 +570,32 @@ class RedditCommunity(RedditAdapterProtocol):
             'average_delay': self.request_delay,
             'max_retries': self.max_retries,
             'start_time': self.start_time,
+            'rate_budget': self.rate_budget.get_status(),
+            'connection_pools': self._pool_stats(),
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'inflight_requests': len(self._flight),
         }
 
+    def _pool_stats(self) -> Dict[str, Any]:
+        """Per-host urllib3 pool counters; requests well above connections opened means keep-alive reuse."""
+        stats = {}
+        adapters = getattr(self.session, 'adapters', {})  # httpx clients have no mounted adapters
+        for adapter in {id(a): a for a in adapters.values()}.values():
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is not None:
+                    stats[pool.host] = {
+                        'connections_opened': pool.num_connections,
+                        'requests': pool.num_requests,
+                    }
+        return stats
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self.session.close()
+
     def authenticate(self) -> bool:
         """No authentication needed for web scraping public Reddit content."""
         logger.info("No authentication required for web scraping mode")
@@ -283,13 +604,15 @@ class RedditCommunity(RedditAdapterProtocol):
     def get_user_info(self, username: str) -> Optional[Dict[str, Any]]:
         """Retrieve user information from Reddit public page."""
         try:
-            url = f"{self.BASE_URL}/user/{username}/about.json"
+            url = f"{self._USER_URL}{_segment(username)}/about.json"
             data = self._make_request(url)
             
             if data and 'data' in data:
                 return data['data']
             return None
             
+        except RateLimitError:
+            raise
         except APIError as e:
             logger.error(f"Failed to get user info for {username}: {e}")
             return None
@@ -297,12 +620,26 @@ class RedditCommunity(RedditAdapterProtocol):
     def get_subreddit_posts(self, subreddit: str, sort: str = "hot", limit: int = 25) -> Optional[Dict[str, Any]]:
         """Get posts from a subreddit using public JSON endpoint."""
         try:
-            url = f"{self.BASE_URL}/r/{subreddit}/{sort}.json"
+            url = f"{self._SUBREDDIT_URL}{_segment(subreddit)}/{_segment(sort)}.json"
             params = {'limit': min(limit, 100)}  # Reddit limits to 100 per request
             
             data = self._make_request(url, params)
             return data
             
+        except RateLimitError:
+            raise
+        except APIError as e:
+            logger.error(f"Failed to get posts from r/{subreddit}: {e}")
+            return None
+
+    async def aget_subreddit_posts(self, session: aiohttp.ClientSession, subreddit: str,
+                                   sort: str = "hot", limit: int = 25) -> Optional[Dict[str, Any]]:
+        """Async sibling of get_subreddit_posts over a caller-owned aiohttp session."""
+        try:
+            url = f"{self._SUBREDDIT_URL}{_segment(subreddit)}/{_segment(sort)}.json"
+            return await self._amake_cached_request(session, url, {'limit': min(limit, 100)})
+        except RateLimitError:
+            raise
         except APIError as e:
             logger.error(f"Failed to get posts from r/{subreddit}: {e}")
             return None
@@ -310,13 +647,15 @@ class RedditCommunity(RedditAdapterProtocol):
     def get_subreddit_info(self, subreddit: str) -> Optional[Dict[str, Any]]:
         """Get subreddit information and metadata."""
         try:
-            url = f"{self.BASE_URL}/r/{subreddit}/about.json"
+            url = f"{self._SUBREDDIT_URL}{_segment(subreddit)}/about.json"
             data = self._make_request(url)
             
             if data and 'data' in data:
                 return data['data']
             return None
             
+        except RateLimitError:
+            raise
         except APIError as e:
             logger.error(f"Failed to get subreddit info for r/{subreddit}: {e}")
             return None
@@ -325,14 +664,16 @@ class RedditCommunity(RedditAdapterProtocol):
         """Get detailed information about a specific post."""
         try:
             # Reddit post URLs follow the pattern: /comments/post_id/
-            url = f"{self.BASE_URL}/comments/{post_id}.json"
-            data = self._make_request(url)
+            url = f"{self._COMMENTS_URL}{_segment(post_id)}.json"
+            data = self._make_request(url, dict(self._POST_DETAIL_PARAMS))
             
             if data and isinstance(data, list) and len(data) > 0:
                 # First element contains the post data
                 return data[0]
             return None
             
+        except RateLimitError:
+            raise
         except APIError as e:
             logger.error(f"Failed to get post details for {post_id}: {e}")
             return None
@@ -340,40 +681,75 @@ class RedditCommunity(RedditAdapterProtocol):
     def get_comments(self, post_id: str, limit: int = 100) -> Optional[List[Dict[str, Any]]]:
         """Get comments for a specific post with improved data cleaning."""
         try:
-            url = f"{self.BASE_URL}/comments/{post_id}.json"
-            params = {'limit': limit}
+            url = f"{self._COMMENTS_URL}{_segment(post_id)}.json"
+            params = {**self._COMMENT_PARAMS, 'limit': limit}
             data = self._make_request(url, params)
+            return self._parse_comments(post_id, data)
             
-            if data and isinstance(data, list) and len(data) > 1:
-                # Second element contains the comments data
-                comments_data = data[1]
-                if 'data' in comments_data and 'children' in comments_data['data']:
-                    # Extract and clean comment data
-                    cleaned_comments = []
-                    for child in comments_data['data']['children']:
-                        if 'data' in child:
-                            comment_data = child['data']
-                            # Skip deleted/removed comments unless specifically requested
-                            if comment_data.get('body') not in ['[deleted]', '[removed]', None, '']:
-                                cleaned_comments.append(self._extract_clean_comment_data(comment_data))
-                    
-                    logger.info(f"Successfully extracted {len(cleaned_comments)} valid comments from post {post_id}")
-                    return cleaned_comments
-            
-            logger.warning(f"No comments found for post {post_id}")
-            return []
-            
+        except RateLimitError:
+            raise
         except APIError as e:
             logger.error(f"Failed to get comments for post {post_id}: {e}")
             return None
 
+    async def aget_comments(self, session: aiohttp.ClientSession, post_id: str,
+                            limit: int = 100) -> Optional[List[Dict[str, Any]]]:
+        """Async sibling of get_comments over a caller-owned aiohttp session."""
+        try:
+            url = f"{self._COMMENTS_URL}{_segment(post_id)}.json"
+            data = await self._amake_cached_request(session, url, {**self._COMMENT_PARAMS, 'limit': limit})
+            return self._parse_comments(post_id, data)
+        except RateLimitError:
+            raise
+        except APIError as e:
+            logger.error(f"Failed to get comments for post {post_id}: {e}")
+            return None
+
+    def _parse_comments(self, post_id: str, data: Any) -> List[Dict[str, Any]]:
+        """Extract cleaned comments from a /comments/{id}.json response."""
+        if data and isinstance(data, list) and len(data) > 1:
+            # Second element contains the comments data
+            comments_data = data[1]
+            if 'data' in comments_data and 'children' in comments_data['data']:
+                # Extract and clean comment data
+                cleaned_comments = []
+                for child in comments_data['data']['children']:
+                    comment_data = child.get('data')
+                    # Skip deleted/removed comments before building their dicts
+                    if comment_data is None or comment_data.get('body') in _DEAD_BODIES:
+                        continue
+                    cleaned_comments.append(self._extract_clean_comment_data(comment_data))
+                
+                logger.info(f"Successfully extracted {len(cleaned_comments)} valid comments from post {post_id}")
+                return cleaned_comments
+        
+        logger.warning(f"No comments found for post {post_id}")
+        return []
+
+    def get_posts_by_ids(self, post_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get metadata for many posts at once, up to 100 per request via /api/info (no comments)."""
+        ids = list(dict.fromkeys(post_id.removeprefix('t3_') for post_id in post_ids))
+        posts = []
+        for start in range(0, len(ids), self.INFO_BATCH_SIZE):
+            chunk = ids[start:start + self.INFO_BATCH_SIZE]
+            try:
+                data = self._make_request(self._INFO_URL, {'id': ','.join('t3_' + post_id for post_id in chunk)})
+            except RateLimitError:
+                raise
+            except APIError as e:
+                logger.error(f"Failed to get post info for {len(chunk)} posts: {e}")
+                continue
+            if data and 'data' in data and 'children' in data['data']:
+                posts.extend(child['data'] for child in data['data']['children'] if 'data' in child)
+        return posts
+
     def search_posts(self, query: str, subreddit: Optional[str] = None, 
                     sort: str = "relevance", time_filter: str = "all", 
                     limit: int = 25) -> Optional[Dict[str, Any]]:
         """Search for posts across Reddit or within a specific subreddit."""
         try:
             if subreddit:
-                url = f"{self.BASE_URL}/r/{subreddit}/search.json"
+                url = f"{self._SUBREDDIT_URL}{_segment(subreddit)}/search.json"
                 params = {
                     'q': query,
                     'restrict_sr': 'on',  # Restrict search to subreddit
@@ -382,7 +758,7 @@ class RedditCommunity(RedditAdapterProtocol):
                     'limit': limit
                 }
             else:
-                url = f"{self.BASE_URL}/search.json"
+                url = self._SEARCH_URL
                 params = {
                     'q': query,
                     'sort': sort,
@@ -393,6 +769,8 @@ class RedditCommunity(RedditAdapterProtocol):
             data = self._make_request(url, params)
             return data
             
+        except RateLimitError:
+            raise
         except APIError as e:
             logger.error(f"Failed to search for '{query}': {e}")
             return None
@@ -401,7 +779,7 @@ class RedditCommunity(RedditAdapterProtocol):
                       limit: int = 25) -> Optional[Dict[str, Any]]:
         """Get posts submitted by a specific user."""
         try:
-            url = f"{self.BASE_URL}/user/{username}/submitted.json"
+            url = f"{self._USER_URL}{_segment(username)}/submitted.json"
             params = {
                 'sort': sort,
                 'limit': limit
@@ -410,6 +788,8 @@ class RedditCommunity(RedditAdapterProtocol):
             data = self._make_request(url, params)
             return data
             
+        except RateLimitError:
+            raise
         except APIError as e:
             logger.error(f"Failed to get posts for user {username}: {e}")
             return None
@@ -418,7 +798,7 @@ class RedditCommunity(RedditAdapterProtocol):
                          limit: int = 25) -> Optional[Dict[str, Any]]:
         """Get comments made by a specific user."""
         try:
-            url = f"{self.BASE_URL}/user/{username}/comments.json"
+            url = f"{self._USER_URL}{_segment(username)}/comments.json"
             params = {
                 'sort': sort,
                 'limit': limit
@@ -427,10 +807,66 @@ class RedditCommunity(RedditAdapterProtocol):
             data = self._make_request(url, params)
             return data
             
+        except RateLimitError:
+            raise
         except APIError as e:
             logger.error(f"Failed to get comments for user {username}: {e}")
             return None
 
+    # ===============================
+    # PAGINATED ITERATORS
+    # ===============================
+
+    def _iter_listing(self, url: str, params: Dict[str, Any],
+                      limit: Optional[int]) -> Iterator[Dict[str, Any]]:
+        """Yield listing children page by page, following Reddit's ``after`` cursor."""
+        remaining = limit
+        after = None
+        while remaining is None or remaining > 0:
+            page_params = {**params, 'limit': 100 if remaining is None else min(remaining, 100)}
+            if after:
+                page_params['after'] = after
+
+            try:
+                page = self._make_request(url, page_params)
+            except RateLimitError:
+                raise
+            except APIError as e:
+                logger.error(f"Failed to fetch listing page from {url}: {e}")
+                return
+
+            if not page or 'data' not in page:
+                return
+            children = page['data'].get('children', [])
+            if remaining is not None:
+                children = children[:remaining]
+                remaining -= len(children)
+            yield from children
+
+            after = page['data'].get('after')
+            if not after or not children:
+                return
+
+    def iter_subreddit_posts(self, subreddit: str, sort: str = "hot",
+                             limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Lazily yield posts from a subreddit, fetching further pages on demand."""
+        return self._iter_listing(f"{self._SUBREDDIT_URL}{_segment(subreddit)}/{_segment(sort)}.json", {}, limit)
+
+    def iter_search_posts(self, query: str, subreddit: Optional[str] = None,
+                          sort: str = "relevance", time_filter: str = "all",
+                          limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Lazily yield search results, fetching further pages on demand."""
+        params = {'q': query, 'sort': sort, 't': time_filter}
+        if subreddit:
+            params['restrict_sr'] = 'on'
+            return self._iter_listing(f"{self._SUBREDDIT_URL}{_segment(subreddit)}/search.json", params, limit)
+        return self._iter_listing(self._SEARCH_URL, params, limit)
+
+    def iter_user_posts(self, username: str, sort: str = "new",
+                        limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Lazily yield a user's submissions, fetching further pages on demand."""
+        return self._iter_listing(f"{self._USER_URL}{_segment(username)}/submitted.json", {'sort': sort}, limit)
+
     def set_request_delay(self, delay: float) -> None:
         """Set the delay between requests (in seconds)."""
         self.request_delay = max(0.1, delay)  # Minimum 0.1 seconds
@@ -438,46 +874,95 @@ class RedditCommunity(RedditAdapterProtocol):
 
     def batch_get_posts_with_comments(self, subreddit: str, sort: str = "hot", 
                                     post_limit: int = 25, comment_limit: int = 50,
-                                    progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Dict[str, Any]]:
-        """Batch extraction of posts with their comments for research purposes."""
+                                    progress_callback: Optional[Callable[[int, int], None]] = None,
+                                    concurrency: int = 10) -> List[Dict[str, Any]]:
+        """Batch extraction of posts with their comments for research purposes.
+
+        Comment fetches run on at most ``concurrency`` threads through the cached request path;
+        use ``abatch_get_posts_with_comments`` from async code.
+        """
         logger.info(f"Starting batch extraction from r/{subreddit}: {post_limit} posts, {comment_limit} comments each")
         
-        # Get posts
         posts_data = self.get_subreddit_posts(subreddit, sort=sort, limit=post_limit)
         if not posts_data or 'data' not in posts_data or 'children' not in posts_data['data']:
             logger.error(f"Failed to get posts from r/{subreddit}")
             return []
         
-        posts = posts_data['data']['children']
+        posts = [post['data'] for post in posts_data['data']['children'] if 'data' in post]
         logger.info(f"Retrieved {len(posts)} posts from r/{subreddit}")
         
-        results = []
-        for i, post in enumerate(posts):
-            if 'data' not in post:
-                continue
-                
-            post_data = post['data']
-            post_id = post_data.get('id', '')
-            
-            # Clean and extract post data
+        def fetch(post_data: Dict[str, Any]) -> Dict[str, Any]:
             cleaned_post = self._extract_clean_post_data(post_data)
+            comments = None
+            if self._wants_comments(post_data, comment_limit):
+                comments = self.get_comments(post_data['id'], limit=comment_limit)
+            cleaned_post['comments'] = comments if comments else []
+            return cleaned_post
+        
+        results = []
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(posts)))) as executor:
+            for cleaned_post in executor.map(fetch, posts):
+                results.append(cleaned_post)
+                # Call progress callback if provided
+                if progress_callback:
+                    progress_callback(len(results), len(posts))
+        
+        logger.info(f"Batch extraction completed: {len(results)} posts with comments")
+        return results
+
+    @staticmethod
+    def _wants_comments(post_data: Dict[str, Any], comment_limit: int) -> bool:
+        """Whether a batch should fetch comments for a post; comment_limit=0 means listing metadata only."""
+        return comment_limit > 0 and post_data.get('num_comments', 0) > 0 and bool(post_data.get('id'))
+
+    async def abatch_get_posts_with_comments(self, subreddit: str, sort: str = "hot",
+                                             post_limit: int = 25, comment_limit: int = 50,
+                                             progress_callback: Optional[Callable[[int, int], None]] = None,
+                                             concurrency: int = 10) -> List[Dict[str, Any]]:
+        """Batch extraction with comment fetches overlapped, at most ``concurrency`` in flight."""
+        logger.info(f"Starting batch extraction from r/{subreddit}: {post_limit} posts, {comment_limit} comments each")
+        
+        connector = aiohttp.TCPConnector(limit=concurrency * 2)
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers=dict(self.session.headers),
+        ) as session:
+            # Get posts
+            posts_data = await self.aget_subreddit_posts(session, subreddit, sort=sort, limit=post_limit)
+            if not posts_data or 'data' not in posts_data or 'children' not in posts_data['data']:
+                logger.error(f"Failed to get posts from r/{subreddit}")
+                return []
             
-            # Get comments for this post
-            if post_data.get('num_comments', 0) > 0 and post_id:
-                logger.debug(f"Extracting comments for post {i+1}/{len(posts)}: {post_id}")
-                comments = self.get_comments(post_id, limit=comment_limit)
-                cleaned_post['comments'] = comments if comments else []
-            else:
-                cleaned_post['comments'] = []
-            
-            results.append(cleaned_post)
+            posts = [post['data'] for post in posts_data['data']['children'] if 'data' in post]
+            logger.info(f"Retrieved {len(posts)} posts from r/{subreddit}")
             
-            # Call progress callback if provided
-            if progress_callback:
-                progress_callback(i + 1, len(posts))
+            semaphore = asyncio.Semaphore(concurrency)
+            completed = 0
+
+            async def fetch(post_data: Dict[str, Any]) -> Dict[str, Any]:
+                nonlocal completed
+                # Clean and extract post data
+                cleaned_post = self._extract_clean_post_data(post_data)
+                
+                # Get comments for this post
+                if self._wants_comments(post_data, comment_limit):
+                    async with semaphore:
+                        comments = await self.aget_comments(session, post_data['id'], limit=comment_limit)
+                    cleaned_post['comments'] = comments if comments else []
+                else:
+                    cleaned_post['comments'] = []
+                
+                # Call progress callback if provided
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, len(posts))
+                return cleaned_post
+
+            results = await asyncio.gather(*(fetch(post_data) for post_data in posts))
         
         logger.info(f"Batch extraction completed: {len(results)} posts with comments")
-        return results
+        return list(results)
 
     def search_and_extract(self, query: str, subreddit: Optional[str] = None,
                           sort: str = "relevance", time_filter: str = "all",
@@ -494,30 +979,63 @@ class RedditCommunity(RedditAdapterProtocol):
             logger.warning(f"No search results found for '{query}'")
             return []
         
-        posts = search_results['data']['children']
+        posts = [post['data'] for post in search_results['data']['children'] if 'data' in post]
         logger.info(f"Found {len(posts)} posts for query '{query}'")
         
+        # Posts whose comments are requested; fetched by a producer thread while this thread cleans posts
+        wanted = [post_data.get('id', '') for post_data in posts
+                  if include_comments and post_data.get('num_comments', 0) > 0 and post_data.get('id')]
+        wanted_ids = set(wanted)
+        comments_queue: Queue = Queue(maxsize=4)  # Bounded so fetching can't run far ahead of cleaning
+        stop = Event()  # Set once this thread stops reading, so the producer never blocks on a full queue
+        errors: List[BaseException] = []
+
+        def put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    comments_queue.put(item, timeout=0.5)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for post_id in wanted:
+                    if not put((post_id, self.get_comments(post_id, limit=comment_limit))):
+                        return
+            except BaseException as e:
+                errors.append(e)  # Re-raised on the calling thread (e.g. RateLimitError)
+            finally:
+                put(None)
+
+        producer = Thread(target=produce, daemon=True)
+        producer.start()
+        
         results = []
-        for post in posts:
-            if 'data' not in post:
-                continue
-                
-            post_data = post['data']
-            cleaned_post = self._extract_clean_post_data(post_data)
-            
-            # Extract comments if requested
-            if include_comments and post_data.get('num_comments', 0) > 0:
+        comments_by_id: Dict[str, List[Dict[str, Any]]] = {}
+        drained = False
+        try:
+            for post_data in posts:
+                cleaned_post = self._extract_clean_post_data(post_data)
                 post_id = post_data.get('id', '')
-                if post_id:
-                    comments = self.get_comments(post_id, limit=comment_limit)
-                    cleaned_post['comments'] = comments if comments else []
-                else:
-                    cleaned_post['comments'] = []
-            else:
-                cleaned_post['comments'] = []
-            
-            results.append(cleaned_post)
-        
+                if post_id in wanted_ids:
+                    # Comments arrive in request order, so drain until this post's have landed
+                    while not drained and post_id not in comments_by_id:
+                        item = comments_queue.get()
+                        if item is None:
+                            drained = True
+                        else:
+                            comments_by_id[item[0]] = item[1] or []
+                    if errors:
+                        break
+                cleaned_post['comments'] = comments_by_id.pop(post_id, [])
+                results.append(cleaned_post)
+        finally:
+            stop.set()
+            producer.join()
+        if errors:
+            raise errors[0]
         return results
 
     def get_user_activity_summary(self, username: str, post_limit: int = 25, 
@@ -525,14 +1043,20 @@ class RedditCommunity(RedditAdapterProtocol):
         """Get comprehensive user activity summary for research."""
         logger.info(f"Getting activity summary for user u/{username}")
         
-        # Get user info
-        user_info = self.get_user_info(username)
+        # The three lookups are independent, so issue them together; the limiter is thread-safe
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            info_future = executor.submit(self.get_user_info, username)
+            posts_future = executor.submit(self.get_user_posts, username, limit=post_limit)
+            comments_future = executor.submit(self.get_user_comments, username, limit=comment_limit)
+            user_info = info_future.result()
+            user_posts_data = posts_future.result()
+            user_comments_data = comments_future.result()
+        
         if not user_info:
             logger.error(f"Could not retrieve info for user u/{username}")
             return {}
         
         # Get user posts
-        user_posts_data = self.get_user_posts(username, limit=post_limit)
         user_posts = []
         if user_posts_data and 'data' in user_posts_data and 'children' in user_posts_data['data']:
             for post in user_posts_data['data']['children']:
@@ -540,28 +1064,21 @@ class RedditCommunity(RedditAdapterProtocol):
                     user_posts.append(self._extract_clean_post_data(post['data']))
         
         # Get user comments
-        user_comments_data = self.get_user_comments(username, limit=comment_limit)
         user_comments = []
         if user_comments_data and 'data' in user_comments_data and 'children' in user_comments_data['data']:
             for comment in user_comments_data['data']['children']:
                 if 'data' in comment:
                     user_comments.append(self._extract_clean_comment_data(comment['data']))
         
-        # Calculate summary statistics
-        total_post_score = sum(post.get('score', 0) for post in user_posts)
-        total_comment_score = sum(comment.get('score', 0) for comment in user_comments)
+        # Calculate summary statistics (extracted records always carry 'score' and 'subreddit')
+        get_score = itemgetter('score')
+        get_subreddit = itemgetter('subreddit')
+        total_post_score = sum(map(get_score, user_posts))
+        total_comment_score = sum(map(get_score, user_comments))
         
         # Get subreddit activity
-        post_subreddits = {}
-        comment_subreddits = {}
-        
-        for post in user_posts:
-            subreddit = post.get('subreddit', 'unknown')
-            post_subreddits[subreddit] = post_subreddits.get(subreddit, 0) + 1
-        
-        for comment in user_comments:
-            subreddit = comment.get('subreddit', 'unknown')
-            comment_subreddits[subreddit] = comment_subreddits.get(subreddit, 0) + 1
+        post_subreddits = Counter(map(get_subreddit, user_posts))
+        comment_subreddits = Counter(map(get_subreddit, user_comments))
         
         summary = {
             'user_info': {
@@ -577,14 +1094,14 @@ class RedditCommunity(RedditAdapterProtocol):
                 'data': user_posts,
                 'total_score': total_post_score,
                 'average_score': total_post_score / len(user_posts) if user_posts else 0,
-                'subreddit_distribution': post_subreddits,
+                'subreddit_distribution': dict(post_subreddits),
             },
             'comments': {
                 'count': len(user_comments),
                 'data': user_comments,
                 'total_score': total_comment_score,
                 'average_score': total_comment_score / len(user_comments) if user_comments else 0,
-                'subreddit_distribution': comment_subreddits,
+                'subreddit_distribution': dict(comment_subreddits),
             },
             'extraction_metadata': {
                 'extracted_at': time.time(),
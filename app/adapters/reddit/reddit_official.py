@@ -2,74 +2,366 @@
 # This module implements a Reddit adapter for interacting with the official Reddit API using PRAW (Python Reddit API Wrapper).
 # This adapter uses the official PRAW library to interact with Reddit's API.
 
+import asyncio
+import hashlib
+import inspect
+import math
 import os
+import re
 import praw
+import prawcore
+from praw.models import MoreComments
+import requests
+from requests.adapters import HTTPAdapter
 import time
+import weakref
 import random
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from queue import Queue, Empty, Full
+from threading import Event, Lock, Thread
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Union, Iterator, Iterable, Callable, Mapping
 import logging
-from functools import wraps
-from .base import RedditAdapterProtocol
+from functools import lru_cache, wraps
+from itertools import count
 from .exceptions import AuthenticationError, APIError, RateLimitError
+from .rate import RateBudget, TokenBucket, RedisWindowLimiter
+from .singleflight import SingleFlight
+from .caching import InMemoryBackend
+from .jsonutil import loads as json_loads, dumps as json_dumps, dumps_sorted as json_dumps_sorted
 
 logger = logging.getLogger(__name__)
 
+# Authenticated clients shared across adapter instances, keyed by a digest of every credential
+# plus the session they send through: key -> (praw.Reddit, RateBudget, user_agent); bounded LRU
+_REDDIT_INSTANCE_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_REDDIT_INSTANCE_CACHE_SIZE = 8
+_REDDIT_INSTANCE_LOCK = Lock()
+
+# Comment bodies left behind by deletion/moderation; such comments are skipped
+_DELETED_BODIES = frozenset({'[deleted]', '[removed]'})
+
+# Common words ignored when extracting trending keywords from titles
+_STOPWORDS = frozenset({'this', 'that', 'with', 'from', 'they', 'have', 'been', 'were', 'said',
+                        'what', 'when', 'where', 'will', 'there', 'their'})
+_MIN_KEYWORD_LEN = 4
+
+# Prefix turning Reddit's relative permalinks into full URLs
+_REDDIT_BASE = 'https://reddit.com'
+_SUBREDDIT_URL = _REDDIT_BASE + '/r/'
+
+# Output fields of a post dictionary and the value used when Reddit omits one, in output order
+_POST_DEFAULTS = {
+    'id': None, 'title': '', 'author': None, 'score': 0, 'upvote_ratio': 0, 'url': '',
+    'created_utc': 0, 'num_comments': 0, 'selftext': '', 'subreddit': None, 'permalink': '',
+    'is_self': False, 'over_18': False, 'spoiler': False, 'locked': False, 'archived': False,
+    'distinguished': None, 'stickied': False, 'domain': '',
+}
+_POST_DETAIL_DEFAULTS = {
+    **_POST_DEFAULTS, 'gilded': 0, 'total_awards_received': 0, 'edited': False,
+    'thumbnail': '', 'preview': {},
+}
+
+def _post_to_dict(data: Mapping[str, Any], defaults: Mapping[str, Any] = _POST_DEFAULTS) -> Dict[str, Any]:
+    """Build a post dictionary from raw post data (listing JSON or a PRAW object's attributes)."""
+    get = data.get
+    post = {name: get(name, default) for name, default in defaults.items()}
+    # PRAW keeps author/subreddit as Redditor/Subreddit objects; str() gives their names
+    author = post['author']
+    post['author'] = str(author) if author else '[deleted]'
+    if post['subreddit'] is not None:
+        post['subreddit'] = str(post['subreddit'])
+    post['permalink'] = _REDDIT_BASE + post['permalink']
+    return post
+
+# Wait time in RATELIMIT messages ("Take a break for 4 seconds..."); "с" is the Cyrillic seconds abbreviation
+_RATELIMIT_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(milli|second|minute|с)", re.I)
+_RATELIMIT_UNITS = {"milli": 0.001, "second": 1.0, "minute": 60.0, "с": 1.0}
+
+# RedditAPIException error types that mean "slow down"
+_RATELIMIT_CODES = frozenset({'RATELIMIT', 'TOO_MANY_REQUESTS'})
+# Upper bound for a computed retry backoff; waits Reddit asks for explicitly are honoured as-is
+_MAX_BACKOFF = 60.0
+# Rate limiting as it shows up in the message of any other exception
+_RATELIMIT_MESSAGE_RE = re.compile(r"\b(?:429\b|too many requests|rate.?limit)", re.I)
+
+def _parse_ratelimit_delay(message: str) -> Optional[float]:
+    """Seconds Reddit asked us to wait in a RATELIMIT message, or None if it names no duration."""
+    match = _RATELIMIT_RE.search(message or "")
+    if match is None:
+        return None
+    return float(match.group(1)) * _RATELIMIT_UNITS[match.group(2).lower()]
+
+def _next_backoff(prev: float, base: float, rand: Callable[[], float]) -> float:
+    """Decorrelated jitter: a random wait between base and three times the previous one, capped."""
+    return min(_MAX_BACKOFF, base + (3.0 * prev - base) * rand())
+
+class _RateHeaderHook:
+    """requests response hook feeding X-Ratelimit-* headers into a rate budget.
+
+    Holds only the budget, not the adapter, so a client shared through _REDDIT_INSTANCE_CACHE
+    doesn't keep the adapter that built it alive.
+    """
+    __slots__ = ("budget",)
+
+    def __init__(self, budget: RateBudget):
+        self.budget = budget
+
+    def __call__(self, response, *args, **kwargs):
+        # Headers replayed from the HTTP cache describe an old window
+        if not getattr(response, 'from_cache', False):
+            self.budget.update(response.headers)
+        return response
+
+class _CountingRequestor(prawcore.Requestor):
+    """prawcore requestor that tallies responses served from the on-disk HTTP cache."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def request(self, *args, **kwargs):
+        response = super().request(*args, **kwargs)
+        if getattr(response, 'from_cache', False):
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+        return response
+
+def _slow_down(bucket: Optional[TokenBucket]) -> None:
+    """Halve the burst bucket's refill rate after Reddit signalled a rate limit."""
+    if bucket is None or math.isinf(bucket.refill_rate):
+        return
+    bucket.penalize()
+    logger.info(f"Rate limited, request rate lowered to {bucket.refill_rate * 60:.1f}/min")
+
 def handle_rate_limit(max_retries: int = 3, base_delay: float = 1.0):
-    """Decorator to handle rate limiting with exponential backoff and jitter for anti-bot detection."""
+    """Decorator to handle rate limiting with decorrelated-jitter backoff for anti-bot detection."""
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
+            # Draw backoff jitter from the adapter's private RNG when decorating its methods
+            rand = (getattr(args[0], '_rng', None) or random).random if args else random.random
+            # The adapter's burst bucket slows down on rate limits and recovers on success (AIMD)
+            bucket = getattr(args[0], '_bucket', None) if args else None
+            delay = base_delay
             for attempt in range(max_retries + 1):
                 try:
-                    return func(*args, **kwargs)
+                    result = func(*args, **kwargs)
+                    if bucket is not None:
+                        bucket.recover()
+                    return result
                 except praw.exceptions.RedditAPIException as e:
-                    # Check if any of the errors are rate limit related
-                    for error in e.items:
-                        if error.error_type in ('RATELIMIT', 'TOO_MANY_REQUESTS'):
-                            if attempt == max_retries:
-                                logger.error(f"Reddit API rate limit exceeded after {max_retries} retries in {func.__name__}")
-                                raise RateLimitError(f"Reddit API rate limit exceeded: {error.message}")
-                            
-                            base_wait = base_delay * (2 ** attempt)
-                            jitter = random.uniform(0.5, 1.5)
-                            delay = base_wait * jitter
-                            logger.warning(f"Reddit API rate limit in {func.__name__}, retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries})")
-                            time.sleep(delay)
-                            break
-                    else:
+                    # Find the first rate limit related error, if any
+                    error = next((item for item in e.items if item.error_type in _RATELIMIT_CODES), None)
+                    if error is None:
                         # Not a rate limit error, re-raise
                         raise APIError(f"Reddit API error: {e}")
+                    if attempt == max_retries:
+                        logger.error(f"Reddit API rate limit exceeded after {max_retries} retries in {func.__name__}")
+                        raise RateLimitError(f"Reddit API rate limit exceeded: {error.message}")
+                    
+                    _slow_down(bucket)
+                    requested = _parse_ratelimit_delay(error.message)
+                    if requested is not None:
+                        # Sleep exactly as long as Reddit asked (plus a small buffer) instead of guessing
+                        delay = requested + 0.5
+                        logger.debug(f"Reddit requested a {requested:.1f}s break")
+                    else:
+                        delay = _next_backoff(delay, base_delay, rand)
+                    logger.warning(f"Reddit API rate limit in {func.__name__}, retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries})")
+                    time.sleep(delay)
                 except Exception as e:
                     # Catch other potential bot detection errors
-                    error_str = str(e).lower()
-                    if "429" in error_str or "too many requests" in error_str or "rate limit" in error_str:
-                        if attempt == max_retries:
-                            logger.error(f"Rate limit detected after {max_retries} retries in {func.__name__}")
-                            raise RateLimitError(f"Rate limit detected: {e}")
-                        
-                        # Longer delay for potential bot detection
-                        base_wait = base_delay * (3 ** attempt)  # More aggressive backoff
-                        jitter = random.uniform(1.0, 2.0)  # Higher jitter
-                        delay = base_wait * jitter
-                        logger.warning(f"Potential bot detection in {func.__name__}, backing off for {delay:.1f}s")
-                        time.sleep(delay)
-                    else:
+                    if not _RATELIMIT_MESSAGE_RE.search(str(e)):
                         raise
-                        
+                    if attempt == max_retries:
+                        logger.error(f"Rate limit detected after {max_retries} retries in {func.__name__}")
+                        raise RateLimitError(f"Rate limit detected: {e}")
+                    
+                    _slow_down(bucket)
+                    # Each wait is drawn relative to the last, so retrying clients spread out
+                    delay = _next_backoff(delay, base_delay, rand)
+                    logger.warning(f"Potential bot detection in {func.__name__}, backing off for {delay:.1f}s")
+                    time.sleep(delay)
+            
+            # Only reachable when max_retries < 0 left no attempt at all; never return None silently
+            raise RateLimitError(f"No attempts made for {func.__name__} (max_retries={max_retries})")
+        return wrapper
+    return decorator
+
+# Values derived from a PRAW object's raw attributes (``vars(item)``) rather than copied as-is
+def _author_name(data: Mapping[str, Any]) -> str:
+    author = data.get('author')
+    return str(author) if author else '[deleted]'
+
+def _subreddit_name(data: Mapping[str, Any]) -> Optional[str]:
+    subreddit = data.get('subreddit')  # A Subreddit whose str() is its display name
+    return str(subreddit) if subreddit is not None else None
+
+def _full_permalink(data: Mapping[str, Any]) -> str:
+    return _REDDIT_BASE + data.get('permalink', '')
+
+def _selftext(data: Mapping[str, Any]) -> str:
+    return data.get('selftext', '')
+
+def _has_live_body(data: Mapping[str, Any]) -> bool:
+    body = data.get('body')
+    return body is not None and body not in _DELETED_BODIES
+
+def _flight_arg(value: Any) -> Any:
+    # Lists (e.g. of subreddits) are unhashable; key on an equivalent tuple
+    return tuple(value) if isinstance(value, list) else value
+
+def single_flight(func):
+    """Decorator coalescing concurrent identical calls on one adapter into a single fetch."""
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        key = (func.__name__, tuple(_flight_arg(a) for a in args),
+               tuple(sorted((k, _flight_arg(v)) for k, v in kwargs.items())))
+        return self._flight.do(key, lambda: func(self, *args, **kwargs))
+    return wrapper
+
+def _memo_arg(value: Any) -> Any:
+    # Round datetimes to the minute so "now"-relative timeframes still share a cache entry
+    if isinstance(value, datetime):
+        return value.replace(second=0, microsecond=0)
+    return value
+
+_JSON_TYPES = frozenset({str, int, float, bool, type(None)})
+
+def _round_trips(value: Any) -> bool:
+    """Whether JSON decoding gives back exactly this value (plain dicts with str keys, lists, scalars)."""
+    kind = type(value)
+    if kind is dict:
+        return all(type(k) is str and _round_trips(v) for k, v in value.items())
+    if kind is list:
+        return all(_round_trips(v) for v in value)
+    return kind in _JSON_TYPES
+
+# "new" listings this small are usually polled for freshness, so they are never memoized
+_FRESH_LISTING_LIMIT = 25
+
+def _fresh_listing(arguments: Mapping[str, Any]) -> bool:
+    # limit=None asks for the whole listing, which is never a freshness poll
+    limit = arguments.get('limit')
+    return arguments.get('sort') == 'new' and limit is not None and limit <= _FRESH_LISTING_LIMIT
+
+def memoize(ttl: float, skip: Optional[Callable[[Mapping[str, Any]], bool]] = None):
+    """Decorator caching a read method's result per arguments for ``ttl`` seconds.
+
+    Arguments are bound to the method's signature, so positional and keyword spellings of a
+    call share an entry. Concurrent misses on the same arguments share one call. Calls made
+    with ``stream=True`` return a live generator and bypass the cache, as do calls whose bound
+    arguments match ``skip`` and results JSON can't reproduce exactly. ``raw=True`` returns the result as JSON bytes, straight from the
+    cache on a hit.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(self, *args, raw: bool = False, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            if arguments.get('stream'):
+                return func(self, *args, **kwargs)
+            if skip is not None and skip(arguments):
+                result = func(self, *args, **kwargs)
+                return json_dumps(result) if raw else result
+            params = {name: _memo_arg(value) for name, value in arguments.items() if name != 'self'}
+            key = f"{func.__name__}:{hashlib.blake2b(json_dumps_sorted(params), digest_size=16).hexdigest()}"
+            encoded = self._memo.get(key)
+            if encoded is None:
+                def load():
+                    result = func(self, *args, **kwargs)
+                    if result is None or not _round_trips(result):
+                        return result, None
+                    encoded = json_dumps(result)
+                    self._memo.setex(key, ttl, encoded)
+                    return result, encoded
+                
+                result, encoded = self._flight.do(key, load)
+                if not raw:
+                    return result
+                if encoded is None:
+                    return json_dumps(result)
+            return encoded if raw else json_loads(encoded)
         return wrapper
     return decorator
 
-class RedditOfficial(RedditAdapterProtocol):
+class RedditOfficial:
     """Official Reddit API adapter using PRAW (Python Reddit API Wrapper)."""
+    # Fixed attribute layout; no per-instance __dict__ when many adapters coexist
+    __slots__ = (
+        "client_id", "client_secret", "user_agent", "reddit", "_session", "timeout",
+        "username", "password", "max_retries", "base_delay", "_request_delay", "_pacer",
+        "_last_request_time", "_pace_lock", "use_random_delays", "min_jitter", "max_jitter",
+        "burst_protection", "_max_requests_per_minute", "_bucket", "_shared_limiter",
+        "prefer_authenticated", "rate_budget", "_rng", "_flight", "_memo", "_http_cache",
+        "_owns_session", "_subreddit_cache", "server_pacing",
+    )
+    # Listing sorts that map directly onto PRAW listing methods
+    _SUBREDDIT_SORTS = frozenset({"hot", "new", "top", "rising"})
+    _USER_SORTS = frozenset({"hot", "new", "top"})
+    _USER_COMMENT_SORTS = frozenset({"new", "top"})
+    # Output fields per listing, in order; names mapped to a callable are derived from the raw
+    # attributes, the rest are copied from them
+    _SEARCH_FIELDS = ('id', 'title', ('author', _author_name), 'score', 'url', 'created_utc',
+                      'num_comments', ('selftext', _selftext), ('subreddit', _subreddit_name),
+                      ('permalink', _full_permalink))
+    _USER_POST_FIELDS = ('id', 'title', ('author', _author_name), 'score', 'url', 'created_utc',
+                         'num_comments', ('selftext', _selftext), ('subreddit', _subreddit_name))
+    _USER_COMMENT_FIELDS = ('id', ('author', _author_name), 'body', 'score', 'created_utc',
+                            ('subreddit', _subreddit_name), 'link_id')
+    # Lookups are memoized here, so the factory doesn't wrap this adapter in another cache
+    caches_responses = True
+    # Seconds results of simple lookups are reused (Reddit caches most pages about this long);
+    # subreddit metadata rarely changes, so it is kept longer
+    RESPONSE_TTL = 30
+    SUBREDDIT_INFO_TTL = 300
+    # Requests allowed back-to-back before request_delay spacing kicks in
+    PACER_BURST = 5
+    # Smallest gap between requests while pacing from Reddit's rate limit headers
+    MIN_REQUEST_INTERVAL = 0.1
+    # Things per /api/info request (Reddit's maximum)
+    INFO_BATCH_SIZE = 100
+    # Items per listing request (Reddit's maximum)
+    PAGE_SIZE = 100
+    # Reddit stops paginating a listing after about this many items
+    MAX_LISTING_SIZE = 1000
+    # Reply depth requested from the comments endpoint
+    COMMENT_DEPTH = 10
+    # Seconds a listing iterator's prefetch thread waits for the caller before giving up
+    PREFETCH_IDLE_TIMEOUT = 300.0
+    # Keep-alive connections per host when the adapter owns PRAW's HTTP session
+    POOL_SIZE = 32
     
-    def __init__(self, client_id: str = "", client_secret: str = "", user_agent: str = ""):
+    def __init__(self, client_id: str = "", client_secret: str = "", user_agent: str = "",
+                 session: Optional[requests.Session] = None, timeout: int = 30):
         # Use environment variables if not provided
         self.client_id = client_id or os.getenv('REDDIT_CLIENT_ID', '')
         self.client_secret = client_secret or os.getenv('REDDIT_CLIENT_SECRET', '')
         self.user_agent = user_agent or os.getenv('REDDIT_USER_AGENT', 'Earthworm Reddit Adapter 1.0')
         self.reddit: Optional[praw.Reddit] = None
         
+        # Shared HTTP session handed to PRAW so connections are kept alive across calls
+        self._session = session
+        # Optional on-disk cache of GET responses that survives restarts (requires requests-cache).
+        # The factory passes it in as the session when RedditConfig.http_cache is set; standalone
+        # adapters build their own from REDDIT_HTTP_CACHE.
+        self._http_cache = session if hasattr(session, 'cache_disabled') else None
+        cache_name = os.getenv('REDDIT_HTTP_CACHE', '')
+        if cache_name and session is None:
+            self._http_cache = self._build_http_cache(cache_name, float(os.getenv('REDDIT_HTTP_CACHE_TTL', '300')))
+            self._session = self._http_cache
+        # Sessions from the caller come with their own pooling; only ours get a pool mounted
+        self._owns_session = session is None
+        self.timeout = timeout
+        
         # Optional username/password for more authenticated access
         self.username = os.getenv('REDDIT_USERNAME', '')
         self.password = os.getenv('REDDIT_PASSWORD', '')
@@ -80,66 +372,242 @@ class RedditOfficial(RedditAdapterProtocol):
         # Rate limiting configuration with anti-bot detection measures
         self.max_retries = int(os.getenv('REDDIT_MAX_RETRIES', '3'))
         self.base_delay = float(os.getenv('REDDIT_BASE_DELAY', '2.0'))  # Increased default delay
+        # Spaces requests request_delay apart on average, letting short bursts through immediately
+        self._pacer = TokenBucket(capacity=self.PACER_BURST)
         self.request_delay = float(os.getenv('REDDIT_REQUEST_DELAY', '0.5'))  # Increased minimum delay
-        self._last_request_time = 0.0
+        self._last_request_time = 0.0  # Send time of the latest request, reserved in _enforce_rate_limit
+        self._pace_lock = Lock()
+        # Once Reddit has reported its budget, pace by that instead of request_delay
+        self.server_pacing = os.getenv('REDDIT_SERVER_PACING', 'true').lower() == 'true'
         
         # Anti-bot detection features
         self.use_random_delays = bool(os.getenv('REDDIT_RANDOM_DELAYS', 'True').lower() == 'true')
         self.min_jitter = float(os.getenv('REDDIT_MIN_JITTER', '0.3'))
         self.max_jitter = float(os.getenv('REDDIT_MAX_JITTER', '1.2'))
+        self._rng = random.Random()  # Private RNG; avoids contending on the module-global one
+        self._flight = SingleFlight()  # Identical concurrent reads share one request
+        self._memo = InMemoryBackend(maxsize=1024)  # Results of @memoize'd read methods
+        self._subreddit_cache = None  # Lazy Subreddit proxies, built per client on first use
         self.burst_protection = bool(os.getenv('REDDIT_BURST_PROTECTION', 'True').lower() == 'true')
+        # Token bucket for burst protection: holds up to max_requests_per_minute, refills at that rate
+        self._bucket = TokenBucket()
         self.max_requests_per_minute = int(os.getenv('REDDIT_MAX_REQUESTS_PER_MINUTE', '30'))
-        self._request_times = []  # Track request times for burst protection
+        # Optionally share the per-minute budget with every worker through Redis
+        self._shared_limiter = None
+        if os.getenv('REDDIT_DISTRIBUTED_RATELIMIT', 'false').lower() == 'true':
+            redis_url = os.getenv('REDDIT_RATELIMIT_URL') or os.getenv('REDDIT_CACHE_URL', 'redis://localhost:6379/0')
+            self._shared_limiter = RedisWindowLimiter(redis_url, f"reddit:rl:{self.client_id}")
+        # Budget reported in Reddit's X-Ratelimit-* headers; paces requests to the real ceiling
+        self.rate_budget = RateBudget()
         
         # Authentication preference - default to read-only for better reliability and anti-bot protection
         self.prefer_authenticated = bool(os.getenv('REDDIT_PREFER_AUTHENTICATED', 'false').lower() == 'true')
 
+    @property
+    def request_delay(self) -> float:
+        return self._request_delay
+
+    @request_delay.setter
+    def request_delay(self, delay: float) -> None:
+        self._request_delay = delay
+        self._pacer.set_rate(1.0 / delay if delay > 0 else math.inf)
+
+    @property
+    def max_requests_per_minute(self) -> int:
+        return self._max_requests_per_minute
+
+    @max_requests_per_minute.setter
+    def max_requests_per_minute(self, limit: int) -> None:
+        self._max_requests_per_minute = limit
+        self._bucket.capacity = limit
+        self._bucket.tokens = min(self._bucket.tokens, limit)
+        self._bucket.set_rate(limit / 60.0)
+
     def _enforce_rate_limit(self):
         """Enforce minimum delay between requests with human-like patterns to prevent bot detection."""
-        current_time = time.time()
-        
-        # Clean old request times (older than 1 minute)
-        if self.burst_protection:
-            self._request_times = [t for t in self._request_times if current_time - t < 60]
-            
-            # Check if we're approaching burst limits
-            if len(self._request_times) >= self.max_requests_per_minute:
-                wait_time = 60 - (current_time - self._request_times[0]) + random.uniform(1, 5)
-                logger.info(f"Burst protection: waiting {wait_time:.1f}s to avoid detection")
-                time.sleep(wait_time)
-                self._request_times = []  # Reset after waiting
-        
-        # Calculate delay since last request
-        time_since_last = current_time - self._last_request_time
-        base_delay = self.request_delay
-        
-        # Add random jitter to appear more human-like
-        if self.use_random_delays:
-            jitter = random.uniform(self.min_jitter, self.max_jitter)
-            delay_with_jitter = base_delay * jitter
-        else:
-            delay_with_jitter = base_delay
-        
-        if time_since_last < delay_with_jitter:
-            sleep_time = delay_with_jitter - time_since_last
-            logger.debug(f"Enforcing human-like delay: sleeping for {sleep_time:.3f}s")
-            time.sleep(sleep_time)
+        # Requests only wait once a bucket is empty; bursts within capacity go straight through.
+        # With a known header budget the fixed request_delay is replaced by a small floor; the
+        # budget delay below then does the pacing.
+        # Runs before every API call; each attribute is read once into a local
+        budget = self.rate_budget
+        # The shared budget is this client's quota across every worker, so it applies even
+        # with burst protection off; the local bucket only stands in when Redis is down.
+        # It blocks on its own, so it is taken before the pacing lock.
+        use_bucket = self.burst_protection
+        shared = self._shared_limiter
+        if shared is not None:
+            try:
+                shared.acquire(self._max_requests_per_minute)
+                use_bucket = False
+            except Exception as e:
+                logger.warning(f"Shared rate limiter unavailable ({e}), using local burst protection")
+                use_bucket = True
         
-        current_time = time.time()
-        self._last_request_time = current_time
+        # Concurrent callers (thread pools, prefetch threads) reserve their send time under the
+        # lock, so each one paces against the request queued before it rather than a stale time
+        with self._pace_lock:
+            now = time.monotonic()
+            time_since_last = now - self._last_request_time
+            if self.server_pacing and budget.remaining is not None:
+                wait = self.MIN_REQUEST_INTERVAL - time_since_last
+            else:
+                wait = self._pacer.consume()
+            if use_bucket:
+                wait = max(wait, self._bucket.consume())
+            
+            # Spread the remaining header budget evenly over the rest of the window
+            if budget.remaining is not None:
+                wait = max(wait, self._budget_delay() - time_since_last)
+            
+            # Jitter only throttled requests so the waits don't look machine-regular
+            if wait > 0 and self.use_random_delays:
+                wait *= 1.0 + 0.1 * self._rng.random()
+            self._last_request_time = now + max(wait, 0.0)
         
-        # Track this request for burst protection
-        if self.burst_protection:
-            self._request_times.append(current_time)
+        if wait > 0:
+            logger.debug(f"Enforcing human-like delay: sleeping for {wait:.3f}s")
+            time.sleep(wait)
+
+    def _budget_delay(self) -> float:
+        """Inter-request delay that spends the reported budget evenly: reset / max(remaining, 1)."""
+        budget = self.rate_budget.get_status()
+        if budget['remaining'] is None or budget['reset_in'] <= 0:
+            return 0.0  # No headers seen yet (or window over); fall back to the static delay
+        return budget['reset_in'] / max(budget['remaining'], 1)
+
+    @staticmethod
+    def _build_http_cache(cache_name: str, ttl: float) -> requests.Session:
+        """SQLite-backed requests-cache session; only GETs are cached, stale entries cover errors."""
+        try:
+            import requests_cache
+        except ImportError as e:
+            raise ImportError("REDDIT_HTTP_CACHE requires the 'requests-cache' package (pip install requests-cache)") from e
+
+        return requests_cache.CachedSession(cache_name=cache_name, backend='sqlite',
+                                            expire_after=timedelta(seconds=ttl),
+                                            allowable_methods=('GET',), stale_if_error=True)
+
+    def _requestor(self) -> prawcore.Requestor:
+        """The prawcore requestor PRAW sends requests through."""
+        return self.reddit._core._authorizer._authenticator._requestor
+
+    def _http_session(self) -> requests.Session:
+        """The requests session PRAW's requestor sends through."""
+        return self._requestor()._http
+
+    def _install_rate_hook(self) -> None:
+        """Attach the rate header hook to the session PRAW sends requests through."""
+        hooks = self._http_session().hooks['response']
+        # One budget per session: a client rebuilt on a shared session (say after it fell out of
+        # _REDDIT_INSTANCE_CACHE) adopts the budget already fed there instead of stacking hooks
+        for hook in hooks:
+            if isinstance(hook, _RateHeaderHook):
+                self.rate_budget = hook.budget
+                return
+        hooks.append(_RateHeaderHook(self.rate_budget))
+
+    def _install_connection_pool(self) -> None:
+        """Mount a larger keep-alive pool on PRAW's session so concurrent calls skip new TLS handshakes."""
+        if not self._owns_session:
+            return
+        try:
+            session = self._http_session()
+        except AttributeError:
+            logger.debug("PRAW session not reachable; keeping its default connection pool")
+            return
+        # Retries are handled by handle_rate_limit and prawcore, so the adapter itself never retries
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=self.POOL_SIZE, max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers['Accept-Encoding'] = 'gzip, deflate'
+
+    def _last_request_wall_time(self) -> float:
+        """Wall-clock time of the last request (pacing itself runs on the monotonic clock)."""
+        if not self._last_request_time:
+            return 0.0
+        return time.time() - (time.monotonic() - self._last_request_time)
+
+    def _requestor_kwargs(self) -> Dict[str, Any]:
+        """Build prawcore requestor arguments, reusing the shared session if provided."""
+        kwargs: Dict[str, Any] = {'timeout': self.timeout}
+        if self._session is not None:
+            kwargs['session'] = self._session
+        return kwargs
+
+    def uncached(self):
+        """Context manager that sends requests past the on-disk HTTP cache (e.g. for fresh listings).
+
+        The cache is switched off session-wide for the duration, so avoid overlapping it with other threads.
+        """
+        if self._http_cache is None:
+            return nullcontext()
+        return self._http_cache.cache_disabled()
+
+    def clear_cache(self) -> None:
+        """Drop memoized results and every response stored in the on-disk HTTP cache."""
+        self._memo.delete_prefix('')
+        if self._http_cache is not None:
+            self._http_cache.cache.clear()
+
+    def get_http_cache_stats(self) -> Dict[str, Any]:
+        """Get on-disk HTTP cache hit/miss counters for monitoring."""
+        if self._http_cache is None:
+            return {'enabled': False}
+        requestor = self._requestor() if self.reddit is not None else None
+        return {
+            'enabled': True,
+            'hits': getattr(requestor, 'cache_hits', 0),
+            'misses': getattr(requestor, 'cache_misses', 0),
+            'cached_responses': len(self._http_cache.cache.responses),
+        }
+
+    @staticmethod
+    def to_json_bytes(payload: Any) -> bytes:
+        """Serialize a result to JSON bytes (with orjson when installed), e.g. for HTTP responses."""
+        return json_dumps(payload)
+
+    def close(self) -> None:
+        """Close the HTTP session this adapter was given and release its pooled connections.
+
+        Other adapters may share that session (see RedditAdapterFactory.official_session); it
+        reopens connections when they next use it. Clients on PRAW's own session may be shared
+        too (see authenticate), so their session is left open for them.
+        """
+        if self._session is not None:
+            self._session.close()
+
+    def _client_cache_key(self) -> str:
+        """Digest of every credential that shapes the PRAW client, so secrets aren't kept as keys.
+
+        A client sends through the session it was built on, so only adapters given the same
+        session (e.g. the factory's per-config session) or none at all can share it. The cached
+        client keeps its session alive, so the id can't be reused while the entry exists.
+        """
+        session = str(id(self._session)) if self._session is not None else ''
+        parts = (self.client_id, self.client_secret, self.username, self.password,
+                 str(self.prefer_authenticated), session)
+        return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
 
     def authenticate(self) -> bool:
         """Initialize PRAW Reddit instance with environment credentials and anti-bot measures."""
 
         
         try:
+            self._clear_praw_caches()
             if not self.client_id or not self.client_secret:
                 raise AuthenticationError("Reddit API credentials not found. Please set REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET in .env file")
             
+            # Reuse a client already built for these credentials and session instead of constructing a new one
+            cache_key = self._client_cache_key()
+            with _REDDIT_INSTANCE_LOCK:
+                cached = _REDDIT_INSTANCE_CACHE.get(cache_key)
+                if cached is not None:
+                    _REDDIT_INSTANCE_CACHE.move_to_end(cache_key)
+            if cached is not None:
+                self.reddit, self.rate_budget, self.user_agent = cached
+                logger.debug("Reusing cached Reddit client")
+                return True
+            
             # Make user agent more realistic if default is being used
             if self.user_agent == 'Earthworm Reddit Adapter 1.0':
                 # Use more human-like user agents
@@ -149,12 +617,12 @@ class RedditOfficial(RedditAdapterProtocol):
                     'Academic Research Tool v1.0',
                     'Social Media Analytics Bot 1.0'
                 ]
-                self.user_agent = random.choice(user_agents)
+                self.user_agent = self._rng.choice(user_agents)
                 logger.debug(f"Using randomized user agent for better compatibility")
             
             # Add small random delay before authentication to appear more human
             if self.use_random_delays:
-                auth_delay = random.uniform(0.5, 2.0)
+                auth_delay = self._rng.uniform(0.5, 2.0)
                 logger.debug(f"Pre-auth delay: {auth_delay:.1f}s")
                 time.sleep(auth_delay)
             
@@ -170,8 +638,12 @@ class RedditOfficial(RedditAdapterProtocol):
                         user_agent=self.user_agent,
                         username=self.username,
                         password=self.password,
-                        check_for_async=False  # Disable async checking for better compatibility
+                        check_for_async=False,  # Disable async checking for better compatibility
+                        requestor_class=_CountingRequestor if self._http_cache is not None else None,
+                        requestor_kwargs=self._requestor_kwargs()
                     )
+                    self._install_rate_hook()
+                    self._install_connection_pool()
                     # Test authentication immediately
                     self.reddit.user.me()
                     logger.info("✅ Successfully authenticated with username/password")
@@ -189,26 +661,142 @@ class RedditOfficial(RedditAdapterProtocol):
                     client_id=self.client_id,
                     client_secret=self.client_secret,
                     user_agent=self.user_agent,
-                    check_for_async=False
+                    check_for_async=False,
+                    requestor_class=_CountingRequestor if self._http_cache is not None else None,
+                    requestor_kwargs=self._requestor_kwargs()
                 )
+                self._install_rate_hook()
+                self._install_connection_pool()
             
-            # Test the connection by accessing a simple endpoint with delay
-            try:
-                # Add delay before test to avoid rapid requests
-                time.sleep(random.uniform(1.0, 2.0))
-                test_sub = self.reddit.subreddit("test")
-                _ = test_sub.display_name  # Simple property access to test
-                logger.info("✅ Successfully connected to Reddit Official API")
-                return True
-            except Exception as test_error:
-                logger.warning(f"Authentication test failed: {test_error}")
-                # Still return True if the reddit instance was created
-                return self.reddit is not None
+            # No network probe here; callers that need one use verify_connection()
+            with _REDDIT_INSTANCE_LOCK:
+                _REDDIT_INSTANCE_CACHE[cache_key] = (self.reddit, self.rate_budget, self.user_agent)
+                while len(_REDDIT_INSTANCE_CACHE) > _REDDIT_INSTANCE_CACHE_SIZE:
+                    _REDDIT_INSTANCE_CACHE.popitem(last=False)
+            logger.info("✅ Reddit Official API client ready")
+            return True
             
         except Exception as e:
             logger.error(f"Authentication failed: {e}")
             raise AuthenticationError(f"Failed to authenticate: {e}")
 
+    def verify_connection(self) -> bool:
+        """Issue one lightweight request to confirm the client can reach Reddit."""
+        if not self.reddit:
+            logger.warning("Not authenticated. Call authenticate() first.")
+            return False
+        
+        self._enforce_rate_limit()
+        try:
+            next(iter(self.reddit.subreddit("test").hot(limit=1)), None)
+            logger.info("✅ Successfully connected to Reddit Official API")
+            return True
+        except Exception as e:
+            logger.warning(f"Connection check failed: {e}")
+            return False
+
+    @staticmethod
+    def _submission_to_dict(post, defaults: Mapping[str, Any] = _POST_DEFAULTS) -> Dict[str, Any]:
+        """Convert a PRAW submission into the adapter's post dictionary."""
+        # Read the raw attributes PRAW stored; getattr() on a missing one would trigger a lazy fetch
+        return _post_to_dict(vars(post), defaults)
+
+    @staticmethod
+    def _extract_listing(items: Iterable, fields: tuple, description: str,
+                         keep: Optional[Callable[[Any], bool]] = None) -> Dict[str, Any]:
+        """Build the Reddit-style listing envelope from PRAW objects.
+
+        ``fields`` holds attribute names and ``(name, getter)`` pairs for derived values; both
+        read the attributes PRAW loaded with the listing page (``vars(item)``), so a missing
+        field is None rather than a lazy fetch. Items rejected by ``keep`` or failing
+        extraction are skipped.
+        """
+        children = []
+        for item in items:
+            try:
+                raw = vars(item)
+                if keep is not None and not keep(raw):
+                    continue
+                data = {}
+                for field in fields:
+                    if isinstance(field, tuple):
+                        data[field[0]] = field[1](raw)
+                    else:
+                        data[field] = raw.get(field)
+                children.append({'data': data})
+            except Exception as item_error:
+                logger.warning(f"Error processing {description}: {item_error}")
+        return {
+            'data': {
+                'children': children,
+                'after': None,
+                'before': None,
+            }
+        }
+
+    @staticmethod
+    def _json_to_dict(post: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a raw listing post (JSON ``data`` object) into the adapter's post dictionary."""
+        return _post_to_dict(post)
+
+    def _subreddit_listing(self, subreddit: str, sort: str, limit: Optional[int],
+                           time_filter: str = "all") -> Iterator[Dict[str, Any]]:
+        """Lazily yield raw post JSON for a subreddit sort, one paced page request at a time.
+
+        Reads the listing endpoint through ``reddit.request`` so posts are never hydrated
+        into PRAW Submission objects. ``time_filter`` applies to the "top" sort.
+        """
+        sort = sort if sort in self._SUBREDDIT_SORTS else "hot"
+        params: Dict[str, Any] = {"t": time_filter} if sort == "top" else {}
+        remaining = limit if limit is not None else self.MAX_LISTING_SIZE
+        while remaining > 0:
+            params["limit"] = min(remaining, self.PAGE_SIZE)
+            self._enforce_rate_limit()
+            page = self.reddit.request(method="GET", path=f"r/{subreddit}/{sort}", params=params)['data']
+            for child in page['children']:
+                yield child['data']
+            remaining -= len(page['children'])
+            if not page['children'] or not page.get('after'):
+                return
+            params["after"] = page['after']
+
+    def _subreddit(self, name: str) -> praw.models.Subreddit:
+        """Lazy Subreddit proxy for search calls, reused across calls.
+
+        The proxies are never fetched, so reusing them can't serve stale subreddit data.
+        """
+        if self._subreddit_cache is None:
+            self._subreddit_cache = lru_cache(maxsize=128)(self.reddit.subreddit)
+        return self._subreddit_cache(name)
+
+    def _clear_praw_caches(self) -> None:
+        """Forget PRAW objects bound to the current client (called whenever it is replaced)."""
+        self._subreddit_cache = None
+
+    def _paced(self, listing: Iterable) -> Iterator[Any]:
+        """Yield from a lazy PRAW listing, pacing before each pull that makes it fetch a page."""
+        items = iter(listing)
+        for index in count():
+            # PRAW requests PAGE_SIZE items at a time, when the previous page runs out
+            if index % self.PAGE_SIZE == 0:
+                self._enforce_rate_limit()
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+            yield item
+
+    def _user_submissions_listing(self, username: str, sort: str, limit: Optional[int]):
+        """Return the lazy PRAW listing generator for a user's submissions."""
+        submissions = self.reddit.redditor(username).submissions
+        return getattr(submissions, sort if sort in self._USER_SORTS else "new")(limit=limit)
+
+    def _user_comments_listing(self, username: str, sort: str, limit: Optional[int]):
+        """Return the lazy PRAW listing generator for a user's comments."""
+        comments = self.reddit.redditor(username).comments
+        return getattr(comments, sort if sort in self._USER_COMMENT_SORTS else "new")(limit=limit)
+
+    @memoize(ttl=RESPONSE_TTL)
     @handle_rate_limit(max_retries=3, base_delay=1.0)
     def get_user_info(self, username: str) -> Optional[Dict[str, Any]]:
         """Retrieve user information using PRAW."""
@@ -220,88 +808,48 @@ class RedditOfficial(RedditAdapterProtocol):
         
         try:
             user = self.reddit.redditor(username)
+            user._fetch()  # One request; every field below is read from the loaded data
+            data = vars(user)
             return {
-                'name': user.name,
-                'id': user.id,
-                'created_utc': user.created_utc,
-                'comment_karma': user.comment_karma,
-                'link_karma': user.link_karma,
-                'is_verified': getattr(user, 'verified', None),
-                'has_verified_email': getattr(user, 'has_verified_email', None)
+                'name': data.get('name', username),
+                'id': data.get('id'),
+                'created_utc': data.get('created_utc'),
+                'comment_karma': data.get('comment_karma'),
+                'link_karma': data.get('link_karma'),
+                'is_verified': data.get('verified'),
+                'has_verified_email': data.get('has_verified_email')
             }
             
         except Exception as e:
             logger.error(f"Failed to get user info for {username}: {e}")
             raise APIError(f"Failed to get user info: {e}")
 
+    @memoize(ttl=RESPONSE_TTL, skip=_fresh_listing)
     @handle_rate_limit(max_retries=3, base_delay=1.0)
-    def get_subreddit_posts(self, subreddit: str, sort: str = "hot", limit: int = 25) -> Optional[Dict[str, Any]]:
+    def get_subreddit_posts(self, subreddit: str, sort: str = "hot", limit: Optional[int] = 25) -> Optional[Dict[str, Any]]:
         """Get posts from a subreddit using PRAW with enhanced error handling."""
         if not self.reddit:
             logger.warning("Not authenticated. Call authenticate() first.")
             return None
-            
-        self._enforce_rate_limit()
         
-        try:
-            sub = self.reddit.subreddit(subreddit)
-            
-            # Get posts based on sort parameter
-            if sort == "hot":
-                posts = sub.hot(limit=limit)
-            elif sort == "new":
-                posts = sub.new(limit=limit)
-            elif sort == "top":
-                posts = sub.top(limit=limit, time_filter="all")
-            elif sort == "rising":
-                posts = sub.rising(limit=limit)
-            else:
-                posts = sub.hot(limit=limit)
-            
-            result = []
-            for post in posts:
-                try:
-                    post_data = {
-                        'id': post.id,
-                        'title': post.title,
-                        'author': str(post.author) if post.author else '[deleted]',
-                        'score': post.score,
-                        'upvote_ratio': getattr(post, 'upvote_ratio', 0),
-                        'url': post.url,
-                        'created_utc': post.created_utc,
-                        'num_comments': post.num_comments,
-                        'selftext': getattr(post, 'selftext', ''),
-                        'subreddit': post.subreddit.display_name,
-                        'permalink': f"https://reddit.com{post.permalink}",
-                        'is_self': post.is_self,
-                        'over_18': post.over_18,
-                        'spoiler': getattr(post, 'spoiler', False),
-                        'locked': getattr(post, 'locked', False),
-                        'archived': getattr(post, 'archived', False),
-                        'distinguished': getattr(post, 'distinguished', None),
-                        'stickied': getattr(post, 'stickied', False),
-                    }
-                    result.append(post_data)
-                except Exception as post_error:
-                    logger.warning(f"Error processing post {getattr(post, 'id', 'unknown')}: {post_error}")
-                    continue
-            
-            # Return in Reddit JSON API format for compatibility
-            return {
-                'data': {
-                    'children': [{'data': post} for post in result],
-                    'after': None,
-                    'before': None,
-                }
+        # The whole listing is collected anyway, so it is read on this thread without read-ahead;
+        # callers that don't need it all in memory should use iter_subreddit_posts
+        listing = self._subreddit_listing(subreddit, sort, limit)
+        children = list(self._iter_listing(listing, f"r/{subreddit}", convert=self._json_to_dict, prefetch=False))
+        
+        # Return in Reddit JSON API format for compatibility
+        return {
+            'data': {
+                'children': children,
+                'after': None,
+                'before': None,
             }
-            
-        except Exception as e:
-            logger.error(f"Failed to get posts from r/{subreddit}: {e}")
-            raise APIError(f"Failed to get posts: {e}")
+        }
 
+    @single_flight
     @handle_rate_limit(max_retries=3, base_delay=1.0)
     def get_comments(self, post_id: str, limit: int = 100) -> Optional[List[Dict[str, Any]]]:
-        """Get comments for a specific post using PRAW."""
+        """Get comments for a specific post with a single raw JSON request."""
         if not self.reddit:
             logger.warning("Not authenticated. Call authenticate() first.")
             return None
@@ -309,33 +857,18 @@ class RedditOfficial(RedditAdapterProtocol):
         self._enforce_rate_limit()
         
         try:
-            submission = self.reddit.submission(id=post_id)
-            submission.comments.replace_more(limit=0)  # Remove "more comments" objects
+            # One GET returns the whole tree with author/subreddit inlined, instead of
+            # building a lazy PRAW object per comment
+            response = self.reddit.request(
+                method="GET", path=f"comments/{post_id}",
+                params={"depth": self.COMMENT_DEPTH, "limit": limit, "threaded": "false"},
+            )
             
-            comments = []
-            for comment in submission.comments.list()[:limit]:
-                try:
-                    if hasattr(comment, 'body') and comment.body not in ['[deleted]', '[removed]']:
-                        comment_data = {
-                            'id': comment.id,
-                            'author': str(comment.author) if comment.author else '[deleted]',
-                            'body': comment.body,
-                            'score': comment.score,
-                            'created_utc': comment.created_utc,
-                            'parent_id': comment.parent_id,
-                            'link_id': comment.link_id,
-                            'subreddit': comment.subreddit.display_name,
-                            'permalink': f"https://reddit.com{comment.permalink}",
-                            'distinguished': getattr(comment, 'distinguished', None),
-                            'stickied': getattr(comment, 'stickied', False),
-                            'is_submitter': getattr(comment, 'is_submitter', False),
-                            'controversiality': getattr(comment, 'controversiality', 0),
-                            'depth': getattr(comment, 'depth', 0),
-                        }
-                        comments.append(comment_data)
-                except Exception as comment_error:
-                    logger.warning(f"Error processing comment: {comment_error}")
-                    continue
+            comments = [
+                self._comment_json_to_dict(comment)
+                for comment in self._walk_comment_tree(response[1]['data']['children'], limit)
+                if comment.get('body') not in _DELETED_BODIES
+            ]
             
             logger.info(f"Successfully extracted {len(comments)} comments from post {post_id}")
             return comments
@@ -344,6 +877,58 @@ class RedditOfficial(RedditAdapterProtocol):
             logger.error(f"Failed to get comments for post {post_id}: {e}")
             raise APIError(f"Failed to get comments: {e}")
 
+    @staticmethod
+    def _comment_json_to_dict(comment: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a raw comment (JSON ``data`` object) into the adapter's comment dictionary."""
+        get = comment.get
+        return {
+            'id': comment['id'],
+            'author': get('author') or '[deleted]',
+            'body': get('body', ''),
+            'score': get('score', 0),
+            'created_utc': get('created_utc', 0),
+            'parent_id': get('parent_id'),
+            'link_id': get('link_id'),
+            'subreddit': get('subreddit'),
+            'permalink': _REDDIT_BASE + get('permalink', ''),
+            'distinguished': get('distinguished'),
+            'stickied': get('stickied', False),
+            'is_submitter': get('is_submitter', False),
+            'controversiality': get('controversiality', 0),
+            'depth': get('depth', 0),
+        }
+
+    def _info(self, kind: str, ids: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """Yield raw JSON for things of one kind ("t1" comments, "t3" posts) looked up by id.
+
+        Ids are sent ``INFO_BATCH_SIZE`` per /api/info request; ids Reddit doesn't know are
+        simply absent from the output.
+        """
+        ids = list(ids)
+        for start in range(0, len(ids), self.INFO_BATCH_SIZE):
+            self._enforce_rate_limit()
+            fullnames = ",".join(f"{kind}_{thing_id}" for thing_id in ids[start:start + self.INFO_BATCH_SIZE])
+            listing = self.reddit.request(method="GET", path="api/info", params={"id": fullnames})
+            for child in listing['data']['children']:
+                yield child['data']
+
+    @staticmethod
+    def _walk_comment_tree(children: List[Dict[str, Any]], limit: int) -> Iterator[Dict[str, Any]]:
+        """Yield up to ``limit`` comment dicts breadth-first, skipping "more" stubs."""
+        queue = deque(children)
+        yielded = 0
+        while queue and yielded < limit:
+            child = queue.popleft()
+            if child.get('kind') != 't1':
+                continue
+            data = child['data']
+            replies = data.get('replies')
+            if replies:
+                queue.extend(replies['data']['children'])
+            yield data
+            yielded += 1
+
+    @single_flight
     @handle_rate_limit(max_retries=3, base_delay=1.0)
     def search_posts(self, query: str, subreddit: Optional[str] = None, 
                     sort: str = "relevance", time_filter: str = "all", 
@@ -356,44 +941,16 @@ class RedditOfficial(RedditAdapterProtocol):
         self._enforce_rate_limit()
         
         try:
-            if subreddit:
-                sub = self.reddit.subreddit(subreddit)
-                search_results = sub.search(query, sort=sort, time_filter=time_filter, limit=limit)
-            else:
-                search_results = self.reddit.subreddit("all").search(query, sort=sort, time_filter=time_filter, limit=limit)
+            sub = self._subreddit(subreddit or "all")
+            search_results = sub.search(query, sort=sort, time_filter=time_filter, limit=limit)
             
-            result = []
-            for post in search_results:
-                try:
-                    post_data = {
-                        'id': post.id,
-                        'title': post.title,
-                        'author': str(post.author) if post.author else '[deleted]',
-                        'score': post.score,
-                        'url': post.url,
-                        'created_utc': post.created_utc,
-                        'num_comments': post.num_comments,
-                        'selftext': getattr(post, 'selftext', ''),
-                        'subreddit': post.subreddit.display_name,
-                        'permalink': f"https://reddit.com{post.permalink}",
-                    }
-                    result.append(post_data)
-                except Exception as post_error:
-                    logger.warning(f"Error processing search result: {post_error}")
-                    continue
-            
-            return {
-                'data': {
-                    'children': [{'data': post} for post in result],
-                    'after': None,
-                    'before': None,
-                }
-            }
+            return self._extract_listing(search_results, self._SEARCH_FIELDS, "search result")
             
         except Exception as e:
             logger.error(f"Failed to search for '{query}': {e}")
             raise APIError(f"Failed to search: {e}")
 
+    @single_flight
     @handle_rate_limit(max_retries=3, base_delay=1.0)
     def get_user_posts(self, username: str, sort: str = "new", 
                       limit: int = 25) -> Optional[Dict[str, Any]]:
@@ -405,48 +962,15 @@ class RedditOfficial(RedditAdapterProtocol):
         self._enforce_rate_limit()
         
         try:
-            user = self.reddit.redditor(username)
+            posts = self._user_submissions_listing(username, sort, limit)
             
-            if sort == "new":
-                posts = user.submissions.new(limit=limit)
-            elif sort == "top":
-                posts = user.submissions.top(limit=limit)
-            elif sort == "hot":
-                posts = user.submissions.hot(limit=limit)
-            else:
-                posts = user.submissions.new(limit=limit)
-            
-            result = []
-            for post in posts:
-                try:
-                    post_data = {
-                        'id': post.id,
-                        'title': post.title,
-                        'author': str(post.author) if post.author else '[deleted]',
-                        'score': post.score,
-                        'url': post.url,
-                        'created_utc': post.created_utc,
-                        'num_comments': post.num_comments,
-                        'selftext': getattr(post, 'selftext', ''),
-                        'subreddit': post.subreddit.display_name,
-                    }
-                    result.append(post_data)
-                except Exception as post_error:
-                    logger.warning(f"Error processing user post: {post_error}")
-                    continue
-            
-            return {
-                'data': {
-                    'children': [{'data': post} for post in result],
-                    'after': None,
-                    'before': None,
-                }
-            }
+            return self._extract_listing(posts, self._USER_POST_FIELDS, "user post")
             
         except Exception as e:
             logger.error(f"Failed to get posts for user {username}: {e}")
             raise APIError(f"Failed to get user posts: {e}")
 
+    @single_flight
     @handle_rate_limit(max_retries=3, base_delay=1.0)
     def get_user_comments(self, username: str, sort: str = "new", 
                          limit: int = 25) -> Optional[Dict[str, Any]]:
@@ -458,45 +982,16 @@ class RedditOfficial(RedditAdapterProtocol):
         self._enforce_rate_limit()
         
         try:
-            user = self.reddit.redditor(username)
-            
-            if sort == "new":
-                comments = user.comments.new(limit=limit)
-            elif sort == "top":
-                comments = user.comments.top(limit=limit)
-            else:
-                comments = user.comments.new(limit=limit)
+            comments = self._user_comments_listing(username, sort, limit)
             
-            result = []
-            for comment in comments:
-                try:
-                    if hasattr(comment, 'body') and comment.body not in ['[deleted]', '[removed]']:
-                        comment_data = {
-                            'id': comment.id,
-                            'author': str(comment.author) if comment.author else '[deleted]',
-                            'body': comment.body,
-                            'score': comment.score,
-                            'created_utc': comment.created_utc,
-                            'subreddit': comment.subreddit.display_name,
-                            'link_id': comment.link_id,
-                        }
-                        result.append(comment_data)
-                except Exception as comment_error:
-                    logger.warning(f"Error processing user comment: {comment_error}")
-                    continue
-            
-            return {
-                'data': {
-                    'children': [{'data': comment} for comment in result],
-                    'after': None,
-                    'before': None,
-                }
-            }
+            return self._extract_listing(comments, self._USER_COMMENT_FIELDS, "user comment",
+                                         keep=_has_live_body)
             
         except Exception as e:
             logger.error(f"Failed to get comments for user {username}: {e}")
             raise APIError(f"Failed to get user comments: {e}")
 
+    @memoize(ttl=SUBREDDIT_INFO_TTL)
     @handle_rate_limit(max_retries=3, base_delay=1.0)
     def get_subreddit_info(self, subreddit: str) -> Optional[Dict[str, Any]]:
         """Get subreddit information and metadata using PRAW."""
@@ -508,67 +1003,47 @@ class RedditOfficial(RedditAdapterProtocol):
         
         try:
             sub = self.reddit.subreddit(subreddit)
+            sub._fetch()  # One request; every field below is read from the loaded data
+            data = vars(sub)
+            get = data.get
             
+            name = sub.display_name
             # Get subreddit info
             return {
-                'display_name': sub.display_name,
-                'title': getattr(sub, 'title', ''),
-                'description': getattr(sub, 'description', ''),
-                'subscribers': getattr(sub, 'subscribers', 0),
-                'active_user_count': getattr(sub, 'active_user_count', 0),
-                'created_utc': getattr(sub, 'created_utc', 0),
-                'over18': getattr(sub, 'over18', False),
-                'public_description': getattr(sub, 'public_description', ''),
-                'url': f"https://reddit.com/r/{sub.display_name}",
-                'icon_img': getattr(sub, 'icon_img', ''),
-                'header_img': getattr(sub, 'header_img', ''),
-                'lang': getattr(sub, 'lang', 'en'),
-                'subreddit_type': getattr(sub, 'subreddit_type', 'public'),
+                'display_name': name,
+                'title': get('title', ''),
+                'description': get('description', ''),
+                'subscribers': get('subscribers', 0),
+                'active_user_count': get('active_user_count', 0),
+                'created_utc': get('created_utc', 0),
+                'over18': get('over18', False),
+                'public_description': get('public_description', ''),
+                'url': _SUBREDDIT_URL + name,
+                'icon_img': get('icon_img', ''),
+                'header_img': get('header_img', ''),
+                'lang': get('lang', 'en'),
+                'subreddit_type': get('subreddit_type', 'public'),
             }
             
         except Exception as e:
             logger.error(f"Failed to get subreddit info for r/{subreddit}: {e}")
             raise APIError(f"Failed to get subreddit info: {e}")
 
+    @memoize(ttl=RESPONSE_TTL)
     @handle_rate_limit(max_retries=3, base_delay=1.0)
     def get_post_details(self, post_id: str) -> Optional[Dict[str, Any]]:
-        """Get detailed information about a specific post using PRAW."""
+        """Get detailed information about a specific post."""
         if not self.reddit:
             logger.warning("Not authenticated. Call authenticate() first.")
             return None
             
-        self._enforce_rate_limit()
-        
         try:
-            submission = self.reddit.submission(id=post_id)
-            
-            # Get detailed post information
-            post_data = {
-                'id': submission.id,
-                'title': submission.title,
-                'author': str(submission.author) if submission.author else '[deleted]',
-                'score': submission.score,
-                'upvote_ratio': getattr(submission, 'upvote_ratio', 0),
-                'url': submission.url,
-                'created_utc': submission.created_utc,
-                'num_comments': submission.num_comments,
-                'selftext': getattr(submission, 'selftext', ''),
-                'subreddit': submission.subreddit.display_name,
-                'permalink': f"https://reddit.com{submission.permalink}",
-                'is_self': submission.is_self,
-                'over_18': submission.over_18,
-                'spoiler': getattr(submission, 'spoiler', False),
-                'locked': getattr(submission, 'locked', False),
-                'archived': getattr(submission, 'archived', False),
-                'distinguished': getattr(submission, 'distinguished', None),
-                'stickied': getattr(submission, 'stickied', False),
-                'gilded': getattr(submission, 'gilded', 0),
-                'total_awards_received': getattr(submission, 'total_awards_received', 0),
-                'edited': getattr(submission, 'edited', False),
-                'domain': getattr(submission, 'domain', ''),
-                'thumbnail': getattr(submission, 'thumbnail', ''),
-                'preview': getattr(submission, 'preview', {}),
-            }
+            # /api/info returns just the post, where the submission page also sends its comments
+            post = next(self._info("t3", [post_id]), None)
+            if post is None:
+                logger.warning(f"Post {post_id} not found")
+                return None
+            post_data = _post_to_dict(post, _POST_DETAIL_DEFAULTS)
             
             # Return in Reddit JSON API format for compatibility
             return {
@@ -583,6 +1058,172 @@ class RedditOfficial(RedditAdapterProtocol):
             logger.error(f"Failed to get post details for {post_id}: {e}")
             raise APIError(f"Failed to get post details: {e}")
 
+    @handle_rate_limit(max_retries=3, base_delay=1.0)
+    def get_post_details_batch(self, post_ids: Iterable[str]) -> Optional[Dict[str, Optional[Dict[str, Any]]]]:
+        """Get details for many posts, ``INFO_BATCH_SIZE`` per request, keyed by post id.
+
+        Posts Reddit doesn't return (deleted, private, unknown ids) map to None.
+        """
+        if not self.reddit:
+            logger.warning("Not authenticated. Call authenticate() first.")
+            return None
+        
+        try:
+            details: Dict[str, Optional[Dict[str, Any]]] = dict.fromkeys(post_ids)
+            for post in self._info("t3", details):
+                details[post['id']] = _post_to_dict(post, _POST_DETAIL_DEFAULTS)
+            return details
+        except Exception as e:
+            logger.error(f"Failed to get post details batch: {e}")
+            raise APIError(f"Failed to get post details: {e}")
+
+    @handle_rate_limit(max_retries=3, base_delay=1.0)
+    def get_comments_batch(self, comment_ids: Iterable[str]) -> Optional[Dict[str, Optional[Dict[str, Any]]]]:
+        """Get individual comments, ``INFO_BATCH_SIZE`` per request, keyed by comment id.
+
+        Comments that are missing, deleted or removed map to None.
+        """
+        if not self.reddit:
+            logger.warning("Not authenticated. Call authenticate() first.")
+            return None
+        
+        try:
+            comments: Dict[str, Optional[Dict[str, Any]]] = dict.fromkeys(comment_ids)
+            for comment in self._info("t1", comments):
+                if comment.get('body') not in _DELETED_BODIES:
+                    comments[comment['id']] = self._comment_json_to_dict(comment)
+            return comments
+        except Exception as e:
+            logger.error(f"Failed to get comments batch: {e}")
+            raise APIError(f"Failed to get comments: {e}")
+
+    # ===============================
+    # PAGINATED ITERATORS
+    # ===============================
+
+    def _read_listing(self, listing: Iterable, description: str,
+                      convert: Callable[[Any], Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield post dicts from a lazy listing on the calling thread."""
+        try:
+            for post in listing:
+                try:
+                    yield {'data': convert(post)}
+                except Exception as post_error:
+                    logger.warning(f"Error processing post: {post_error}")
+        except Exception as e:
+            logger.error(f"Failed to iterate {description}: {e}")
+            raise APIError(f"Failed to iterate {description}: {e}")
+
+    def _iter_listing(self, listing: Iterable, description: str,
+                      convert: Optional[Callable[[Any], Dict[str, Any]]] = None,
+                      prefetch: bool = True) -> Iterator[Dict[str, Any]]:
+        """Yield post dicts from a lazy listing that paces its own page fetches (see _paced).
+
+        With ``prefetch``, pages are fetched one page ahead on a background thread, so the next
+        request is in flight while the caller is still processing the current page. The thread
+        stops when the iterator is closed or garbage collected, or once the caller has not taken
+        a post for ``PREFETCH_IDLE_TIMEOUT`` seconds; resuming after that raises APIError.
+        Pages follow an ``after`` cursor, so they can't be fetched in parallel; read-ahead only
+        pays off when the caller does work between posts, so callers that just collect a list,
+        or want a single page, pass ``prefetch=False`` and read on their own thread.
+        """
+        convert = convert or self._submission_to_dict
+        if not prefetch:
+            return self._read_listing(listing, description, convert)
+        posts: Queue = Queue(maxsize=self.PAGE_SIZE)  # Bounded to a single page of read-ahead
+        stop = Event()
+        finished = Event()
+        errors: List[BaseException] = []
+        done = object()
+        idle_timeout = self.PREFETCH_IDLE_TIMEOUT
+
+        def put(item: Any) -> bool:
+            deadline = time.monotonic() + idle_timeout
+            while not stop.is_set():
+                try:
+                    posts.put(item, timeout=0.5)
+                    return True
+                except Full:
+                    if time.monotonic() > deadline:
+                        errors.append(TimeoutError(f"no post taken for {idle_timeout:.0f}s, prefetch abandoned"))
+                        return False
+            return False  # Consumer went away
+
+        def produce() -> None:
+            try:
+                for post in listing:
+                    try:
+                        post_data = {'data': convert(post)}
+                    except Exception as post_error:
+                        logger.warning(f"Error processing post: {post_error}")
+                        continue
+                    if not put(post_data):
+                        return
+            except Exception as e:
+                errors.append(e)
+            else:
+                put(done)
+            finally:
+                finished.set()
+
+        def consume() -> Iterator[Dict[str, Any]]:
+            Thread(target=produce, daemon=True).start()
+            try:
+                while True:
+                    try:
+                        item = posts.get(timeout=0.5)
+                    except Empty:
+                        # The producer only sets finished after its last put, so empty now means drained
+                        if finished.is_set() and posts.empty():
+                            break
+                        continue
+                    if item is done:
+                        break
+                    yield item
+            finally:
+                stop.set()
+            if errors:
+                logger.error(f"Failed to iterate {description}: {errors[0]}")
+                raise APIError(f"Failed to iterate {description}: {errors[0]}")
+
+        iterator = consume()
+        # Dropped without close(): stop the producer when the iterator is collected
+        weakref.finalize(iterator, stop.set)
+        return iterator
+
+    def _spans_pages(self, limit: Optional[int]) -> bool:
+        """Whether a listing of ``limit`` posts takes more than one page request."""
+        return limit is None or limit > self.PAGE_SIZE
+
+    def iter_subreddit_posts(self, subreddit: str, sort: str = "hot",
+                             limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Lazily yield posts from a subreddit, fetching further pages on demand."""
+        if not self.reddit:
+            logger.warning("Not authenticated. Call authenticate() first.")
+            return iter(())
+        return self._iter_listing(self._subreddit_listing(subreddit, sort, limit), f"r/{subreddit}",
+                                  convert=self._json_to_dict, prefetch=self._spans_pages(limit))
+
+    def iter_search_posts(self, query: str, subreddit: Optional[str] = None,
+                          sort: str = "relevance", time_filter: str = "all",
+                          limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Lazily yield search results, fetching further pages on demand."""
+        if not self.reddit:
+            logger.warning("Not authenticated. Call authenticate() first.")
+            return iter(())
+        sub = self._subreddit(subreddit or "all")
+        listing = sub.search(query, sort=sort, time_filter=time_filter, limit=limit)
+        return self._iter_listing(self._paced(listing), f"search '{query}'", prefetch=self._spans_pages(limit))
+
+    def iter_user_posts(self, username: str, sort: str = "new",
+                        limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Lazily yield a user's submissions, fetching further pages on demand."""
+        if not self.reddit:
+            logger.warning("Not authenticated. Call authenticate() first.")
+            return iter(())
+        return self._iter_listing(self._paced(self._user_submissions_listing(username, sort, limit)),
+                                  f"u/{username}", prefetch=self._spans_pages(limit))
+
     def get_rate_limit_status(self) -> Dict[str, Any]:
         """Get current rate limit status information."""
         if not self.reddit:
@@ -590,12 +1231,15 @@ class RedditOfficial(RedditAdapterProtocol):
         
         try:
             # Get rate limit info from PRAW if available
+            limiter = self.reddit._core._rate_limiter
+            budget = self.rate_budget.get_status()
             rate_limit_info = {
-                'remaining_requests': getattr(self.reddit._core, 'remaining', None),
-                'reset_timestamp': getattr(self.reddit._core, 'reset_timestamp', None),
-                'used_requests': getattr(self.reddit._core, 'used', None),
-                'last_request_time': self._last_request_time,
+                'remaining_requests': limiter.remaining,
+                'reset_timestamp': time.time() + budget['reset_in'] if budget['remaining'] is not None else None,
+                'used_requests': limiter.used,
+                'last_request_time': self._last_request_wall_time(),
                 'request_delay': self.request_delay,
+                'effective_requests_per_minute': self._bucket.refill_rate * 60,
                 'max_retries': self.max_retries,
                 'base_delay': self.base_delay
             }
@@ -603,7 +1247,7 @@ class RedditOfficial(RedditAdapterProtocol):
         except Exception as e:
             logger.warning(f"Could not get rate limit status: {e}")
             return {
-                'last_request_time': self._last_request_time,
+                'last_request_time': self._last_request_wall_time(),
                 'request_delay': self.request_delay,
                 'max_retries': self.max_retries,
                 'base_delay': self.base_delay
@@ -624,34 +1268,49 @@ class RedditOfficial(RedditAdapterProtocol):
             self.request_delay = request_delay
             logger.info(f"Updated request_delay to {request_delay}s")
 
-    def wait_for_rate_limit_reset(self) -> bool:
-        """Wait for rate limit to reset if we know when it resets."""
+    def _rate_limit_reset_wait(self) -> float:
+        """Jittered seconds until the reported rate limit window resets, or 0 if unknown."""
         if not self.reddit:
-            return False
+            return 0.0
             
         try:
-            reset_timestamp = getattr(self.reddit._core, 'reset_timestamp', None)
-            if reset_timestamp:
-                current_time = time.time()
-                wait_time = reset_timestamp - current_time
-                
-                if wait_time > 0:
-                    # Add random jitter to reset wait time
-                    jitter = random.uniform(0.8, 1.3)
-                    actual_wait = (wait_time + 1) * jitter
-                    logger.info(f"Waiting {actual_wait:.1f}s for rate limit reset...")
-                    time.sleep(actual_wait)
-                    return True
-            return False
+            # Reset time as reported by the last response's X-Ratelimit-Reset header
+            wait_time = self.rate_budget.get_status()['reset_in']
+            if wait_time > 0:
+                # Add random jitter to reset wait time
+                jitter = self._rng.uniform(0.8, 1.3)
+                actual_wait = (wait_time + 1) * jitter
+                logger.info(f"Waiting {actual_wait:.1f}s for rate limit reset...")
+                return actual_wait
+            return 0.0
         except Exception as e:
             logger.warning(f"Could not wait for rate limit reset: {e}")
-            return False
+            return 0.0
+
+    def wait_for_rate_limit_reset(self) -> bool:
+        """Wait for rate limit to reset if we know when it resets."""
+        actual_wait = self._rate_limit_reset_wait()
+        if actual_wait > 0:
+            time.sleep(actual_wait)
+            return True
+        return False
+
+    async def wait_for_rate_limit_reset_async(self) -> bool:
+        """Like ``wait_for_rate_limit_reset``, but awaits so the event loop keeps running."""
+        actual_wait = self._rate_limit_reset_wait()
+        if actual_wait > 0:
+            await asyncio.sleep(actual_wait)
+            return True
+        return False
 
     def enable_stealth_mode(self):
         """Enable enhanced anti-bot detection measures."""
         self.use_random_delays = True
         self.burst_protection = True
         self.request_delay = max(self.request_delay, 1.0)  # Minimum 1 second between requests
+        self._pacer.capacity = 1  # No bursts: every request is spaced out
+        self._pacer.tokens = min(self._pacer.tokens, 1)
+        self.server_pacing = False  # Keep the fixed human-like spacing even when quota is plentiful
         self.max_requests_per_minute = min(self.max_requests_per_minute, 20)  # Max 20 requests per minute
         self.min_jitter = 0.5
         self.max_jitter = 2.0
@@ -662,6 +1321,8 @@ class RedditOfficial(RedditAdapterProtocol):
         self.use_random_delays = False
         self.burst_protection = False
         self.request_delay = 0.1
+        self._pacer.capacity = self.PACER_BURST
+        self.server_pacing = True
         self.max_requests_per_minute = 60
         self.min_jitter = 0.3
         self.max_jitter = 1.2
@@ -674,30 +1335,49 @@ class RedditOfficial(RedditAdapterProtocol):
             'random_delays_enabled': self.use_random_delays,
             'burst_protection_enabled': self.burst_protection,
             'request_delay': self.request_delay,
+            'server_pacing': self.server_pacing,
             'max_requests_per_minute': self.max_requests_per_minute,
             'jitter_range': f"{self.min_jitter}-{self.max_jitter}",
-            'recent_requests': len(self._request_times),
+            'burst_tokens_available': max(0, int(self._bucket.tokens)),
+            'inflight_requests': len(self._flight),
             'user_agent': self.user_agent
         }
 
+    def _reading_time(self) -> float:
+        """Seconds of simulated reading, or 0 when random delays are off."""
+        if not self.use_random_delays:
+            return 0.0
+        # Simulate reading time between 2-8 seconds
+        reading_time = self._rng.uniform(2.0, 8.0)
+        logger.debug(f"Simulating human reading time: {reading_time:.1f}s")
+        return reading_time
+
     def simulate_human_behavior(self):
         """Add a realistic pause to simulate human browsing behavior."""
-        if self.use_random_delays:
-            # Simulate reading time between 2-8 seconds
-            reading_time = random.uniform(2.0, 8.0)
-            logger.debug(f"Simulating human reading time: {reading_time:.1f}s")
+        reading_time = self._reading_time()
+        if reading_time:
             time.sleep(reading_time)
+
+    async def simulate_human_behavior_async(self) -> None:
+        """Like ``simulate_human_behavior``, but awaits so other tasks run during the pause."""
+        # Still yields to the loop when delays are off
+        await asyncio.sleep(self._reading_time())
     
     # ===============================
     # ADVANCED RESEARCH METHODS
     # ===============================
     
+    @memoize(ttl=300)
     @handle_rate_limit(max_retries=3, base_delay=1.0)
     def search_posts_by_timeframe(self, query: str, subreddit: Optional[str] = None,
                                  start_date: Optional[datetime] = None, 
                                  end_date: Optional[datetime] = None,
-                                 limit: int = 100) -> Optional[Dict[str, Any]]:
-        """Search for posts within a specific timeframe for temporal analysis."""
+                                 limit: int = 100, stream: bool = False) -> Optional[Dict[str, Any]]:
+        """Search for posts within a specific timeframe for temporal analysis.
+
+        With ``stream=True`` the ``children`` entry is a generator that converts posts as
+        they are consumed instead of a list; ``raw=True`` returns the result as JSON bytes.
+        """
         if not self.reddit:
             logger.warning("Not authenticated. Call authenticate() first.")
             return None
@@ -716,44 +1396,16 @@ class RedditOfficial(RedditAdapterProtocol):
             end_timestamp = end_date.timestamp()
             
             # Search for posts
-            if subreddit:
-                sub = self.reddit.subreddit(subreddit)
-                search_results = sub.search(query, sort="new", limit=limit)
-            else:
-                search_results = self.reddit.subreddit("all").search(query, sort="new", limit=limit)
-            
-            result = []
-            for post in search_results:
-                try:
-                    # Filter by timestamp
-                    if start_timestamp <= post.created_utc <= end_timestamp:
-                        post_data = {
-                            'id': post.id,
-                            'title': post.title,
-                            'author': str(post.author) if post.author else '[deleted]',
-                            'score': post.score,
-                            'upvote_ratio': getattr(post, 'upvote_ratio', 0),
-                            'url': post.url,
-                            'created_utc': post.created_utc,
-                            'created_date': datetime.fromtimestamp(post.created_utc).isoformat(),
-                            'num_comments': post.num_comments,
-                            'selftext': getattr(post, 'selftext', ''),
-                            'subreddit': post.subreddit.display_name,
-                            'permalink': f"https://reddit.com{post.permalink}",
-                            'is_self': post.is_self,
-                            'over_18': post.over_18,
-                            'domain': getattr(post, 'domain', ''),
-                        }
-                        result.append(post_data)
-                except Exception as post_error:
-                    logger.warning(f"Error processing temporal search result: {post_error}")
-                    continue
+            search_results = self._subreddit(subreddit or "all").search(query, sort="new", limit=limit)
             
-            logger.info(f"Found {len(result)} posts between {start_date.date()} and {end_date.date()}")
+            children = self._iter_timeframe(search_results, start_timestamp, end_timestamp)
+            if not stream:
+                children = list(children)
+                logger.info(f"Found {len(children)} posts between {start_date.date()} and {end_date.date()}")
             
             return {
                 'data': {
-                    'children': [{'data': post} for post in result],
+                    'children': children,
                     'timeframe': {
                         'start': start_date.isoformat(),
                         'end': end_date.isoformat(),
@@ -768,63 +1420,211 @@ class RedditOfficial(RedditAdapterProtocol):
             logger.error(f"Failed to search posts by timeframe: {e}")
             raise APIError(f"Failed to search by timeframe: {e}")
     
+    def _iter_timeframe(self, search_results: Iterable, start_timestamp: float,
+                        end_timestamp: float) -> Iterator[Dict[str, Any]]:
+        """Yield listing children for newest-first search results inside the timeframe."""
+        # No per-post try: the conversion only reads already-loaded data with defaults, so it can't fail
+        for post in search_results:
+            created = vars(post).get('created_utc', 0)
+            if created > end_timestamp:
+                continue
+            if created < start_timestamp:
+                break  # Sorted by new, so every remaining post is older still
+            # No per-post created_date: created_utc is there and consumers format it on demand
+            yield {'data': self._submission_to_dict(post)}
+    
+    @single_flight
     @handle_rate_limit(max_retries=3, base_delay=1.0)
     def collect_from_multiple_subreddits(self, subreddits: List[str], 
-                                        sort: str = "hot", limit_per_sub: int = 25) -> Dict[str, Any]:
-        """Collect posts from multiple subreddits for comparative analysis."""
+                                        sort: str = "hot", limit_per_sub: int = 25,
+                                        max_concurrent: int = 8) -> Dict[str, Any]:
+        """Collect posts from multiple subreddits for comparative analysis.
+
+        Fetches run on a pool of at most ``max_concurrent`` threads, so this is safe to call
+        from code that is itself running inside an event loop.
+        """
         if not self.reddit:
             logger.warning("Not authenticated. Call authenticate() first.")
             return {}
         
-        all_results = {}
-        total_posts = 0
-        
-        logger.info(f"Collecting from {len(subreddits)} subreddits: {subreddits}")
+        # Listing sorts can be served for many subreddits at once from r/a+b+c/{sort}
+        combined: Dict[str, List[Dict[str, Any]]] = {}
+        if sort in self._SUBREDDIT_SORTS and len(subreddits) > 1:
+            combined = self._collect_combined(subreddits, sort, limit_per_sub)
         
-        for i, subreddit in enumerate(subreddits):
+        def collect(subreddit: str) -> Dict[str, Any]:
+            posts = combined.get(subreddit)
+            if posts is not None:
+                return self._subreddit_entry(subreddit, posts)
             try:
-                logger.info(f"Collecting from r/{subreddit} ({i+1}/{len(subreddits)})")
-                
-                # Get posts from this subreddit
-                posts_data = self.get_subreddit_posts(subreddit, sort=sort, limit=limit_per_sub)
-                
-                if posts_data and posts_data.get('data', {}).get('children'):
-                    posts = posts_data['data']['children']
-                    all_results[subreddit] = {
-                        'posts': posts,
-                        'count': len(posts),
-                        'collected_at': datetime.now().isoformat()
-                    }
-                    total_posts += len(posts)
-                    logger.info(f"  ✅ Collected {len(posts)} posts from r/{subreddit}")
-                else:
-                    all_results[subreddit] = {'posts': [], 'count': 0, 'error': 'No posts found'}
-                    logger.warning(f"  ⚠️ No posts found in r/{subreddit}")
-                
-                # Human-like delay between subreddits
-                if i < len(subreddits) - 1:  # Don't wait after last subreddit
-                    self.simulate_human_behavior()
-                    
-            except Exception as e:
-                logger.error(f"Error collecting from r/{subreddit}: {e}")
-                all_results[subreddit] = {'posts': [], 'count': 0, 'error': str(e)}
-                continue
+                return self._fetch_subreddit_entry(subreddit, sort, limit_per_sub)
+            finally:
+                # Human-like pause per worker; the pool size, not serial sleeps, bounds throughput
+                if self.use_random_delays:
+                    time.sleep(self._rng.uniform(self.min_jitter, self.max_jitter))
         
+        logger.info(f"Collecting from {len(subreddits)} subreddits: {subreddits}")
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrent, len(subreddits)))) as executor:
+            results = list(executor.map(collect, subreddits))
+        return self._collection_summary(subreddits, results)
+
+    @staticmethod
+    def _subreddit_entry(subreddit: str, posts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Per-subreddit entry of a multi-subreddit collection."""
+        if not posts:
+            logger.warning(f"  ⚠️ No posts found in r/{subreddit}")
+            return {'posts': [], 'count': 0, 'error': 'No posts found'}
+        logger.info(f"  ✅ Collected {len(posts)} posts from r/{subreddit}")
+        return {'posts': posts, 'count': len(posts), 'collected_at': datetime.now().isoformat()}
+
+    def _fetch_subreddit_entry(self, subreddit: str, sort: str, limit_per_sub: int) -> Dict[str, Any]:
+        """Fetch one subreddit's posts as a collection entry; failures become an error entry."""
+        try:
+            posts_data = self.get_subreddit_posts(subreddit, sort=sort, limit=limit_per_sub)
+        except Exception as e:
+            logger.error(f"Error collecting from r/{subreddit}: {e}")
+            return {'posts': [], 'count': 0, 'error': str(e)}
+        return self._subreddit_entry(subreddit, (posts_data or {}).get('data', {}).get('children', []))
+
+    @staticmethod
+    def _collection_summary(subreddits: List[str], results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Assemble per-subreddit entries into the multi-subreddit collection result."""
+        total_posts = sum(result['count'] for result in results)
         logger.info(f"Multi-subreddit collection complete: {total_posts} total posts from {len(subreddits)} subreddits")
-        
         return {
-            'results': all_results,
+            'results': dict(zip(subreddits, results)),
             'summary': {
                 'total_subreddits': len(subreddits),
-                'successful_collections': len([r for r in all_results.values() if r['count'] > 0]),
+                'successful_collections': sum(1 for result in results if result['count'] > 0),
                 'total_posts': total_posts,
                 'collection_date': datetime.now().isoformat()
             }
         }
+
+    def _collect_combined(self, subreddits: List[str], sort: str,
+                          limit_per_sub: int) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch several subreddits through combined r/a+b+c listings and split the posts back out.
+
+        Only subreddits that received a full ``limit_per_sub`` posts are returned; the rest
+        (small or skewed-out subreddits, or groups Reddit rejected) are left for per-subreddit
+        fetches.
+        """
+        group_size = max(1, self.MAX_LISTING_SIZE // max(limit_per_sub, 1))
+        collected: Dict[str, List[Dict[str, Any]]] = {}
+        for start in range(0, len(subreddits), group_size):
+            group = subreddits[start:start + group_size]
+            if len(group) < 2:
+                continue
+            buckets: Dict[str, List[Dict[str, Any]]] = {subreddit.lower(): [] for subreddit in group}
+            try:
+                listing = self._subreddit_listing('+'.join(group), sort, limit_per_sub * len(group))
+                for child in self._iter_listing(listing, f"r/{'+'.join(group)}", convert=self._json_to_dict,
+                                                prefetch=False):
+                    bucket = buckets.get((child['data']['subreddit'] or '').lower())
+                    if bucket is not None and len(bucket) < limit_per_sub:
+                        bucket.append(child)
+            except APIError as e:
+                logger.warning(f"Combined listing failed, falling back to per-subreddit requests: {e}")
+                continue
+            for subreddit in group:
+                if len(buckets[subreddit.lower()]) >= limit_per_sub:
+                    collected[subreddit] = buckets[subreddit.lower()]
+        return collected
+
+    async def collect_from_multiple_subreddits_async(self, subreddits: List[str], sort: str = "hot",
+                                                     limit_per_sub: int = 25, max_concurrent: int = 8,
+                                                     semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, Any]:
+        """Collect from several subreddits concurrently, at most ``max_concurrent`` at a time.
+
+        PRAW is synchronous, so each fetch runs in the loop's default executor; pass a shared
+        ``semaphore`` to bound concurrency across several collections.
+        """
+        if not self.reddit:
+            logger.warning("Not authenticated. Call authenticate() first.")
+            return {}
+        
+        semaphore = semaphore or asyncio.Semaphore(max_concurrent)
+        loop = asyncio.get_running_loop()
+        
+        # Listing sorts can be served for many subreddits at once from r/a+b+c/{sort}
+        combined: Dict[str, List[Dict[str, Any]]] = {}
+        if sort in self._SUBREDDIT_SORTS and len(subreddits) > 1:
+            combined = await loop.run_in_executor(
+                None, self._collect_combined, subreddits, sort, limit_per_sub)
+        
+        async def collect(subreddit: str) -> Dict[str, Any]:
+            posts = combined.get(subreddit)
+            if posts is not None:
+                return self._subreddit_entry(subreddit, posts)
+            async with semaphore:
+                try:
+                    return await loop.run_in_executor(
+                        None, self._fetch_subreddit_entry, subreddit, sort, limit_per_sub)
+                finally:
+                    # Human-like pause per worker; the semaphore, not serial sleeps, bounds throughput
+                    if self.use_random_delays:
+                        await asyncio.sleep(self._rng.uniform(self.min_jitter, self.max_jitter))
+        
+        logger.info(f"Collecting from {len(subreddits)} subreddits: {subreddits}")
+        results = await asyncio.gather(*(collect(subreddit) for subreddit in subreddits))
+        return self._collection_summary(subreddits, results)
     
+    @staticmethod
+    def _thread_node(comment_obj, current_depth: int) -> Optional[Dict[str, Any]]:
+        """Build one node of a comment thread, or None if it is deleted or unreadable."""
+        try:
+            body = getattr(comment_obj, 'body', None)
+            if body is None or body in _DELETED_BODIES:
+                return None
+            
+            return {
+                'id': comment_obj.id,
+                'author': str(comment_obj.author) if comment_obj.author else '[deleted]',
+                'body': body,
+                'score': comment_obj.score,
+                'created_utc': comment_obj.created_utc,
+                'created_date': datetime.fromtimestamp(comment_obj.created_utc).isoformat(),
+                'depth': current_depth,
+                'parent_id': comment_obj.parent_id,
+                'permalink': _REDDIT_BASE + comment_obj.permalink,
+                'is_submitter': getattr(comment_obj, 'is_submitter', False),
+                'distinguished': getattr(comment_obj, 'distinguished', None),
+                'gilded': getattr(comment_obj, 'gilded', 0),
+                'controversiality': getattr(comment_obj, 'controversiality', 0),
+                'replies': []
+            }
+        except Exception as e:
+            logger.warning(f"Error processing comment in thread: {e}")
+            return None
+
+    @classmethod
+    def _walk_thread(cls, comment, max_depth: int) -> Optional[Dict[str, Any]]:
+        """Build the thread rooted at a loaded comment, down to ``max_depth`` levels of replies."""
+        # Breadth-first walk with an explicit queue: no recursion limit on deep threads.
+        # A node that is dropped (deleted, unreadable, too deep) takes its subtree with it.
+        thread_data = cls._thread_node(comment, 0)
+        queue = deque([(comment, thread_data, 0)] if thread_data else [])
+        while queue:
+            comment_obj, comment_data, current_depth = queue.popleft()
+            if current_depth >= max_depth:
+                continue
+            for reply in getattr(comment_obj, 'replies', None) or ():
+                if isinstance(reply, MoreComments):  # Unexpanded stubs below the top level
+                    continue
+                reply_data = cls._thread_node(reply, current_depth + 1)
+                if reply_data:
+                    comment_data['replies'].append(reply_data)
+                    queue.append((reply, reply_data, current_depth + 1))
+        return thread_data
+
     @handle_rate_limit(max_retries=3, base_delay=1.0)
-    def get_comment_thread(self, comment_id: str, max_depth: int = 5) -> Optional[Dict[str, Any]]:
-        """Get a complete comment thread for conversation analysis."""
+    def get_comment_thread(self, comment_id: str, max_depth: int = 5,
+                           max_more_comments: Optional[int] = 0) -> Optional[Dict[str, Any]]:
+        """Get a complete comment thread for conversation analysis.
+
+        ``max_more_comments`` caps how many "load more comments" stubs are expanded, each
+        costing another request; the default 0 drops them, ``None`` expands every one.
+        """
         if not self.reddit:
             logger.warning("Not authenticated. Call authenticate() first.")
             return None
@@ -833,50 +1633,10 @@ class RedditOfficial(RedditAdapterProtocol):
         
         try:
             comment = self.reddit.comment(id=comment_id)
-            comment.refresh()  # Load all replies
-            
-            def extract_comment_tree(comment_obj, current_depth=0):
-                """Recursively extract comment tree."""
-                if current_depth > max_depth:
-                    return None
-                
-                try:
-                    if not hasattr(comment_obj, 'body') or comment_obj.body in ['[deleted]', '[removed]']:
-                        return None
-                    
-                    comment_data = {
-                        'id': comment_obj.id,
-                        'author': str(comment_obj.author) if comment_obj.author else '[deleted]',
-                        'body': comment_obj.body,
-                        'score': comment_obj.score,
-                        'created_utc': comment_obj.created_utc,
-                        'created_date': datetime.fromtimestamp(comment_obj.created_utc).isoformat(),
-                        'depth': current_depth,
-                        'parent_id': comment_obj.parent_id,
-                        'permalink': f"https://reddit.com{comment_obj.permalink}",
-                        'is_submitter': getattr(comment_obj, 'is_submitter', False),
-                        'distinguished': getattr(comment_obj, 'distinguished', None),
-                        'gilded': getattr(comment_obj, 'gilded', 0),
-                        'controversiality': getattr(comment_obj, 'controversiality', 0),
-                        'replies': []
-                    }
-                    
-                    # Get replies recursively
-                    if hasattr(comment_obj, 'replies') and comment_obj.replies:
-                        for reply in comment_obj.replies:
-                            if hasattr(reply, 'body'):  # Skip MoreComments objects
-                                reply_data = extract_comment_tree(reply, current_depth + 1)
-                                if reply_data:
-                                    comment_data['replies'].append(reply_data)
-                    
-                    return comment_data
-                    
-                except Exception as e:
-                    logger.warning(f"Error processing comment in thread: {e}")
-                    return None
-            
-            thread_data = extract_comment_tree(comment)
+            comment.refresh()  # Load the replies Reddit returns inline
+            comment.replies.replace_more(limit=max_more_comments)
             
+            thread_data = self._walk_thread(comment, max_depth)
             if thread_data:
                 logger.info(f"Successfully extracted comment thread starting from {comment_id}")
                 return {
@@ -891,80 +1651,113 @@ class RedditOfficial(RedditAdapterProtocol):
             logger.error(f"Failed to get comment thread for {comment_id}: {e}")
             raise APIError(f"Failed to get comment thread: {e}")
     
+    @single_flight
     @handle_rate_limit(max_retries=3, base_delay=1.0)
-    def get_trending_topics(self, subreddit: str = "all", time_filter: str = "day") -> Optional[Dict[str, Any]]:
-        """Get trending topics and popular keywords for trend analysis."""
+    def get_comment_threads_bulk(self, comment_ids: List[str], max_depth: int = 5) -> Optional[Dict[str, Any]]:
+        """Get the comment threads rooted at many comments, keyed by comment id.
+
+        With ``max_depth=0`` only the root comments are needed and they are fetched in batches
+        of ``INFO_BATCH_SIZE`` per request. Reddit's info endpoint doesn't return replies, so deeper
+        threads still cost one request per root. Missing, deleted or failing roots map to None.
+        """
         if not self.reddit:
             logger.warning("Not authenticated. Call authenticate() first.")
             return None
         
-        self._enforce_rate_limit()
-        
+        threads: Dict[str, Optional[Dict[str, Any]]] = dict.fromkeys(comment_ids)
         try:
-            sub = self.reddit.subreddit(subreddit)
+            if max_depth <= 0:
+                ids = list(threads)
+                for start in range(0, len(ids), self.INFO_BATCH_SIZE):
+                    self._enforce_rate_limit()
+                    fullnames = [f"t1_{cid}" for cid in ids[start:start + self.INFO_BATCH_SIZE]]
+                    for comment in self.reddit.info(fullnames=fullnames):
+                        threads[comment.id] = self._thread_node(comment, 0)
+            else:
+                for comment_id in threads:
+                    self._enforce_rate_limit()
+                    try:
+                        comment = self.reddit.comment(id=comment_id)
+                        comment.refresh()
+                        comment.replies.replace_more(limit=0)
+                        threads[comment_id] = self._walk_thread(comment, max_depth)
+                    except prawcore.exceptions.TooManyRequests:
+                        raise  # Not this root's fault; handle_rate_limit retries the whole batch
+                    except (praw.exceptions.ClientException, prawcore.exceptions.PrawcoreException) as comment_error:
+                        # Deleted or missing roots surface as NotFound/Forbidden from prawcore
+                        logger.warning(f"Skipping comment thread {comment_id}: {comment_error}")
             
-            # Get top posts from the specified time period
+            logger.info(f"Extracted {sum(t is not None for t in threads.values())}/{len(threads)} comment threads")
+            return {
+                'threads': threads,
+                'max_depth': max_depth,
+                'extracted_at': datetime.now().isoformat()
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to get comment threads: {e}")
+            raise APIError(f"Failed to get comment threads: {e}")
+    
+    @memoize(ttl=300)
+    @handle_rate_limit(max_retries=3, base_delay=1.0)
+    def get_trending_topics(self, subreddit: str = "all", time_filter: str = "day") -> Optional[Dict[str, Any]]:
+        """Get trending topics and popular keywords for trend analysis.
+
+        Pass ``raw=True`` to get the result as JSON bytes instead.
+        """
+        if not self.reddit:
+            logger.warning("Not authenticated. Call authenticate() first.")
+            return None
+        
+        try:
+            # Get top posts from the specified time period, as raw listing JSON (paced per page)
             if time_filter == "hour":
-                posts = sub.top(time_filter="hour", limit=50)
+                posts = self._subreddit_listing(subreddit, "top", 50, time_filter="hour")
             elif time_filter == "day":
-                posts = sub.top(time_filter="day", limit=50)
+                posts = self._subreddit_listing(subreddit, "top", 50, time_filter="day")
             elif time_filter == "week":
-                posts = sub.top(time_filter="week", limit=100)
+                posts = self._subreddit_listing(subreddit, "top", 100, time_filter="week")
             else:
-                posts = sub.hot(limit=50)
+                posts = self._subreddit_listing(subreddit, "hot", 50)
             
             trending_data = {
                 'posts': [],
-                'keywords': {},
-                'subreddits': {},
-                'authors': {},
-                'domains': {}
+                'keywords': Counter(),
+                'subreddits': Counter(),
+                'authors': Counter(),
+                'domains': Counter()
             }
             
+            # Fields fall back to defaults when missing, so one bad post can't raise mid-loop;
+            # request failures propagate to the outer handler
             for post in posts:
-                try:
-                    post_data = {
-                        'id': post.id,
-                        'title': post.title,
-                        'score': post.score,
-                        'num_comments': post.num_comments,
-                        'created_utc': post.created_utc,
-                        'subreddit': post.subreddit.display_name,
-                        'author': str(post.author) if post.author else '[deleted]',
-                        'url': post.url,
-                        'domain': getattr(post, 'domain', ''),
-                        'upvote_ratio': getattr(post, 'upvote_ratio', 0)
-                    }
-                    trending_data['posts'].append(post_data)
-                    
-                    # Count trending elements
-                    subreddit_name = post.subreddit.display_name
-                    trending_data['subreddits'][subreddit_name] = trending_data['subreddits'].get(subreddit_name, 0) + 1
-                    
-                    author_name = str(post.author) if post.author else '[deleted]'
-                    if author_name != '[deleted]':
-                        trending_data['authors'][author_name] = trending_data['authors'].get(author_name, 0) + 1
-                    
-                    domain = getattr(post, 'domain', '')
-                    if domain:
-                        trending_data['domains'][domain] = trending_data['domains'].get(domain, 0) + 1
-                    
-                    # Simple keyword extraction from titles
-                    title_words = post.title.lower().split()
-                    for word in title_words:
-                        # Filter out common words and short words
-                        if len(word) > 3 and word not in ['this', 'that', 'with', 'from', 'they', 'have', 'been', 'were', 'said', 'what', 'when', 'where', 'will', 'there', 'their']:
-                            trending_data['keywords'][word] = trending_data['keywords'].get(word, 0) + 1
-                    
-                except Exception as post_error:
-                    logger.warning(f"Error processing trending post: {post_error}")
-                    continue
+                post_data = self._json_to_dict(post)
+                trending_data['posts'].append(post_data)
+                
+                # Count trending elements
+                if post_data['subreddit']:
+                    trending_data['subreddits'][post_data['subreddit']] += 1
+                
+                if post_data['author'] != '[deleted]':
+                    trending_data['authors'][post_data['author']] += 1
+                
+                if post_data['domain']:
+                    trending_data['domains'][post_data['domain']] += 1
+                
+                # Simple keyword extraction from titles, skipping common and short words
+                trending_data['keywords'].update(
+                    word for word in (post_data['title'] or '').lower().split()
+                    if len(word) >= _MIN_KEYWORD_LEN and word not in _STOPWORDS
+                )
             
             # Sort trending data by frequency
-            trending_data['top_keywords'] = dict(sorted(trending_data['keywords'].items(), key=lambda x: x[1], reverse=True)[:20])
-            trending_data['top_subreddits'] = dict(sorted(trending_data['subreddits'].items(), key=lambda x: x[1], reverse=True)[:10])
-            trending_data['top_authors'] = dict(sorted(trending_data['authors'].items(), key=lambda x: x[1], reverse=True)[:10])
-            trending_data['top_domains'] = dict(sorted(trending_data['domains'].items(), key=lambda x: x[1], reverse=True)[:10])
+            trending_data['top_keywords'] = dict(trending_data['keywords'].most_common(20))
+            trending_data['top_subreddits'] = dict(trending_data['subreddits'].most_common(10))
+            trending_data['top_authors'] = dict(trending_data['authors'].most_common(10))
+            trending_data['top_domains'] = dict(trending_data['domains'].most_common(10))
+            # Plain dicts, so the result survives the JSON round trip and can be memoized
+            for field in ('keywords', 'subreddits', 'authors', 'domains'):
+                trending_data[field] = dict(trending_data[field])
             
             logger.info(f"Analyzed {len(trending_data['posts'])} trending posts from r/{subreddit}")
             
@@ -987,6 +1780,7 @@ class RedditOfficial(RedditAdapterProtocol):
                 'authentication_mode': 'authenticated' if (self.prefer_authenticated and self.username) else 'read-only',
                 'anti_bot_protection': self.get_anti_bot_status(),
                 'rate_limiting': self.get_rate_limit_status(),
+                'http_cache': self.get_http_cache_stats(),
                 'session_start': datetime.now().isoformat(),
                 'user_agent': self.user_agent
             },
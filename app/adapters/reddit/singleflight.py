@@ -0,0 +1,91 @@
+# Request Coalescing
+# This module implements the "single-flight" pattern: concurrent callers asking for the same key
+# share one in-flight call instead of each issuing an identical request to Reddit.
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, Any, Hashable, Callable, Awaitable, Tuple
+
+class SingleFlight:
+    """Thread-based single-flight group; the first caller runs the call, the rest wait for it.
+
+    A call still running after ``stale_after`` seconds is presumed stuck: new callers for its
+    key start a fresh call instead of queueing behind it.
+    """
+
+    def __init__(self, stale_after: float = 300.0):
+        self.stale_after: float = stale_after
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, Tuple[Future, float]] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run ``fn`` once per key at a time and hand its result (or exception) to every caller."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._inflight.get(key)
+            leader = entry is None or now - entry[1] > self.stale_after
+            if leader:
+                future = Future()
+                self._inflight[key] = (future, now)
+            else:
+                future = entry[0]
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                # A stale call must not drop the fresh call that replaced it
+                if self._inflight.get(key, (None,))[0] is future:
+                    del self._inflight[key]
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+class AsyncSingleFlight:
+    """asyncio single-flight group; no lock is needed as the event loop is single-threaded.
+
+    The shared call runs as its own task, so cancelling one caller (such as an abandoned
+    prefetch) leaves it running for the others; it is cancelled once no caller is left.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[asyncio.Task, int] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``fn()`` once per key at a time and share the outcome with concurrent callers."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            # Shield so a cancelled caller doesn't cancel the shared call
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                if not task.done():
+                    # The last caller gave up; stop the call and let the next one start afresh
+                    task.cancel()
+                    self._forget(key, task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def __len__(self) -> int:
+        return len(self._inflight)
@@ -8,7 +8,6 @@ import os
 import sys
 import logging
 import argparse
-import json
 import csv
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List, Union
@@ -37,6 +36,7 @@ from adapters.reddit.reddit_official import RedditOfficial
 from adapters.reddit.factory import RedditAdapterFactory
 from adapters.reddit.config import RedditConfig
 from adapters.reddit.exceptions import AuthenticationError, APIError, RateLimitError
+from adapters.reddit.jsonutil import dumps_pretty
 
 class Platform(Enum):
     """Supported social media platforms."""
@@ -104,7 +104,12 @@ class EarthwormApp:
             user_agent=os.getenv('REDDIT_USER_AGENT', 'Earthworm Multi-Platform Data Collector 2.0'),
             timeout=int(os.getenv('REDDIT_TIMEOUT', '30')),
             max_retries=int(os.getenv('REDDIT_MAX_RETRIES', '3')),
-            rate_limit_delay=float(os.getenv('REDDIT_BASE_DELAY', '2.0'))
+            rate_limit_delay=float(os.getenv('REDDIT_BASE_DELAY', '2.0')),
+            cache_backend=os.getenv('REDDIT_CACHE_BACKEND') or None,
+            cache_url=os.getenv('REDDIT_CACHE_URL') or None,
+            http2=os.getenv('REDDIT_HTTP2', '').lower() in ('1', 'true', 'yes'),
+            http_cache=os.getenv('REDDIT_HTTP_CACHE') or None,
+            http_cache_ttl=float(os.getenv('REDDIT_HTTP_CACHE_TTL', '300'))
         )
     
     def initialize_platform(self, platform: Union[str, Platform], **kwargs) -> bool:
@@ -589,8 +594,8 @@ class EarthwormApp:
         
         if format.lower() == "json":
             filename = f"{base_name}.json"
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            with open(filename, 'wb') as f:
+                f.write(dumps_pretty(data))
         
         elif format.lower() == "csv":
             filename = f"{base_name}.csv"
@@ -738,8 +743,8 @@ class EarthwormApp:
         if not posts_df.empty:
             summary_data['Value'].append(f"{posts_df['score'].mean():.2f}")
             summary_data['Value'].append(f"{posts_df['num_comments'].mean():.2f}")
-            summary_data['Value'].append(posts_df['author'].value_counts().index[0] if not posts_df['author'].value_counts().empty else 'N/A')
-            summary_data['Value'].append(posts_df['subreddit'].value_counts().index[0] if not posts_df['subreddit'].value_counts().empty else 'N/A')
+            summary_data['Value'].append(self._most_frequent(posts_df['author']))
+            summary_data['Value'].append(self._most_frequent(posts_df['subreddit']))
             summary_data['Value'].append(f"{posts_df['text_length'].mean():.2f}")
             summary_data['Value'].append(posts_df[posts_df['post_hint'].isin(['image', 'rich:video'])].shape[0])
             summary_data['Value'].append(posts_df['over_18'].sum())
@@ -749,6 +754,12 @@ class EarthwormApp:
         
         return pd.DataFrame(summary_data)
     
+    @staticmethod
+    def _most_frequent(column: pd.Series) -> str:
+        """Most common value in a column, or 'N/A' if it has none."""
+        counts = column.value_counts(sort=False)  # idxmax is a linear scan; no need to sort every count
+        return counts.idxmax() if not counts.empty else 'N/A'
+    
     def analyze_data(self, data: dict) -> dict:
         """Perform statistical analysis on collected data."""
         posts_df = self._create_posts_dataframe(data.get('posts', []))
@@ -788,8 +799,8 @@ class EarthwormApp:
                     'nsfw_posts': int(posts_df['over_18'].sum()),
                     'gilded_posts': int(posts_df['gilded'].sum())
                 },
-                'top_authors': posts_df['author'].value_counts().head(5).to_dict(),
-                'top_subreddits': posts_df['subreddit'].value_counts().head(5).to_dict() if 'subreddit' in posts_df.columns else {}
+                'top_authors': posts_df['author'].value_counts(sort=False).nlargest(5).to_dict(),
+                'top_subreddits': posts_df['subreddit'].value_counts(sort=False).nlargest(5).to_dict() if 'subreddit' in posts_df.columns else {}
             }
             
             # Temporal analysis
@@ -832,7 +843,7 @@ class EarthwormApp:
                     'median': float(comments_df['comment_length'].median()),
                     'max': int(comments_df['comment_length'].max())
                 },
-                'top_commenters': comments_df['author'].value_counts().head(5).to_dict(),
+                'top_commenters': comments_df['author'].value_counts(sort=False).nlargest(5).to_dict(),
                 'comment_depth_distribution': comments_df['depth'].value_counts().to_dict()
             }
         
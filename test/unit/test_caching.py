@@ -0,0 +1,134 @@
+"""Tests for the cache backends and the CachingRedditAdapter wrapper."""
+
+import pytest
+
+from app.adapters.reddit import caching
+from app.adapters.reddit.caching import CachingRedditAdapter, InMemoryBackend
+
+@pytest.fixture(autouse=True)
+def fake_time(monkeypatch, clock):
+    monkeypatch.setattr(caching, 'time', clock)
+
+class FakeAdapter:
+    """Records lookups instead of calling Reddit."""
+
+    def __init__(self):
+        self.calls = []
+        self.users = {'alice': {'name': 'alice'}}
+        self.request_delay = 1.0
+
+    def get_user_info(self, username):
+        self.calls.append(('user', username))
+        return self.users.get(username)
+
+    def get_subreddit_posts(self, subreddit, sort='hot', limit=25):
+        self.calls.append(('posts', subreddit, sort, limit))
+        return {'data': {'children': [], 'after': None}}
+
+    def get_anti_bot_status(self):
+        return {'stealth_mode': False}
+
+class TestInMemoryBackend:
+    def test_entries_expire_after_ttl(self, clock):
+        backend = InMemoryBackend()
+        backend.setex('k', 10, b'v')
+        clock.advance(9)
+        assert backend.get('k') == b'v'
+        clock.advance(1)
+        assert backend.get('k') is None
+
+    def test_refreshed_entry_outlives_its_old_expiry(self, clock):
+        backend = InMemoryBackend()
+        backend.setex('k', 10, b'old')
+        clock.advance(5)
+        backend.setex('k', 10, b'new')
+        clock.advance(6)
+        assert backend.get('k') == b'new'
+
+    def test_least_recently_used_entry_is_evicted(self):
+        backend = InMemoryBackend(maxsize=2)
+        backend.setex('a', 60, b'1')
+        backend.setex('b', 60, b'2')
+        backend.get('a')
+        backend.setex('c', 60, b'3')
+        assert backend.get('b') is None
+        assert backend.get('a') == b'1'
+        assert backend.get('c') == b'3'
+
+    def test_delete_prefix(self):
+        backend = InMemoryBackend()
+        backend.setex('x:1', 60, b'1')
+        backend.setex('x:2', 60, b'2')
+        backend.setex('y:1', 60, b'3')
+        backend.delete_prefix('x:')
+        assert len(backend) == 1
+
+class TestCachingRedditAdapter:
+    def test_repeated_lookup_is_served_from_cache(self):
+        inner = FakeAdapter()
+        adapter = CachingRedditAdapter(inner)
+        assert adapter.get_user_info('alice') == {'name': 'alice'}
+        assert adapter.get_user_info('alice') == {'name': 'alice'}
+        assert inner.calls == [('user', 'alice')]
+        assert adapter.get_cache_stats()['hits'] == 1
+
+    def test_entry_expires_after_ttl(self, clock):
+        inner = FakeAdapter()
+        adapter = CachingRedditAdapter(inner, ttl_user=60)
+        adapter.get_user_info('alice')
+        clock.advance(61)
+        adapter.get_user_info('alice')
+        assert len(inner.calls) == 2
+
+    def test_missing_results_use_the_short_negative_ttl(self, clock):
+        inner = FakeAdapter()
+        adapter = CachingRedditAdapter(inner, ttl_negative=5)
+        assert adapter.get_user_info('ghost') is None
+        assert adapter.get_user_info('ghost') is None
+        assert len(inner.calls) == 1
+        clock.advance(6)
+        adapter.get_user_info('ghost')
+        assert len(inner.calls) == 2
+
+    def test_bypass_cache_refetches_and_stores_the_fresh_result(self):
+        inner = FakeAdapter()
+        adapter = CachingRedditAdapter(inner)
+        adapter.get_user_info('alice')
+        inner.users['alice'] = {'name': 'alice', 'karma': 1}
+        assert adapter.get_user_info('alice', bypass_cache=True) == {'name': 'alice', 'karma': 1}
+        assert adapter.get_user_info('alice') == {'name': 'alice', 'karma': 1}
+        assert len(inner.calls) == 2
+
+    def test_small_new_listings_are_never_cached(self):
+        inner = FakeAdapter()
+        adapter = CachingRedditAdapter(inner)
+        adapter.get_subreddit_posts('python', sort='new', limit=25)
+        adapter.get_subreddit_posts('python', sort='new', limit=25)
+        adapter.get_subreddit_posts('python', sort='new', limit=100)
+        adapter.get_subreddit_posts('python', sort='new', limit=100)
+        assert len(inner.calls) == 3
+
+    def test_unlimited_new_listing_is_cached(self):
+        inner = FakeAdapter()
+        adapter = CachingRedditAdapter(inner)
+        adapter.get_subreddit_posts('python', sort='new', limit=None)
+        adapter.get_subreddit_posts('python', sort='new', limit=None)
+        assert len(inner.calls) == 1
+
+    def test_invalidate_drops_one_call(self):
+        inner = FakeAdapter()
+        adapter = CachingRedditAdapter(inner)
+        adapter.get_user_info('alice')
+        adapter.invalidate('get_user_info', username='alice')
+        adapter.get_user_info('alice')
+        assert len(inner.calls) == 2
+
+    def test_attribute_reads_and_writes_reach_the_wrapped_adapter(self):
+        inner = FakeAdapter()
+        adapter = CachingRedditAdapter(inner)
+        adapter.request_delay = 2.5
+        adapter.ttl_user = 10
+        assert inner.request_delay == 2.5
+        assert adapter.request_delay == 2.5
+        assert adapter.ttl_user == 10 and not hasattr(inner, 'ttl_user')
+        assert adapter.get_anti_bot_status() == {'stealth_mode': False}
@@ -0,0 +1,51 @@
+"""Tests for the adapter factory's session wiring."""
+
+import pytest
+
+from app.adapters.reddit.config import RedditConfig
+from app.adapters.reddit.factory import REDDIT_HOSTS, SESSION_POOL_SIZE, RedditAdapterFactory
+
+def _config(**overrides) -> RedditConfig:
+    return RedditConfig(**{'client_id': 'id', 'client_secret': 'secret', 'user_agent': 'ua', **overrides})
+
+def test_official_adapter_without_http_cache():
+    adapter = RedditAdapterFactory.create_adapter('official', _config())
+    assert adapter.get_http_cache_stats() == {'enabled': False}
+
+def test_official_adapter_gets_the_configured_http_cache(tmp_path):
+    pytest.importorskip('requests_cache')
+    adapter = RedditAdapterFactory.create_adapter('official', _config(http_cache=str(tmp_path / 'http')))
+    assert adapter.get_http_cache_stats()['enabled']
+    # The cached session still carries the factory's pooled adapters
+    assert adapter._session.get_adapter('https://oauth.reddit.com')._pool_maxsize == SESSION_POOL_SIZE
+
+@pytest.fixture
+def fresh_client_caches(monkeypatch):
+    from collections import OrderedDict
+    from app.adapters.reddit import reddit_official
+    monkeypatch.setattr(reddit_official, '_REDDIT_INSTANCE_CACHE', OrderedDict())
+    monkeypatch.setattr(RedditAdapterFactory, '_OFFICIAL_SESSIONS', {})
+
+def _authenticated(config: RedditConfig):
+    adapter = RedditAdapterFactory.create_adapter('official', config)
+    adapter.use_random_delays = False
+    adapter.authenticate()
+    return adapter
+
+def test_official_adapters_from_equal_configs_share_one_client(fresh_client_caches):
+    first, second = _authenticated(_config()), _authenticated(_config())
+    assert second._session is first._session
+    assert second.reddit is first.reddit
+    assert second.rate_budget is first.rate_budget
+
+def test_official_adapters_with_other_credentials_get_their_own_client(fresh_client_caches):
+    first, other = _authenticated(_config()), _authenticated(_config(client_id='other'))
+    assert other._session is not first._session
+    assert other.reddit is not first.reddit
+
+def test_shared_session_leaves_retries_to_the_adapters():
+    session = RedditAdapterFactory.build_session(_config())
+    for host in REDDIT_HOSTS:
+        retries = session.get_adapter(host).max_retries
+        assert retries.total == 0
+        assert not retries.status_forcelist
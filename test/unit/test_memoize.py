@@ -0,0 +1,91 @@
+"""Tests for the official adapter's ``memoize`` decorator."""
+
+import pytest
+
+from app.adapters.reddit import caching
+from app.adapters.reddit.caching import InMemoryBackend
+from app.adapters.reddit.jsonutil import loads as json_loads
+from app.adapters.reddit.reddit_official import _fresh_listing, memoize
+from app.adapters.reddit.singleflight import SingleFlight
+
+@pytest.fixture(autouse=True)
+def fake_time(monkeypatch, clock):
+    monkeypatch.setattr(caching, 'time', clock)
+
+class FakeAdapter:
+    """Has just what ``memoize`` needs: a memo backend and a single-flight group."""
+
+    def __init__(self):
+        self._memo = InMemoryBackend()
+        self._flight = SingleFlight()
+        self.calls = 0
+
+    @memoize(ttl=30)
+    def lookup(self, name, limit=10, stream=False):
+        self.calls += 1
+        if stream:
+            return (item for item in range(3))
+        return {'name': name, 'limit': limit}
+
+    @memoize(ttl=30, skip=_fresh_listing)
+    def listing(self, subreddit, sort='hot', limit=25):
+        self.calls += 1
+        return {'subreddit': subreddit, 'sort': sort, 'limit': limit}
+
+def test_result_is_reused_within_ttl(clock):
+    adapter = FakeAdapter()
+    assert adapter.lookup('a') == adapter.lookup('a') == {'name': 'a', 'limit': 10}
+    assert adapter.calls == 1
+    clock.advance(31)
+    adapter.lookup('a')
+    assert adapter.calls == 2
+
+def test_positional_keyword_and_default_spellings_share_one_entry():
+    adapter = FakeAdapter()
+    adapter.lookup('a')
+    adapter.lookup('a', 10)
+    adapter.lookup(name='a', limit=10)
+    adapter.lookup('a', limit=10, stream=False)
+    assert adapter.calls == 1
+
+def test_different_arguments_get_different_entries():
+    adapter = FakeAdapter()
+    adapter.lookup('a')
+    adapter.lookup('a', limit=20)
+    adapter.lookup('b')
+    assert adapter.calls == 3
+
+@pytest.mark.parametrize('call', [
+    lambda adapter: adapter.lookup('a', 10, True),
+    lambda adapter: adapter.lookup('a', stream=True),
+])
+def test_stream_calls_bypass_the_cache(call):
+    adapter = FakeAdapter()
+    first, second = call(adapter), call(adapter)
+    assert list(first) == list(second) == [0, 1, 2]
+    assert adapter.calls == 2
+
+def test_raw_returns_json_bytes_on_miss_and_hit():
+    adapter = FakeAdapter()
+    miss = adapter.lookup('a', raw=True)
+    hit = adapter.lookup('a', raw=True)
+    assert isinstance(miss, bytes) and miss == hit
+    assert json_loads(hit) == adapter.lookup('a')
+    assert adapter.calls == 1
+
+def test_skip_predicate_leaves_small_new_listings_uncached():
+    adapter = FakeAdapter()
+    adapter.listing('python', sort='new')
+    adapter.listing('python', 'new', 25)
+    assert adapter.calls == 2
+    adapter.listing('python', sort='new', limit=100)
+    adapter.listing('python', sort='new', limit=100)
+    adapter.listing('python')
+    adapter.listing('python')
+    assert adapter.calls == 4
+
+def test_unlimited_new_listing_is_memoized():
+    adapter = FakeAdapter()
+    adapter.listing('python', sort='new', limit=None)
+    adapter.listing('python', sort='new', limit=None)
+    assert adapter.calls == 1
@@ -0,0 +1,124 @@
+"""Tests for the token bucket and the header-driven rate budget."""
+
+import math
+
+import pytest
+
+from app.adapters.reddit import rate
+from app.adapters.reddit.rate import RateBudget, TokenBucket
+
+@pytest.fixture(autouse=True)
+def fake_time(monkeypatch, clock):
+    monkeypatch.setattr(rate, 'time', clock)
+
+def _headers(remaining: str, reset: str) -> dict:
+    return {'X-Ratelimit-Remaining': remaining, 'X-Ratelimit-Reset': reset}
+
+class TestTokenBucket:
+    def test_bursts_within_capacity_do_not_wait(self):
+        bucket = TokenBucket(capacity=3, refill_rate=1.0)
+        assert [bucket.consume() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    def test_empty_bucket_queues_callers_behind_each_other(self):
+        bucket = TokenBucket(capacity=1, refill_rate=2.0)
+        bucket.consume()
+        assert bucket.consume() == pytest.approx(0.5)
+        assert bucket.consume() == pytest.approx(1.0)
+
+    def test_tokens_refill_over_time_up_to_capacity(self, clock):
+        bucket = TokenBucket(capacity=2, refill_rate=1.0)
+        bucket.consume()
+        bucket.consume()
+        clock.advance(10)
+        assert [bucket.consume() for _ in range(2)] == [0.0, 0.0]
+        assert bucket.consume() == pytest.approx(1.0)
+
+    def test_infinite_rate_never_waits(self):
+        bucket = TokenBucket(capacity=1, refill_rate=math.inf)
+        assert all(bucket.consume() == 0.0 for _ in range(10))
+
+    def test_acquire_sleeps_for_the_reservation(self, clock):
+        bucket = TokenBucket(capacity=1, refill_rate=4.0)
+        bucket.acquire()
+        bucket.acquire()
+        assert clock.slept == [pytest.approx(0.25)]
+
+    def test_penalize_halves_rate_down_to_floor(self):
+        bucket = TokenBucket(capacity=1, refill_rate=1.0)
+        bucket.penalize()
+        assert bucket.refill_rate == pytest.approx(0.5)
+        for _ in range(10):
+            bucket.penalize()
+        assert bucket.refill_rate == pytest.approx(0.125)
+        assert bucket.base_rate == 1.0
+
+    def test_recover_steps_back_to_base_rate_only(self):
+        bucket = TokenBucket(capacity=1, refill_rate=1.0)
+        bucket.penalize()
+        bucket.recover()
+        assert bucket.refill_rate == pytest.approx(0.55)
+        for _ in range(20):
+            bucket.recover()
+        assert bucket.refill_rate == pytest.approx(1.0)
+
+    def test_set_rate_drops_active_penalty(self):
+        bucket = TokenBucket(capacity=1, refill_rate=1.0)
+        bucket.penalize()
+        bucket.set_rate(2.0)
+        assert bucket.refill_rate == bucket.base_rate == 2.0
+
+    def test_penalize_ignores_unlimited_bucket(self):
+        bucket = TokenBucket(capacity=1, refill_rate=math.inf)
+        bucket.penalize()
+        assert math.isinf(bucket.refill_rate)
+
+class TestRateBudget:
+    def test_unknown_budget_never_waits(self):
+        assert RateBudget()._reserve() == 0.0
+
+    def test_reserve_spends_budget_then_waits_for_reset(self):
+        budget = RateBudget(min_remaining=1.0)
+        budget.update(_headers('3', '10'))
+        assert budget._reserve() == 0.0
+        assert budget._reserve() == 0.0
+        assert budget._reserve() == pytest.approx(10.0)
+
+    def test_window_reset_frees_the_budget(self, clock):
+        budget = RateBudget()
+        budget.update(_headers('1', '10'))
+        assert budget._reserve() > 0
+        clock.advance(10)
+        assert budget._reserve() == 0.0
+
+    def test_wait_sleeps_until_reset(self, clock):
+        budget = RateBudget()
+        budget.update(_headers('0', '7'))
+        budget.wait()
+        assert clock.slept == [pytest.approx(7.0)]
+
+    @pytest.mark.parametrize('headers', [{}, _headers('x', '10'), {'X-Ratelimit-Remaining': '5'}])
+    def test_incomplete_or_malformed_headers_are_ignored(self, headers):
+        budget = RateBudget()
+        budget.update(headers)
+        assert budget.remaining is None
+
+    def test_backoff_never_runs_past_known_reset(self):
+        budget = RateBudget()
+        budget.update(_headers('0', '3'))
+        assert budget.backoff_delay(attempt=4) == pytest.approx(3.0)
+
+    def test_backoff_uses_retry_after_once_window_is_over(self, clock):
+        budget = RateBudget()
+        budget.update(_headers('0', '3'))
+        clock.advance(5)
+        assert budget.backoff_delay(attempt=0, retry_after='12') == 12.0
+        assert budget.backoff_delay(attempt=0, retry_after='soon') == 1.0
+
+    def test_backoff_is_capped(self):
+        assert RateBudget(max_backoff=60.0).backoff_delay(attempt=10) == 60.0
+
+    def test_status_reports_time_to_reset(self, clock):
+        budget = RateBudget()
+        budget.update(_headers('42', '30'))
+        clock.advance(10)
+        assert budget.get_status() == {'remaining': 42.0, 'reset_in': pytest.approx(20.0)}
@@ -0,0 +1,28 @@
+"""Tests for RedditAsync with its request layer replaced (no network)."""
+
+import asyncio
+
+import pytest
+
+from app.adapters.reddit.exceptions import APIError, RateLimitError
+from app.adapters.reddit.reddit_async import RedditAsync
+
+class ScriptedAsync(RedditAsync):
+    """Raises the error queued for a path instead of calling Reddit."""
+    __slots__ = ('errors',)
+
+    async def _make_request(self, path, params=None):
+        raise self.errors[path]
+
+def test_rate_limit_reaches_the_caller():
+    adapter = ScriptedAsync()
+    adapter.errors = {'/r/python/hot': RateLimitError('slow down')}
+    with pytest.raises(RateLimitError):
+        asyncio.run(adapter.get_subreddit_posts('python'))
+
+def test_rate_limited_subreddit_is_reported_in_collection():
+    adapter = ScriptedAsync()
+    adapter.errors = {'/r/python/hot': RateLimitError('slow down'), '/r/rust/hot': APIError('boom')}
+    result = asyncio.run(adapter.collect_from_multiple_subreddits(['python', 'rust']))
+    assert result['results']['python']['error'] == 'slow down'
+    assert result['results']['rust']['error'] == 'No posts found'
@@ -0,0 +1,149 @@
+"""Tests for the RedditCommunity scraper against a scripted session (no network)."""
+
+import pytest
+
+from app.adapters.reddit import caching, rate, reddit_community
+from app.adapters.reddit.exceptions import RateLimitError
+from app.adapters.reddit.jsonutil import dumps as json_dumps
+from app.adapters.reddit.reddit_community import RedditCommunity
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=None, headers=None):
+        self.status_code = status_code
+        self.content = json_dumps(body if body is not None else {})
+        self.text = self.content.decode('utf-8')
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise reddit_community.requests.HTTPError(f"HTTP {self.status_code}")
+
+class FakeSession:
+    """Answers GETs from a queue of responses and records what was requested."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+        self.headers = {}
+        self.cookies = {}
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.requests.append((url, params, headers))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+@pytest.fixture(autouse=True)
+def fake_time(monkeypatch, clock):
+    for module in (rate, caching, reddit_community):
+        monkeypatch.setattr(module, 'time', clock)
+
+def _user(name: str) -> dict:
+    return {'kind': 't2', 'data': {'name': name}}
+
+def test_long_retry_after_raises_out_of_public_getter():
+    session = FakeSession(FakeResponse(429, headers={'Retry-After': '600'}))
+    adapter = RedditCommunity(session=session)
+    with pytest.raises(RateLimitError):
+        adapter.get_user_info('alice')
+    assert len(session.requests) == 1
+
+def test_short_retry_after_is_waited_out(clock):
+    session = FakeSession(FakeResponse(429, headers={'Retry-After': '2'}), FakeResponse(body=_user('alice')))
+    adapter = RedditCommunity(session=session)
+    assert adapter.get_user_info('alice') == {'name': 'alice'}
+    assert any(2.0 <= slept <= 2.5 for slept in clock.slept)
+
+def test_other_api_errors_still_return_none():
+    session = FakeSession(*[FakeResponse(500)] * 4)
+    adapter = RedditCommunity(session=session)
+    adapter.max_retries = 0
+    assert adapter.get_subreddit_posts('python') is None
+
+def _listing(*ids: str) -> dict:
+    return {'kind': 'Listing', 'data': {'children': [{'data': {'id': i}} for i in ids], 'after': None}}
+
+def test_small_new_listings_are_not_cached():
+    session = FakeSession(*[FakeResponse(body=_listing('a'))] * 3)
+    adapter = RedditCommunity(session=session)
+    adapter.get_subreddit_posts('python', sort='new')
+    adapter.get_subreddit_posts('python', sort='new')
+    adapter.get_subreddit_posts('python', sort='new', limit=100)
+    adapter.get_subreddit_posts('python', sort='new', limit=100)
+    assert len(session.requests) == 3
+
+def test_stale_entry_is_served_when_refetch_fails(clock):
+    down = reddit_community.requests.ConnectionError('down')
+    session = FakeSession(FakeResponse(body=_user('alice')), down, down)
+    adapter = RedditCommunity(session=session)
+    adapter.max_retries = 0
+    assert adapter.get_user_info('alice') == {'name': 'alice'}
+    clock.advance(601)
+    assert adapter.get_user_info('alice') == {'name': 'alice'}
+    clock.advance(adapter.STALE_IF_ERROR)
+    assert adapter.get_user_info('alice') is None
+    assert len(session.requests) == 3
+
+def test_stale_entry_is_revalidated_with_its_etag(clock):
+    session = FakeSession(FakeResponse(body=_user('alice'), headers={'ETag': '"v1"'}),
+                          FakeResponse(304, headers={'ETag': '"v1"'}))
+    adapter = RedditCommunity(session=session)
+    assert adapter.get_user_info('alice') == {'name': 'alice'}
+    clock.advance(601)
+    assert adapter.get_user_info('alice') == {'name': 'alice'}
+    assert session.requests[1][2]['If-None-Match'] == '"v1"'
+    # The 304 renewed the entry, so it is fresh again
+    assert adapter.get_user_info('alice') == {'name': 'alice'}
+    assert len(session.requests) == 2
+
+class ScriptedSearch(RedditCommunity):
+    """Search results and comments come from canned data instead of the session."""
+    __slots__ = ()
+    fail_on = {}
+
+    def search_posts(self, query, subreddit=None, sort='relevance', time_filter='all', limit=25):
+        return {'data': {'children': [{'data': {'id': f'p{i}', 'title': f't{i}', 'num_comments': 1}}
+                                      for i in range(limit)]}}
+
+    def get_comments(self, post_id, limit=100):
+        if post_id in self.fail_on:
+            raise self.fail_on[post_id]
+        return [{'id': f'c-{post_id}'}]
+
+@pytest.fixture
+def producer_threads(monkeypatch):
+    started = []
+
+    class RecordingThread(reddit_community.Thread):
+        def start(self):
+            started.append(self)
+            super().start()
+
+    monkeypatch.setattr(reddit_community, 'Thread', RecordingThread)
+    return started
+
+def test_search_and_extract_pairs_posts_with_their_comments(producer_threads):
+    adapter = ScriptedSearch(session=FakeSession())
+    results = adapter.search_and_extract('q', limit=6, include_comments=True)
+    assert [post['comments'] for post in results] == [[{'id': f'c-p{i}'}] for i in range(6)]
+    assert not producer_threads[0].is_alive()
+
+def test_search_and_extract_raises_a_late_producer_failure(monkeypatch, producer_threads):
+    adapter = ScriptedSearch(session=FakeSession())
+    monkeypatch.setattr(ScriptedSearch, 'fail_on', {'p5': RateLimitError('slow down')})
+    with pytest.raises(RateLimitError):
+        adapter.search_and_extract('q', limit=6, include_comments=True)
+    assert not producer_threads[0].is_alive()
+
+def test_search_and_extract_stops_the_producer_when_cleaning_fails(monkeypatch, producer_threads):
+    adapter = ScriptedSearch(session=FakeSession())
+
+    def explode(post_data):
+        raise ValueError('bad post')
+
+    monkeypatch.setattr(ScriptedSearch, '_extract_clean_post_data', staticmethod(explode))
+    with pytest.raises(ValueError):
+        adapter.search_and_extract('q', limit=50, include_comments=True)
+    producer_threads[0].join(timeout=5)
+    assert not producer_threads[0].is_alive()
@@ -0,0 +1,248 @@
+"""Tests for RedditOfficial against a scripted PRAW client (no network)."""
+
+import pytest
+
+from app.adapters.reddit import caching, rate, reddit_official
+from app.adapters.reddit.reddit_official import RedditOfficial
+
+class FakeReddit:
+    """Stands in for praw.Reddit; answers listing requests from canned posts."""
+
+    def __init__(self, posts):
+        self.posts = posts
+        self.requests = []
+        self.log = []
+
+    def request(self, method, path, params=None):
+        self.requests.append((path, dict(params or {})))
+        self.log.append('request')
+        start = int((params or {}).get('after') or 0)
+        page = self.posts[start:start + params['limit']]
+        after = str(start + len(page)) if start + len(page) < len(self.posts) else None
+        return {'data': {'children': [{'data': post} for post in page], 'after': after}}
+
+def _post(index: int, subreddit: str = 'python') -> dict:
+    return {'id': f'p{index}', 'title': f'Python release number{index}', 'author': f'user{index % 3}',
+            'subreddit': subreddit, 'domain': 'self.python', 'permalink': f'/r/{subreddit}/p{index}'}
+
+@pytest.fixture(autouse=True)
+def fake_time(monkeypatch, clock):
+    for module in (rate, caching, reddit_official):
+        monkeypatch.setattr(module, 'time', clock)
+
+class PagedOfficial(RedditOfficial):
+    """Small pages, and pacing recorded in the fake client's log instead of sleeping."""
+    __slots__ = ()
+    PAGE_SIZE = 2
+
+    def _enforce_rate_limit(self):
+        self.reddit.log.append('pace')
+
+@pytest.fixture
+def make_official():
+    def make(posts=(), cls=RedditOfficial):
+        adapter = cls(client_id='id', client_secret='secret')
+        adapter.use_random_delays = False
+        adapter.reddit = FakeReddit(list(posts))
+        return adapter
+    return make
+
+def test_trending_topics_are_served_from_cache(make_official):
+    adapter = make_official([_post(i) for i in range(5)])
+    first = adapter.get_trending_topics('python')
+    second = adapter.get_trending_topics('python')
+    assert len(adapter.reddit.requests) == 1
+    assert second == first
+    assert first['data']['subreddits'] == {'python': 5}
+    assert first['data']['top_keywords']['python'] == 5
+    assert adapter.get_trending_topics('python', raw=True) == reddit_official.json_dumps(first)
+    assert len(adapter.reddit.requests) == 1
+
+def test_unlimited_new_listing_reads_the_whole_listing(make_official):
+    adapter = make_official([_post(i) for i in range(3)])
+    result = adapter.get_subreddit_posts('python', sort='new', limit=None)
+    assert [child['data']['id'] for child in result['data']['children']] == ['p0', 'p1', 'p2']
+
+def test_subreddit_listing_follows_the_after_cursor(make_official):
+    adapter = make_official([_post(i) for i in range(5)], cls=PagedOfficial)
+    ids = [post['data']['id'] for post in adapter.iter_subreddit_posts('python', limit=4)]
+    assert ids == ['p0', 'p1', 'p2', 'p3']
+    assert [params.get('after') for _, params in adapter.reddit.requests] == [None, '2']
+
+def test_subreddit_listing_stops_on_the_last_page(make_official):
+    adapter = make_official([_post(i) for i in range(3)], cls=PagedOfficial)
+    assert len(list(adapter.iter_subreddit_posts('python'))) == 3
+    assert len(adapter.reddit.requests) == 2
+
+def test_every_page_request_is_paced_first(make_official):
+    adapter = make_official([_post(i) for i in range(5)], cls=PagedOfficial)
+    adapter.get_subreddit_posts('python', limit=5)
+    assert adapter.reddit.log == ['pace', 'request'] * 3
+
+def test_praw_listings_are_paced_before_each_page_fetch(make_official):
+    adapter = make_official(cls=PagedOfficial)
+    log = adapter.reddit.log
+
+    def listing():
+        for page in range(2):
+            log.append('request')
+            yield from ({'id': f'p{page}{i}'} for i in range(2))
+
+    assert len(list(adapter._paced(listing()))) == 4
+    assert log.count('request') == 2
+    assert all(log[i - 1] == 'pace' for i, entry in enumerate(log) if entry == 'request')
+
+@pytest.fixture
+def threads(monkeypatch):
+    """Records the prefetch threads _iter_listing starts."""
+    started = []
+
+    class RecordingThread(reddit_official.Thread):
+        def start(self):
+            started.append(self)
+            super().start()
+
+    monkeypatch.setattr(reddit_official, 'Thread', RecordingThread)
+    return started
+
+def test_collected_listings_are_read_without_a_prefetch_thread(make_official, threads):
+    adapter = make_official([_post(i) for i in range(5)], cls=PagedOfficial)
+    assert len(adapter.get_subreddit_posts('python', limit=5)['data']['children']) == 5
+    assert len(list(adapter.iter_subreddit_posts('python', limit=2))) == 2
+    assert threads == []
+
+def test_multi_page_iteration_reads_ahead_on_a_thread(make_official, threads):
+    adapter = make_official([_post(i) for i in range(5)], cls=PagedOfficial)
+    assert len(list(adapter.iter_subreddit_posts('python'))) == 5
+    assert len(threads) == 1
+
+def test_closing_the_iterator_stops_the_prefetch_thread(make_official, threads):
+    adapter = make_official([_post(i) for i in range(50)], cls=PagedOfficial)
+    posts = adapter.iter_subreddit_posts('python')
+    next(posts)
+    posts.close()
+    threads[0].join(timeout=5)
+    assert not threads[0].is_alive()
+    assert len(adapter.reddit.requests) < 25
+
+def test_dropping_the_iterator_stops_the_prefetch_thread(make_official, threads):
+    adapter = make_official([_post(i) for i in range(50)], cls=PagedOfficial)
+    posts = adapter.iter_subreddit_posts('python')
+    next(posts)
+    del posts
+    threads[0].join(timeout=5)
+    assert not threads[0].is_alive()
+
+def test_listing_errors_are_raised_on_the_consuming_thread(make_official):
+    adapter = make_official([_post(i) for i in range(5)], cls=PagedOfficial)
+    adapter.reddit.posts = None  # The first page request blows up
+    with pytest.raises(reddit_official.APIError):
+        list(adapter.iter_subreddit_posts('python'))
+
+def test_abandoned_prefetch_gives_up_and_raises(make_official, threads, clock):
+    adapter = make_official([_post(i) for i in range(50)], cls=PagedOfficial)
+    posts = adapter.iter_subreddit_posts('python')
+    next(posts)
+    for _ in range(50):  # Until the producer is blocked on a full queue and sees its deadline pass
+        clock.advance(adapter.PREFETCH_IDLE_TIMEOUT + 1)
+        threads[0].join(timeout=0.1)
+    assert not threads[0].is_alive()
+    with pytest.raises(reddit_official.APIError, match='prefetch abandoned'):
+        list(posts)
+
+class FakeComment:
+    def __init__(self, comment_id, error=None):
+        self.id = comment_id
+        self.error = error
+        self.replies = self
+
+    def refresh(self):
+        if self.error is not None:
+            raise self.error
+
+    def replace_more(self, limit=None):
+        return []
+
+class ThreadOfficial(RedditOfficial):
+    __slots__ = ()
+
+    def _walk_thread(self, comment, max_depth):
+        return {'id': comment.id}
+
+def _prawcore_error(cls, status):
+    return cls(type('Response', (), {'status_code': status, 'headers': {}})())
+
+def test_bulk_threads_skip_missing_and_forbidden_roots(make_official):
+    adapter = make_official(cls=ThreadOfficial)
+    errors = {'gone': _prawcore_error(reddit_official.prawcore.exceptions.NotFound, 404),
+              'private': _prawcore_error(reddit_official.prawcore.exceptions.Forbidden, 403)}
+    adapter.reddit.comment = lambda id: FakeComment(id, errors.get(id))
+    result = adapter.get_comment_threads_bulk(['gone', 'ok', 'private'])
+    assert result['threads'] == {'gone': None, 'ok': {'id': 'ok'}, 'private': None}
+
+class FixedRng:
+    def __init__(self, value):
+        self.value = value
+
+    def random(self):
+        return self.value
+
+class Flaky:
+    """Stands in for an adapter: fails with the scripted errors, then answers."""
+
+    def __init__(self, *errors, rng=None, bucket=None):
+        self.errors = list(errors)
+        self._rng = rng or FixedRng(1.0)
+        self._bucket = bucket
+        self.calls = 0
+
+    def fetch(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return 'ok'
+
+def _ratelimited(message='you are doing that too much'):
+    return reddit_official.praw.exceptions.RedditAPIException([['RATELIMIT', message, 'ratelimit']])
+
+def test_rate_limit_backoff_is_capped(clock):
+    fetch = reddit_official.handle_rate_limit(max_retries=3, base_delay=50.0)(Flaky.fetch)
+    assert fetch(Flaky(*[RuntimeError('429 Too Many Requests')] * 3)) == 'ok'
+    assert clock.slept == [reddit_official._MAX_BACKOFF] * 3
+
+def test_requested_ratelimit_wait_is_honoured_past_the_cap(clock):
+    fetch = reddit_official.handle_rate_limit(max_retries=1)(Flaky.fetch)
+    assert fetch(Flaky(_ratelimited('Take a break for 2 minutes before trying again.'))) == 'ok'
+    assert clock.slept == [120.5]
+
+def test_exhausted_rate_limit_retries_raise(clock):
+    fetch = reddit_official.handle_rate_limit(max_retries=2)(Flaky.fetch)
+    caller = Flaky(*[_ratelimited()] * 3)
+    with pytest.raises(reddit_official.RateLimitError):
+        fetch(caller)
+    assert caller.calls == 3
+
+def test_no_attempt_raises_instead_of_returning_none():
+    fetch = reddit_official.handle_rate_limit(max_retries=-1)(Flaky.fetch)
+    with pytest.raises(reddit_official.RateLimitError):
+        fetch(Flaky())
+
+def test_other_errors_are_not_retried(clock):
+    fetch = reddit_official.handle_rate_limit()(Flaky.fetch)
+    with pytest.raises(ValueError):
+        fetch(Flaky(ValueError('bad input')))
+    assert clock.slept == []
+
+def test_rate_limit_waits_are_decorrelated(clock):
+    fetch = reddit_official.handle_rate_limit(max_retries=3, base_delay=1.0)(Flaky.fetch)
+    fetch(Flaky(*[_ratelimited()] * 3))
+    assert clock.slept == [3.0, 9.0, 27.0]
+    fetch(Flaky(*[_ratelimited()] * 3, rng=FixedRng(0.0)))
+    assert clock.slept[3:] == [1.0, 1.0, 1.0]
+
+def test_rate_limits_slow_the_bucket_and_success_recovers_it(clock):
+    bucket = rate.TokenBucket(capacity=1, refill_rate=1.0)
+    fetch = reddit_official.handle_rate_limit(max_retries=2)(Flaky.fetch)
+    fetch(Flaky(*[_ratelimited()] * 2, bucket=bucket))
+    # Halved twice, then one additive step back up after the success
+    assert bucket.refill_rate == pytest.approx(0.25 + 0.05)
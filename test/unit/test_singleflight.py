@@ -0,0 +1,179 @@
+"""Tests for request coalescing (SingleFlight / AsyncSingleFlight)."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.adapters.reddit import singleflight
+from app.adapters.reddit.singleflight import AsyncSingleFlight, SingleFlight
+
+def _run_in_thread(fn):
+    outcome = {}
+
+    def target():
+        try:
+            outcome['result'] = fn()
+        except BaseException as e:
+            outcome['error'] = e
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    return thread, outcome
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return 'value'
+
+        leader, leader_outcome = _run_in_thread(lambda: flight.do('key', fetch))
+        started.wait(5)
+        followers = [_run_in_thread(lambda: flight.do('key', fetch)) for _ in range(3)]
+        time.sleep(0.1)  # Let the followers queue up behind the leader
+        release.set()
+        for thread, _ in [(leader, leader_outcome)] + followers:
+            thread.join(5)
+
+        assert len(calls) == 1
+        assert [outcome['result'] for _, outcome in followers] == ['value'] * 3
+        assert leader_outcome['result'] == 'value'
+        assert len(flight) == 0
+
+    def test_errors_reach_every_caller_and_clear_the_key(self):
+        flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+
+        def fetch():
+            started.set()
+            release.wait(5)
+            raise ValueError('boom')
+
+        leader, leader_outcome = _run_in_thread(lambda: flight.do('key', fetch))
+        started.wait(5)
+        follower, follower_outcome = _run_in_thread(lambda: flight.do('key', fetch))
+        time.sleep(0.1)
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        assert isinstance(leader_outcome['error'], ValueError)
+        assert follower_outcome['error'] is leader_outcome['error']
+        assert len(flight) == 0
+        assert flight.do('key', lambda: 'retried') == 'retried'
+
+    def test_different_keys_do_not_coalesce(self):
+        flight = SingleFlight()
+        assert flight.do('a', lambda: 1) == 1
+        assert flight.do('b', lambda: 2) == 2
+
+    def test_stale_call_is_bypassed_and_does_not_drop_its_replacement(self, monkeypatch, clock):
+        monkeypatch.setattr(singleflight, 'time', clock)
+        flight = SingleFlight(stale_after=10.0)
+        old_started, old_release = threading.Event(), threading.Event()
+        new_started, new_release = threading.Event(), threading.Event()
+
+        def stuck():
+            old_started.set()
+            old_release.wait(5)
+            return 'old'
+
+        def fresh():
+            new_started.set()
+            new_release.wait(5)
+            return 'new'
+
+        old, old_outcome = _run_in_thread(lambda: flight.do('key', stuck))
+        old_started.wait(5)
+        clock.advance(11)
+        new, new_outcome = _run_in_thread(lambda: flight.do('key', fresh))
+        new_started.wait(5)
+
+        old_release.set()
+        old.join(5)
+        assert old_outcome['result'] == 'old'
+        assert len(flight) == 1  # The fresh call is still registered
+
+        new_release.set()
+        new.join(5)
+        assert new_outcome['result'] == 'new'
+        assert len(flight) == 0
+
+class TestAsyncSingleFlight:
+    def test_concurrent_coroutines_share_one_call(self):
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 'value'
+
+        async def main():
+            return await asyncio.gather(*(flight.do('key', fetch) for _ in range(5)))
+
+        assert asyncio.run(main()) == ['value'] * 5
+        assert len(calls) == 1
+
+    def test_errors_reach_every_coroutine(self):
+        flight = AsyncSingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError('boom')
+
+        async def main():
+            return await asyncio.gather(*(flight.do('key', fetch) for _ in range(3)),
+                                        return_exceptions=True)
+
+        results = asyncio.run(main())
+        assert all(isinstance(result, ValueError) for result in results)
+
+    def test_cancelling_one_caller_leaves_the_call_running_for_the_rest(self):
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return 'value'
+
+        async def main():
+            leader = asyncio.ensure_future(flight.do('key', fetch))
+            follower = asyncio.ensure_future(flight.do('key', fetch))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await follower
+
+        assert asyncio.run(main()) == 'value'
+        assert len(calls) == 1
+        assert len(flight) == 0
+
+    def test_call_is_cancelled_once_every_caller_gives_up(self):
+        flight = AsyncSingleFlight()
+        finished = []
+
+        async def fetch():
+            await asyncio.sleep(5)
+            finished.append(1)
+
+        async def main():
+            callers = [asyncio.ensure_future(flight.do('key', fetch)) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            for caller in callers:
+                caller.cancel()
+            await asyncio.gather(*callers, return_exceptions=True)
+            assert len(flight) == 0
+            return await flight.do('key', lambda: asyncio.sleep(0, 'again'))
+
+        assert asyncio.run(main()) == 'again'
+        assert finished == []